@@ -1,5 +1,7 @@
 import json
 import sys
+from collections.abc import Iterator
+from io import StringIO
 from pathlib import Path
 
 import typer
@@ -10,9 +12,15 @@ from rhoknp.cli.cat import print_document
 from rhoknp.cli.serve import AnalyzerType, serve_analyzer
 from rhoknp.cli.show import draw_tree
 from rhoknp.cli.stats import get_document_statistics
+from rhoknp.utils.reader import chunk_by_document, load_documents
 
 app = typer.Typer(help="rhoknp CLI utilities.")
 
+WORKERS_OPTION = typer.Option(
+    1, "--workers", help="Number of processes to parse documents with. If more than 1, the file is split by document."
+)
+CHUNKSIZE_OPTION = typer.Option(1, "--chunksize", help="Number of documents sent to a process at once.")
+
 
 def version_callback(value: bool) -> None:
     """バージョンを表示．
@@ -25,6 +33,20 @@ def version_callback(value: bool) -> None:
         raise typer.Exit
 
 
+def _read_documents(knp_text: str, workers: int, chunksize: int) -> Iterator[Document]:
+    """KNP 形式の文字列から文書を読み込む．
+
+    Args:
+        knp_text: KNP 形式の文字列．
+        workers: 文書を読み込むプロセス数．2 以上の場合は文書ごとに分割して並列に読み込む．
+        chunksize: 一度にプロセスに送る文書数．
+    """
+    if workers <= 1:
+        yield Document.from_knp(knp_text)
+    else:
+        yield from load_documents(chunk_by_document(StringIO(knp_text)), max_workers=workers, chunksize=chunksize)
+
+
 @app.callback()
 def main(
     _: bool = typer.Option(False, "--version", "-v", callback=version_callback, help="Show version and exit."),
@@ -36,16 +58,20 @@ def main(
 def cat(
     knp_path: Path | None = typer.Argument(None, exists=True, dir_okay=False, help="Path to knp file to show."),
     dark: bool = typer.Option(False, "--dark", "-d", help="Use dark background."),
+    workers: int = WORKERS_OPTION,
+    chunksize: int = CHUNKSIZE_OPTION,
 ) -> None:
     """KNP ファイルを色付きで表示．
 
     Args:
         knp_path: KNP ファイルのパス．
         dark: True なら背景を黒にする．
+        workers: 文書を読み込むプロセス数．
+        chunksize: 一度にプロセスに送る文書数．
     """
     knp_text = sys.stdin.read() if knp_path is None else knp_path.read_text()
-    doc = Document.from_knp(knp_text)
-    print_document(doc, is_dark=dark)
+    for doc in _read_documents(knp_text, workers, chunksize):
+        print_document(doc, is_dark=dark)
 
 
 @app.command(help="Convert a KNP file into raw text, Juman++ format, or KNP format.")
@@ -54,23 +80,27 @@ def convert(
         None, exists=True, dir_okay=False, help="Path to knp file to convert. If not given, read from stdin"
     ),
     format_: str = typer.Option("text", "--format", "-f", help="Format to convert to."),
+    workers: int = WORKERS_OPTION,
+    chunksize: int = CHUNKSIZE_OPTION,
 ) -> None:
     """KNP ファイルを種々のフォーマットに変換．
 
     Args:
         knp_path: KNP ファイルのパス．
         format_: 変換先のフォーマット．"text", "jumanpp", "knp" のいずれか．
+        workers: 文書を読み込むプロセス数．
+        chunksize: 一度にプロセスに送る文書数．
     """
+    if format_ not in ("text", "jumanpp", "knp"):
+        raise ValueError(f"Unknown format: {format_}")
     knp_text = sys.stdin.read() if knp_path is None else knp_path.read_text()
-    doc = Document.from_knp(knp_text)
+    docs = _read_documents(knp_text, workers, chunksize)
     if format_ == "text":
-        print(doc.text)
+        print("".join(doc.text for doc in docs))
     elif format_ == "jumanpp":
-        print(doc.to_jumanpp(), end="")
-    elif format_ == "knp":
-        print(doc.to_knp(), end="")
+        print("".join(doc.to_jumanpp() for doc in docs), end="")
     else:
-        raise ValueError(f"Unknown format: {format_}")
+        print("".join(doc.to_knp() for doc in docs), end="")
 
 
 @app.command(help="Print given file content in tree format.")
@@ -79,6 +109,8 @@ def show(
     pos: bool = typer.Option(False, "--pos", "-p", help="Show POS characters."),
     rel: bool = typer.Option(False, "--rel", "-r", help="Show contents of <rel> tags."),
     pas: bool = typer.Option(False, "--pas", help="Show predicate-argument structures."),
+    workers: int = WORKERS_OPTION,
+    chunksize: int = CHUNKSIZE_OPTION,
 ) -> None:
     """KNP ファイルを読み込み係り受けを可視化．
 
@@ -87,11 +119,13 @@ def show(
         pos: True なら同時に品詞を表示．
         rel: True なら同時に <rel> タグの内容を表示．
         pas: True なら同時に述語項構造を表示．
+        workers: 文書を読み込むプロセス数．
+        chunksize: 一度にプロセスに送る文書数．
     """
-    doc = Document.from_knp(knp_path.read_text())
-    for sent in doc.sentences:
-        print(sent.comment)
-        draw_tree(sent.base_phrases, show_pos=pos, show_rel=rel, show_pas=pas)
+    for doc in _read_documents(knp_path.read_text(), workers, chunksize):
+        for sent in doc.sentences:
+            print(sent.comment)
+            draw_tree(sent.base_phrases, show_pos=pos, show_rel=rel, show_pas=pas)
 
 
 @app.command(help="Show statistics of given KNP file.")
@@ -100,15 +134,23 @@ def stats(
         ..., exists=True, dir_okay=False, help="Path to knp file to calculate statistics on."
     ),
     use_json: bool = typer.Option(False, "--json", "-j", help="Output statistics in JSON format."),
+    workers: int = WORKERS_OPTION,
+    chunksize: int = CHUNKSIZE_OPTION,
 ) -> None:
     """KNP ファイルを読み込みその統計情報を出力．
 
     Args:
         knp_path: KNP ファイルのパス．
         use_json: JSON 形式で出力．
+        workers: 文書を読み込むプロセス数．
+        chunksize: 一度にプロセスに送る文書数．
     """
-    doc = Document.from_knp(knp_path.read_text())
-    doc_stats = get_document_statistics(doc)
+    doc_stats: dict[str, dict[str, int]] = {}
+    for doc in _read_documents(knp_path.read_text(), workers, chunksize):
+        for category, counts in get_document_statistics(doc).items():
+            category_stats = doc_stats.setdefault(category, {})
+            for key, count in counts.items():
+                category_stats[key] = category_stats.get(key, 0) + count
     if use_json:
         print(json.dumps(doc_stats, ensure_ascii=False, indent=4))
     else:
@@ -122,6 +164,7 @@ def serve(
     port: int = typer.Option(8000, "--port", "-p", help="Port to listen on."),
     base_url: str = typer.Option("/", "--base-url", help="Root path of the server."),
     analyzer_args: list[str] | None = typer.Argument(None, help="Additional arguments for the analyzer."),
+    pool_size: int = typer.Option(1, "--pool-size", help="Number of analyzer processes to handle requests with."),
 ) -> None:
     """解析器を起動し，HTTP サーバとして提供．
 
@@ -131,8 +174,9 @@ def serve(
         port: ポート．
         base_url: ベース URL．
         analyzer_args: 解析器のオプション．
+        pool_size: 解析器のプロセス数．
     """
-    serve_analyzer(analyzer, host, port, base_url, analyzer_args)  # pragma: no cover
+    serve_analyzer(analyzer, host, port, base_url, analyzer_args, pool_size)  # pragma: no cover
 
 
 if __name__ == "__main__":
@@ -165,7 +165,7 @@ def create_app(analyzer: AnalyzerType, base_url: str = "/", *args, **kwargs) ->
         analyzed_document: Document | None = None
         if text != "":
             try:
-                analyzed_document = processor.apply(text)
+                analyzed_document = await processor.apply_async(text)
             except Exception as e:
                 raise _HTTPExceptionForIndex(fastapi.status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
         return templates.TemplateResponse(
@@ -186,7 +186,7 @@ def create_app(analyzer: AnalyzerType, base_url: str = "/", *args, **kwargs) ->
         if text == "":
             raise _HTTPExceptionForAnalyze(fastapi.status.HTTP_400_BAD_REQUEST, detail="text is empty")
         try:
-            analyzed_document = processor.apply(text)
+            analyzed_document = await processor.apply_async(text)
             if analyzer == AnalyzerType.JUMANPP:
                 result = analyzed_document.to_jumanpp()
             else:
@@ -199,7 +199,7 @@ def create_app(analyzer: AnalyzerType, base_url: str = "/", *args, **kwargs) ->
 
 
 def serve_analyzer(
-    analyzer: AnalyzerType, host: str, port: int, base_url: str, analyzer_args: list[str] | None
+    analyzer: AnalyzerType, host: str, port: int, base_url: str, analyzer_args: list[str] | None, pool_size: int = 1
 ) -> None:  # pragma: no cover
     """解析器を起動し，HTTP サーバとして提供．
 
@@ -209,8 +209,9 @@ def serve_analyzer(
         port: ポート．
         base_url: ベース URL．
         analyzer_args: 解析器のオプション．
+        pool_size: 解析器のプロセス数．
     """
-    app = create_app(analyzer, base_url, options=analyzer_args)
+    app = create_app(analyzer, base_url, options=analyzer_args, pool_size=pool_size)
     config = uvicorn.Config(app, host=host, port=port)
     server = uvicorn.Server(config)
     server.run()
@@ -1,5 +1,8 @@
 import logging
-from typing import TYPE_CHECKING, ClassVar, Optional
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Optional
 
 from rhoknp.cohesion.argument import ExophoraArgument
 from rhoknp.cohesion.exophora import ExophoraReferent
@@ -28,9 +31,8 @@ class Entity:
     def mentions_all(self) -> list["BasePhrase"]:
         """nonidentical を含めたこのエンティティを参照する全てのメンションのリスト．"""
         ret = self.mentions.copy()
-        for mention in self.mentions_nonidentical:
-            if mention not in ret:
-                ret.append(mention)
+        # A mention refers to this entity identically iff this entity is in its back references.
+        ret += [mention for mention in self.mentions_nonidentical if self not in mention.entities]
         return ret
 
     def add_mention(self, mention: "BasePhrase", is_nonidentical: bool = False) -> None:
@@ -45,17 +47,19 @@ class Entity:
             identical なメンションとして上書きする．
         """
         if is_nonidentical:
-            if mention in self.mentions_all:
+            if self in mention.entities or self in mention.entities_nonidentical:
                 return
             mention.entities_nonidentical.add(self)
             self.mentions_nonidentical.append(mention)
+            _notify_change(mention)
         else:
-            if mention in self.mentions_nonidentical:
+            if self in mention.entities_nonidentical:
                 self.remove_mention(mention)
-            if mention in self.mentions:
+            if self in mention.entities:
                 return
             mention.entities.add(self)
             self.mentions.append(mention)
+            _notify_change(mention)
 
     def remove_mention(self, mention: "BasePhrase") -> None:
         """このエンティティを参照するメンションを削除．
@@ -63,12 +67,14 @@ class Entity:
         Args:
             mention: 削除対象のメンション．
         """
-        if mention in self.mentions:
+        if self in mention.entities:
             self.mentions.remove(mention)
             mention.entities.remove(self)
-        if mention in self.mentions_nonidentical:
+            _notify_change(mention)
+        if self in mention.entities_nonidentical:
             self.mentions_nonidentical.remove(mention)
             mention.entities_nonidentical.remove(self)
+            _notify_change(mention)
 
     def __str__(self) -> str:
         if self.exophora_referent:
@@ -92,13 +98,34 @@ class Entity:
         return hash(self.eid)
 
 
+def _notify_change(mention: "BasePhrase") -> None:
+    """メンションが属する文書の ``EntityManager`` に共参照関係の変更を記録．"""
+    sentence = mention._find_sentence()
+    if sentence is not None:
+        sentence.entity_manager._notify_change()
+
+
 class EntityManager:
-    """文書全体のエンティティを管理．"""
+    """文書全体のエンティティを管理．
+
+    .. note::
+        文書ごとに一つのインスタンスが作成される．文書に属さない文に対しては文ごとに作成される．
+    """
 
-    entities: ClassVar[dict[int, Entity]] = {}  #: ID をキーとするエンティティの辞書．
+    def __init__(self) -> None:
+        self.entities: dict[int, Entity] = {}  #: ID をキーとするエンティティの辞書．
+        # index to look up singleton entities by their exophora referents
+        self._singleton_entities: dict[ExophoraReferent, Entity] = {}
+        self._next_eid: int = 0
+        # reverse index from entity IDs to the exophora arguments referring to them
+        self._exophora_arguments: dict[int, list[ExophoraArgument]] = defaultdict(list)
+        # union-find forest that defers updates of Entity objects while a batch is in progress
+        self._forest: _EntityForest | None = None
+        # the number of changes of entities, their mentions, and entity IDs of exophora arguments in this document,
+        # used to invalidate caches derived from coreference relations
+        self._num_changes: int = 0
 
-    @classmethod
-    def get_or_create_entity(cls, exophora_referent: ExophoraReferent | None = None, eid: int | None = None) -> Entity:
+    def get_or_create_entity(self, exophora_referent: ExophoraReferent | None = None, eid: int | None = None) -> Entity:
         """自身が参照するエンティティを作成．
 
         exophora_referent が singleton entity だった場合を除き，新しく Entity のインスタンスを作成して返す．
@@ -113,22 +140,22 @@ class EntityManager:
             Entity: 作成されたエンティティ．
         """
         if exophora_referent is not None and exophora_referent.is_singleton():
-            entities = [e for e in cls.entities.values() if exophora_referent == e.exophora_referent]
             # If a singleton entity already exists, do not create a new entity, but return that entity.
-            if entities:
-                assert len(entities) == 1  # ensure that there is only one singleton entity
-                return entities[0]
-        if eid in cls.entities:
-            return cls.entities[eid]
+            if (singleton_entity := self._singleton_entities.get(exophora_referent)) is not None:
+                return singleton_entity
+        if eid in self.entities:
+            return self.entities[eid]
         elif eid is None:
-            eid = max(cls.entities.keys()) + 1 if cls.entities else 0
+            eid = self._next_eid
         entity = Entity(eid, exophora_referent=exophora_referent)
-        cls.entities[eid] = entity
+        self._notify_change()
+        if self._forest is not None:
+            self._forest.add_entity(entity)
+        self._register_entity(entity)
         return entity
 
-    @classmethod
     def merge_entities(
-        cls,
+        self,
         source_mention: "BasePhrase",
         target_mention: Optional["BasePhrase"],
         source_entity: Entity,
@@ -148,23 +175,28 @@ class EntityManager:
             target_entity: ターゲット側エンティティ．
             is_nonidentical: ソース側メンションとターゲット側メンションの関係が nonidentical なら True．
         """
-        assert target_entity in target_mention.entities_all if target_mention else True
-        assert source_entity in source_mention.entities_all
-        is_tgt_nonidentical = target_mention is not None and target_entity in target_mention.entities_nonidentical
-        is_src_nonidentical = source_entity in source_mention.entities_nonidentical
+        assert (
+            target_entity in self._get_entities(target_mention, include_nonidentical=True) if target_mention else True
+        )
+        assert source_entity in self._get_entities(source_mention, include_nonidentical=True)
+        self._notify_change()
+        is_tgt_nonidentical = target_mention is not None and target_entity in self._get_entities_nonidentical(
+            target_mention
+        )
+        is_src_nonidentical = source_entity in self._get_entities_nonidentical(source_mention)
         if source_entity is target_entity:
             if not is_nonidentical:
                 # When two sides of a triangle formed by source_entity (=target_entity), source_mention, and
                 # target_mention are identical, the other side is also identical.
                 if not is_src_nonidentical and is_tgt_nonidentical:
                     assert target_mention is not None
-                    source_entity.add_mention(target_mention, is_nonidentical=False)
+                    self._add_mention(source_entity, target_mention, is_nonidentical=False)
                 if is_src_nonidentical and not is_tgt_nonidentical:
-                    source_entity.add_mention(source_mention, is_nonidentical=False)
+                    self._add_mention(source_entity, source_mention, is_nonidentical=False)
             return
         if target_mention is not None:
-            source_entity.add_mention(target_mention, is_nonidentical=(is_nonidentical or is_src_nonidentical))
-        target_entity.add_mention(source_mention, is_nonidentical=(is_nonidentical or is_tgt_nonidentical))
+            self._add_mention(source_entity, target_mention, is_nonidentical=(is_nonidentical or is_src_nonidentical))
+        self._add_mention(target_entity, source_mention, is_nonidentical=(is_nonidentical or is_tgt_nonidentical))
         # When source_entity and target_entity may not be identical, do not delete target_entity.
         if is_nonidentical or is_tgt_nonidentical or is_src_nonidentical:
             return
@@ -178,18 +210,21 @@ class EntityManager:
         # prepare to delete target_entity as follows
         if source_entity.exophora_referent is None:
             source_entity.exophora_referent = target_entity.exophora_referent
-        for tm in target_entity.mentions_all:
-            source_entity.add_mention(tm, is_nonidentical=target_entity in tm.entities_nonidentical)
         # Arguments also have entity ids and will be updated.
-        source_sentence = source_mention.sentence
-        pas_list = source_mention.document.pas_list if source_sentence.has_document() else source_sentence.pas_list
-        for arg in [arg for pas in pas_list for args in pas.get_all_arguments(relax=False).values() for arg in args]:
-            if isinstance(arg, ExophoraArgument) and arg.eid == target_entity.eid:
+        for arg in self._exophora_arguments.pop(target_entity.eid, []):
+            if arg.eid == target_entity.eid:
                 arg.eid = source_entity.eid
-        cls.delete_entity(target_entity)
+            self._exophora_arguments[arg.eid].append(arg)
+        if self._forest is not None:
+            self._forest.merge(source_entity, target_entity)
+            self._unregister_entity(target_entity)
+        else:
+            for tm in target_entity.mentions_all:
+                source_entity.add_mention(tm, is_nonidentical=target_entity in tm.entities_nonidentical)
+            self.delete_entity(target_entity)
+        self._register_entity(source_entity)
 
-    @classmethod
-    def delete_entity(cls, entity: Entity) -> None:
+    def delete_entity(self, entity: Entity) -> None:
         """エンティティを削除．
 
         対象エンティティを `EntityManager` およびそのエンティティを参照するすべてのメンションから削除する．
@@ -198,11 +233,238 @@ class EntityManager:
         Args:
             entity: 削除対象のエンティティ．
         """
-        for mention in entity.mentions_all:
-            entity.remove_mention(mention)
-        cls.entities.pop(entity.eid)
+        if self._forest is not None:
+            self._forest.remove_entity(entity)
+        else:
+            for mention in entity.mentions:
+                mention.entities.discard(entity)
+            for mention in entity.mentions_nonidentical:
+                mention.entities_nonidentical.discard(entity)
+            entity.mentions.clear()
+            entity.mentions_nonidentical.clear()
+        self._unregister_entity(entity)
+        self._notify_change()
 
-    @classmethod
-    def reset(cls) -> None:
+    def reset(self) -> None:
         """管理しているエンティティを全て削除．"""
-        cls.entities.clear()
+        self.entities.clear()
+        self._singleton_entities.clear()
+        self._exophora_arguments.clear()
+        self._next_eid = 0
+        if self._forest is not None:
+            self._forest = _EntityForest()
+        self._notify_change()
+
+    def register_exophora_argument(self, argument: ExophoraArgument) -> None:
+        """外界照応の項をそのエンティティ ID の索引に登録．
+
+        登録された項のエンティティ ID は，エンティティがマージされた際に更新される．
+
+        Args:
+            argument: 登録対象の項．
+        """
+        self._exophora_arguments[argument.eid].append(argument)
+
+    def _notify_change(self) -> None:
+        """共参照関係が変更されたことを記録し，共参照関係から導出したキャッシュを無効にする．"""
+        self._num_changes += 1
+
+    @contextmanager
+    def _batch(self) -> Iterator[None]:
+        """メンションの追加やエンティティのマージを union-find 木の上で行い，終了時に一括で反映させる．
+
+        文書中の全ての共参照関係を取り込む際，長い共参照連鎖を持つエンティティのマージが
+        ほぼ線形時間で済むようにするために用いる．入れ子になった場合は最も外側の終了時に反映される．
+
+        .. note::
+            バッチ処理中は ``Entity`` と ``BasePhrase`` の参照関係は更新されない．
+            メンションの参照するエンティティは ``_get_entities`` により取得する必要がある．
+        """
+        if self._forest is not None:
+            yield
+            return
+        self._forest = _EntityForest()
+        for entity in self.entities.values():
+            self._forest.add_entity(entity)
+        try:
+            yield
+        finally:
+            forest, self._forest = self._forest, None
+            forest.flush()
+            self._notify_change()
+
+    def _get_entities(self, mention: "BasePhrase", include_nonidentical: bool = False) -> set[Entity]:
+        """メンションが参照しているエンティティの集合を返す．"""
+        if self._forest is not None:
+            return self._forest.get_entities(mention, include_nonidentical=include_nonidentical)
+        return mention.entities_all if include_nonidentical else mention.entities
+
+    def _get_entities_nonidentical(self, mention: "BasePhrase") -> set[Entity]:
+        """メンションが≒で参照しているエンティティの集合を返す．"""
+        if self._forest is not None:
+            return self._forest.get_entities_nonidentical(mention)
+        return mention.entities_nonidentical
+
+    def _add_mention(self, entity: Entity, mention: "BasePhrase", is_nonidentical: bool = False) -> None:
+        """エンティティを参照するメンションを追加．"""
+        if self._forest is not None:
+            self._forest.add_mention(entity, mention, is_nonidentical=is_nonidentical)
+        else:
+            entity.add_mention(mention, is_nonidentical=is_nonidentical)
+
+    def _register_entity(self, entity: Entity) -> None:
+        """エンティティを ID および外界照応の照応先の索引に登録．"""
+        self.entities[entity.eid] = entity
+        self._next_eid = max(self._next_eid, entity.eid + 1)
+        if entity.exophora_referent is not None and entity.exophora_referent.is_singleton():
+            self._singleton_entities.setdefault(entity.exophora_referent, entity)
+
+    def _unregister_entity(self, entity: Entity) -> None:
+        """エンティティを ID および外界照応の照応先の索引から削除．"""
+        self.entities.pop(entity.eid)
+        # Keep assigning max(eid) + 1 to new entities as before.
+        while self._next_eid > 0 and (self._next_eid - 1) not in self.entities:
+            self._next_eid -= 1
+        if entity.exophora_referent is not None and self._singleton_entities.get(entity.exophora_referent) is entity:
+            del self._singleton_entities[entity.exophora_referent]
+
+
+class _EntityForest:
+    """エンティティを union-find 木の節点として表し，マージを併合として扱う構造．
+
+    各根はエンティティを参照するメンションの集合を持ち，マージの際には小さい方の集合を大きい方に移す．
+    メンションは自身を追加した節点を保持し，参照しているエンティティはそれらの根として求める．
+    ``Entity`` と ``BasePhrase`` の参照関係は ``flush`` が呼ばれた時点で一括して更新される．
+    """
+
+    def __init__(self) -> None:
+        self._parents: list[int] = []
+        # the entity created with each node and the entity each root currently represents
+        self._origins: list[Entity] = []
+        self._labels: list[Entity] = []
+        # ordered sets of mentions keyed by their ids; only roots have them
+        self._mentions: list[dict[int, "BasePhrase"]] = []
+        self._mentions_nonidentical: list[dict[int, "BasePhrase"]] = []
+        self._nodes: dict[int, int] = {}  # id(entity) -> node
+        # nodes to which each mention has been added
+        self._mention_nodes: dict[int, list[int]] = {}
+        self._mention_nodes_nonidentical: dict[int, list[int]] = {}
+        self._mention_objects: dict[int, "BasePhrase"] = {}
+
+    def add_entity(self, entity: Entity) -> None:
+        """エンティティを新しい根として追加し，既に参照しているメンションを取り込む．"""
+        node = len(self._parents)
+        self._parents.append(node)
+        self._origins.append(entity)
+        self._labels.append(entity)
+        self._mentions.append({})
+        self._mentions_nonidentical.append({})
+        self._nodes[id(entity)] = node
+        for mention in entity.mentions:
+            self.add_mention(entity, mention, is_nonidentical=False)
+        for mention in entity.mentions_nonidentical:
+            self.add_mention(entity, mention, is_nonidentical=True)
+
+    def get_entities(self, mention: "BasePhrase", include_nonidentical: bool = False) -> set[Entity]:
+        """メンションが参照しているエンティティの集合を返す．"""
+        key = id(mention)
+        entities = {self._labels[self._find(node)] for node in self._mention_nodes.get(key, ())}
+        if include_nonidentical is True:
+            entities |= {self._labels[self._find(node)] for node in self._mention_nodes_nonidentical.get(key, ())}
+        return entities
+
+    def get_entities_nonidentical(self, mention: "BasePhrase") -> set[Entity]:
+        """メンションが≒で参照しているエンティティの集合を返す．"""
+        key = id(mention)
+        roots = {self._find(node) for node in self._mention_nodes_nonidentical.get(key, ())}
+        roots -= {self._find(node) for node in self._mention_nodes.get(key, ())}
+        return {self._labels[root] for root in roots}
+
+    def add_mention(self, entity: Entity, mention: "BasePhrase", is_nonidentical: bool = False) -> None:
+        """``Entity.add_mention`` と同様にエンティティを参照するメンションを追加．"""
+        root = self._find(self._nodes[id(entity)])
+        key = id(mention)
+        mentions, mentions_nonidentical = self._mentions[root], self._mentions_nonidentical[root]
+        self._mention_objects[key] = mention
+        if is_nonidentical:
+            if key in mentions or key in mentions_nonidentical:
+                return
+            mentions_nonidentical[key] = mention
+            self._mention_nodes_nonidentical.setdefault(key, []).append(root)
+        else:
+            if key in mentions_nonidentical:
+                del mentions_nonidentical[key]
+                self._discard_nonidentical_nodes(key, root)
+            if key in mentions:
+                return
+            mentions[key] = mention
+            self._mention_nodes.setdefault(key, []).append(root)
+
+    def merge(self, source_entity: Entity, target_entity: Entity) -> None:
+        """target_entity を source_entity に併合．併合後の根は source_entity を表す．"""
+        source_root = self._find(self._nodes[id(source_entity)])
+        target_root = self._find(self._nodes[id(target_entity)])
+        assert source_root != target_root
+        # Move the mentions of the smaller tree to the larger one (union by size).
+        large, small = source_root, target_root
+        if self._size(small) > self._size(large):
+            large, small = small, large
+        large_mentions, large_mentions_nonidentical = self._mentions[large], self._mentions_nonidentical[large]
+        for key, mention in self._mentions[small].items():
+            if key in large_mentions_nonidentical:
+                # identical references take precedence over nonidentical ones
+                del large_mentions_nonidentical[key]
+                self._discard_nonidentical_nodes(key, large)
+            large_mentions.setdefault(key, mention)
+        for key, mention in self._mentions_nonidentical[small].items():
+            if key in large_mentions:
+                self._discard_nonidentical_nodes(key, small)
+            else:
+                large_mentions_nonidentical.setdefault(key, mention)
+        self._mentions[small] = {}
+        self._mentions_nonidentical[small] = {}
+        self._parents[small] = large
+        self._labels[large] = source_entity
+
+    def remove_entity(self, entity: Entity) -> None:
+        """エンティティを参照する全てのメンションを削除．"""
+        root = self._find(self._nodes[id(entity)])
+        if self._labels[root] is not entity:
+            return
+        for key in self._mentions[root]:
+            self._mention_nodes[key] = [node for node in self._mention_nodes[key] if self._find(node) != root]
+        for key in self._mentions_nonidentical[root]:
+            self._discard_nonidentical_nodes(key, root)
+        self._mentions[root] = {}
+        self._mentions_nonidentical[root] = {}
+
+    def flush(self) -> None:
+        """併合の結果を ``Entity`` と ``BasePhrase`` の参照関係に反映．"""
+        for entity in self._origins:
+            entity.mentions = []
+            entity.mentions_nonidentical = []
+        for node, parent in enumerate(self._parents):
+            if node == parent:
+                entity = self._labels[node]
+                entity.mentions = list(self._mentions[node].values())
+                entity.mentions_nonidentical = list(self._mentions_nonidentical[node].values())
+        for mention in self._mention_objects.values():
+            mention.entities = self.get_entities(mention)
+            mention.entities_nonidentical = self.get_entities_nonidentical(mention)
+
+    def _find(self, node: int) -> int:
+        parents = self._parents
+        while parents[node] != node:
+            # path halving
+            parents[node] = parents[parents[node]]
+            node = parents[node]
+        return node
+
+    def _size(self, root: int) -> int:
+        return len(self._mentions[root]) + len(self._mentions_nonidentical[root])
+
+    def _discard_nonidentical_nodes(self, key: int, root: int) -> None:
+        """メンションが≒で参照している節点のうち，根が root であるものを削除．"""
+        nodes = self._mention_nodes_nonidentical.get(key)
+        if nodes:
+            self._mention_nodes_nonidentical[key] = [node for node in nodes if self._find(node) != root]
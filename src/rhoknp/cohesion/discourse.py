@@ -232,15 +232,11 @@ class DiscourseRelation:
             return None
         tag = DiscourseRelationTag(tag)
         category = tag.label
-        head_sentence: "Sentence" | None = None
+        head_sentence: "Sentence" | None
         if modifier.sentence.has_document():
-            sentences = modifier.document.sentences
+            head_sentence = modifier.document.find_sentence(sid)
         else:
-            sentences = [modifier.sentence]
-        for sentence in sentences:
-            if sentence.sid == sid:
-                head_sentence = sentence
-                break
+            head_sentence = modifier.sentence if modifier.sentence.sid == sid else None
         if head_sentence is None:
             logger.warning(f"{sid} not found")
             return None
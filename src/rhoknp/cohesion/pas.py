@@ -1,12 +1,11 @@
-import copy
 import logging
 import re
 from collections import defaultdict
 from enum import Enum, auto
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from rhoknp.cohesion import EntityManager
 from rhoknp.cohesion.argument import HIRA2KATA, Argument, ArgumentType, EndophoraArgument, ExophoraArgument
+from rhoknp.cohesion.coreference import EntityManager
 from rhoknp.cohesion.exophora import ExophoraReferent
 from rhoknp.cohesion.predicate import Predicate
 from rhoknp.cohesion.rel import CASE_TYPES, RelMode
@@ -41,6 +40,15 @@ class Pas:
         predicate.pas = self
         self._arguments: dict[str, list[Argument]] = defaultdict(list)
         self.modes: dict[str, RelMode] = {}
+        # (case, relax, include_nonidentical, include_optional)
+        #   -> (the entity manager, the number of its coreference changes, arguments)
+        self._arguments_cache: dict[tuple[str, bool, bool, bool], tuple[EntityManager, int, tuple[Argument, ...]]] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The number of coreference changes is meaningless in another process.
+        state = self.__dict__.copy()
+        state["_arguments_cache"] = {}
+        return state
 
     @property
     def predicate(self) -> Predicate:
@@ -153,34 +161,58 @@ class Pas:
 
         References:
             格・省略・共参照タグ付けの基準 3.2.1 修飾的表現
+
+        .. note::
+            結果は項が追加されるか共参照関係が変更されるまでキャッシュされる．
+            返されるリストはキャッシュのコピーであり，変更してもキャッシュには影響しない．
         """
         case = normalize_case(case)
-        args = self._arguments[case]
+        key = (case, relax, include_nonidentical, include_optional)
+        sentence = self.predicate.base_phrase.sentence
+        entity_manager = sentence.entity_manager
+        cached = self._arguments_cache.get(key)
+        # Arguments not resolved through coreference do not depend on entities.
+        if cached is not None and (
+            relax is False or (cached[0] is entity_manager and cached[1] == entity_manager._num_changes)
+        ):
+            return list(cached[2])
+
+        args = list(self._arguments.get(case, []))
         if include_nonidentical is True:
-            args += self._arguments[case + "≒"]
+            args += self._arguments.get(case + "≒", [])
         if include_optional is False:
             args = [arg for arg in args if arg.optional is False]
-        pas = copy.copy(self)
-        pas._arguments = copy.copy(self._arguments)
-        pas._arguments[case] = copy.copy(args)
 
-        sentence = self.predicate.base_phrase.sentence
         if relax is True and sentence.parent_unit is not None:
+            resolved_args = args.copy()
+            seen_args = set(args)
             for arg in args:
                 if isinstance(arg, ExophoraArgument):
-                    entities = {EntityManager.get_or_create_entity(eid=arg.eid)}
+                    entities = {entity_manager.get_or_create_entity(eid=arg.eid)}
                 elif isinstance(arg, EndophoraArgument):
                     entities = arg.base_phrase.entities_all if include_nonidentical else arg.base_phrase.entities
                 else:
                     raise AssertionError  # noqa: TRY004, unreachable
                 for entity in entities:
+                    resolved_arg: Argument
                     if entity.exophora_referent is not None:
-                        pas.add_argument(ExophoraArgument(case, entity.exophora_referent, entity.eid))
+                        resolved_arg = ExophoraArgument(case, entity.exophora_referent, entity.eid)
+                        resolved_arg.pas = self
+                        if resolved_arg not in seen_args:
+                            seen_args.add(resolved_arg)
+                            resolved_args.append(resolved_arg)
                     for mention in entity.mentions:
                         if isinstance(arg, EndophoraArgument) and mention == arg.base_phrase:
                             continue
-                        pas.add_argument(EndophoraArgument(case, mention, pas.predicate))
-        return pas._arguments[case]
+                        resolved_arg = EndophoraArgument(case, mention, self.predicate)
+                        resolved_arg.pas = self
+                        if resolved_arg not in seen_args:
+                            seen_args.add(resolved_arg)
+                            resolved_args.append(resolved_arg)
+            args = resolved_args
+        # Read the counter after resolution because it may create entities.
+        self._arguments_cache[key] = (entity_manager, entity_manager._num_changes, tuple(args))
+        return args
 
     def get_all_arguments(
         self,
@@ -216,8 +248,17 @@ class Pas:
         argument.pas = self
         if mode is not None:
             self.modes[case] = mode
-        if argument not in self._arguments[case]:
-            self._arguments[case].append(argument)
+        if argument in self._arguments[case]:
+            return
+        self._arguments[case].append(argument)
+        self._arguments_cache.clear()
+        sentence = self.predicate.base_phrase._find_sentence()
+        if sentence is not None:
+            # The emptiness of this PAS may have changed; discard cached PAS lists only,
+            # since the unit tree itself is unchanged.
+            sentence._clear_pas_list_cache()
+            if isinstance(argument, ExophoraArgument):
+                sentence.entity_manager.register_exophora_argument(argument)
 
     def set_arguments_optional(self, case: str) -> None:
         """与えられた格に属する項をすべて修飾的表現として登録．
@@ -232,6 +273,7 @@ class Pas:
         for arg in self._arguments[case]:
             arg.optional = True
             logger.info(f"marked {arg} as optional in {self.sid}")
+        self._arguments_cache.clear()
 
     def __repr__(self) -> str:
         return f"<{self.__module__}.{self.__class__.__name__}: {self.predicate.text!r}>"
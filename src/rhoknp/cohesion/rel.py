@@ -114,6 +114,17 @@ class RelTag:
             if self.type not in CASE_TYPES:
                 logger.warning(f"Unknown case type: {self.type} ({self})")
 
+    @classmethod
+    def _from_match(cls, match: re.Match) -> "RelTag":
+        """``PAT`` によるマッチ結果からオブジェクトを作成．"""
+        return cls(
+            type=match["type"],
+            target=match["target"],
+            sid=match["sid"],
+            base_phrase_index=int(match["id"]) if match["id"] else None,
+            mode=RelMode(match["mode"]) if match["mode"] else None,
+        )
+
     def to_fstring(self) -> str:
         """素性文字列に変換．"""
         ret = f'<rel type="{self.type}"'
@@ -137,18 +148,7 @@ class RelTagList(list[RelTag]):
     @classmethod
     def from_fstring(cls, fstring: str) -> "RelTagList":
         """KNP における素性文字列からオブジェクトを作成．"""
-        rel_tags = []
-        for match in RelTag.PAT.finditer(fstring):
-            rel_tags.append(
-                RelTag(
-                    type=match["type"],
-                    target=match["target"],
-                    sid=match["sid"],
-                    base_phrase_index=int(match["id"]) if match["id"] else None,
-                    mode=RelMode(match["mode"]) if match["mode"] else None,
-                )
-            )
-        return cls(rel_tags)
+        return cls(RelTag._from_match(match) for match in RelTag.PAT.finditer(fstring))
 
     def to_fstring(self) -> str:
         """素性文字列に変換．"""
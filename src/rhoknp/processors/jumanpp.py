@@ -1,10 +1,9 @@
 import logging
-import select
 import subprocess
-import threading
 import time
-from subprocess import PIPE, Popen
-from threading import Lock
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
 
 try:
     from typing import override  # type: ignore[attr-defined]
@@ -13,6 +12,7 @@ except ImportError:
 
 from rhoknp.processors.processor import Processor
 from rhoknp.processors.senter import RegexSenter
+from rhoknp.processors.transport import ProcessPool, ProcessTransport
 from rhoknp.units import Document, Sentence
 
 logger = logging.getLogger(__name__)
@@ -27,6 +27,7 @@ class Jumanpp(Processor):
         senter: 文分割器のインスタンス．文分割がまだなら，先にこのインスタンスを用いて文分割する．
             未設定なら RegexSenter を使って文分割する．
         skip_sanity_check: True なら，Juman++ の起動時に sanity check をスキップする．
+        pool_size: 起動する Juman++ のプロセス数．入力は出力を待っている入力が最も少ないプロセスに割り当てられる．
 
     Example:
         >>> from rhoknp import Jumanpp
@@ -43,12 +44,15 @@ class Jumanpp(Processor):
         options: list[str] | None = None,
         senter: Processor | None = None,
         skip_sanity_check: bool = False,
+        pool_size: int = 1,
     ) -> None:
         self.executable = executable  #: Juman++ のパス．
         self.options: list[str] = options or []  #: Juman++ のオプション．
         self.senter = senter
-        self._lock = Lock()
-        self._proc: Popen | None = None
+        self.pool_size = pool_size  #: 起動する Juman++ のプロセス数．
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be a positive integer: {pool_size}")
+        self._pool: ProcessPool | None = None
         self.start_process(skip_sanity_check)
 
     def __repr__(self) -> str:
@@ -57,12 +61,14 @@ class Jumanpp(Processor):
             arg_string += f", options={self.options!r}"
         if self.senter is not None:
             arg_string += f", senter={self.senter!r}"
+        if self.pool_size != 1:
+            arg_string += f", pool_size={self.pool_size!r}"
         return f"{self.__class__.__name__}({arg_string})"
 
     def __del__(self) -> None:
         try:
-            if self._proc is not None:
-                self._proc.terminate()
+            if self._pool is not None:
+                self._pool.close()
         except AttributeError:  # pragma: no cover
             # for free-threaded Python interpreters
             pass  # pragma: no cover
@@ -74,10 +80,12 @@ class Jumanpp(Processor):
             Juman++ が既に起動している場合は再起動する．
             skip_sanity_check: True なら，Juman++ の起動時に sanity check をスキップする．
         """
-        if self._proc is not None:
-            self._proc.terminate()
+        if self._pool is not None:
+            self._pool.close()
         try:
-            self._proc = Popen(self.run_command, stdin=PIPE, stdout=PIPE, stderr=PIPE, encoding="utf-8")
+            self._pool = ProcessPool(
+                self.run_command, self.pool_size, name="Juman++", delimiter=Sentence.EOS, stderr_logger=logger
+            )
             if skip_sanity_check is False:
                 _ = self.apply(Sentence.from_raw_text(""))
         except Exception as e:
@@ -85,7 +93,7 @@ class Jumanpp(Processor):
 
     def is_available(self) -> bool:
         """Jumanpp が利用可能であれば True を返す．"""
-        return self._proc is not None and self._proc.poll() is None
+        return self._pool is not None and self._pool.is_alive()
 
     @override
     def apply_to_document(self, document: Document | str, timeout: int = 10) -> Document:
@@ -114,9 +122,7 @@ class Jumanpp(Processor):
                 self.senter = RegexSenter()
             document = self.senter.apply_to_document(document, timeout=timeout - int(time.time() - start))
 
-        sentences: list[Sentence] = []
-        for sentence in document.sentences:
-            sentences.append(self.apply_to_sentence(sentence, timeout=timeout - int(time.time() - start)))
+        sentences = list(self._apply_to_sentences(document.sentences, timeout, start=start))
         ret = Document.from_sentences(sentences)
         if doc_id != "":
             ret.doc_id = doc_id
@@ -138,52 +144,130 @@ class Jumanpp(Processor):
         if isinstance(sentence, str):
             sentence = Sentence(sentence)
 
-        stdout_text: str = ""
-
-        def worker() -> None:
-            nonlocal stdout_text
-            assert self._proc is not None
-            assert self._proc.stdin is not None
-            assert self._proc.stdout is not None
-            assert self._proc.stderr is not None
-
-            self._proc.stdin.write(sentence.to_raw_text())
-            self._proc.stdin.flush()
-
-            stdout_text = ""
-            while self.is_available():
-                line = self._proc.stdout.readline()
-                stdout_text += line
-                if line.strip() == Sentence.EOS:
-                    break
-
-                # Non-blocking read from stderr
-                stderr_text: str = ""
-                while self._proc.stderr in select.select([self._proc.stderr], [], [], 0)[0]:
-                    line = self._proc.stderr.readline()
-                    if line.strip() == "":
-                        break
-                    stderr_text += line
-                if stderr_text.strip() != "":
-                    logger.debug(stderr_text.strip())
-
-        with self._lock:
-            thread = threading.Thread(target=worker, daemon=True)
-            thread.start()
-            thread.join(timeout)
-
-            if thread.is_alive():
-                self.start_process(skip_sanity_check=True)
-                raise TimeoutError(f"Operation timed out after {timeout} seconds.")
-
-            if not self.is_available():
-                self.start_process(skip_sanity_check=True)
-                raise RuntimeError("Juman++ exited unexpectedly.")
+        pool = self._pool
+        assert pool is not None
+        stdout_text = pool.receive(*pool.submit(sentence.to_raw_text()), timeout)
+        return self._create_sentence(sentence, stdout_text)
+
+    @override
+    def apply_to_sentences(
+        self, sentences: Iterable[Sentence | str], timeout: int = 10, max_in_flight: int = 64
+    ) -> Iterator[Sentence]:
+        """文の列に Jumanpp を適用し，解析結果を入力と同じ順に返す．
+
+        Args:
+            sentences: 文の列．
+            timeout: 1文あたりの最大処理時間．
+            max_in_flight: 解析結果を受け取る前に Juman++ に送る文の最大数．
+
+        Raises:
+            ValueError: max_in_flight が1未満の場合．
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be a positive integer: {max_in_flight}")
+        if not self.is_available():
+            raise RuntimeError("Juman++ is not available.")
+        return self._apply_to_sentences(sentences, timeout, max_in_flight)
+
+    @override
+    async def apply_to_document_async(self, document: Document | str, timeout: int = 10) -> Document:
+        """文書に Jumanpp を非同期に適用する．
+
+        Args:
+            document: 文書．
+            timeout: 最大処理時間．
+
+        .. note::
+            文分割がまだなら，先に初期化時に設定した senter で文分割する．
+            未設定なら RegexSenter で文分割する．
+            タスクがキャンセルされた場合，送信済みの文の解析結果は破棄される．
+        """
+        if not self.is_available():
+            raise RuntimeError("Juman++ is not available.")
+
+        start = time.time()
+
+        if isinstance(document, str):
+            document = Document(document)
+        doc_id = document.doc_id
+
+        if document.is_senter_required():
+            if self.senter is None:
+                logger.debug("senter is not specified; use RegexSenter")
+                self.senter = RegexSenter()
+            document = await self.senter.apply_to_document_async(document, timeout=timeout - int(time.time() - start))
+
+        pool = self._pool
+        assert pool is not None
+        requests = [(sentence, *pool.submit(sentence.to_raw_text())) for sentence in document.sentences]
+        sentences: list[Sentence] = []
+        for sentence, transport, future in requests:
+            stdout_text = await pool.receive_async(transport, future, timeout - int(time.time() - start))
+            sentences.append(self._create_sentence(sentence, stdout_text))
+        ret = Document.from_sentences(sentences)
+        if doc_id != "":
+            ret.doc_id = doc_id
+            for sentence in ret.sentences:
+                sentence.doc_id = doc_id
+        return ret
+
+    @override
+    async def apply_to_sentence_async(self, sentence: Sentence | str, timeout: int = 10) -> Sentence:
+        """文に Jumanpp を非同期に適用する．
+
+        Args:
+            sentence: 文．
+            timeout: 最大処理時間．
+
+        .. note::
+            タスクがキャンセルされた場合，送信済みの文の解析結果は破棄される．
+        """
+        if not self.is_available():
+            raise RuntimeError("Juman++ is not available.")
+
+        if isinstance(sentence, str):
+            sentence = Sentence(sentence)
+
+        pool = self._pool
+        assert pool is not None
+        stdout_text = await pool.receive_async(*pool.submit(sentence.to_raw_text()), timeout)
+        return self._create_sentence(sentence, stdout_text)
+
+    def _apply_to_sentences(
+        self, sentences: Iterable[Sentence | str], timeout: int, max_in_flight: int = 64, start: float | None = None
+    ) -> Iterator[Sentence]:
+        """文を Juman++ に先送りしながら解析結果を返す．
 
+        Args:
+            sentences: 文の列．
+            timeout: start が None なら1文あたりの，そうでなければ start からの最大処理時間．
+            max_in_flight: 解析結果を受け取る前に Juman++ に送る文の最大数．
+            start: 処理の開始時刻．
+        """
+        pool = self._pool
+        assert pool is not None
+        in_flight: deque[tuple[Sentence, ProcessTransport, Future[str]]] = deque()
+
+        def get_timeout() -> int:
+            return timeout if start is None else timeout - int(time.time() - start)
+
+        def receive() -> Sentence:
+            sentence, transport, future = in_flight.popleft()
+            return self._create_sentence(sentence, pool.receive(transport, future, get_timeout()))
+
+        for item in sentences:
+            sentence = Sentence(item) if isinstance(item, str) else item
+            in_flight.append((sentence, *pool.submit(sentence.to_raw_text())))
+            if len(in_flight) >= max_in_flight:
+                yield receive()
+        while in_flight:
+            yield receive()
+
+    @staticmethod
+    def _create_sentence(sentence: Sentence, stdout_text: str) -> Sentence:
         ret = Sentence.from_jumanpp(stdout_text)
         if sentence.text and not ret.text:
             raise RuntimeError(f"Juman++ returned empty result for input: '{sentence.text}'")
-
         return ret
 
     def get_version(self) -> str:
@@ -1,9 +1,11 @@
+import asyncio
 import logging
-import select
 import subprocess
-import threading
 import time
-from subprocess import PIPE, Popen
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from dataclasses import dataclass
 from threading import Lock
 
 try:
@@ -14,6 +16,7 @@ except ImportError:
 from rhoknp.processors.jumanpp import Jumanpp
 from rhoknp.processors.processor import Processor
 from rhoknp.processors.senter import RegexSenter
+from rhoknp.processors.transport import ProcessPool, ProcessTransport
 from rhoknp.units import Document, Sentence
 
 logger = logging.getLogger(__name__)
@@ -28,8 +31,9 @@ class KNP(Processor):
         senter: 文分割器のインスタンス．文分割がまだなら，先にこのインスタンスを用いて文分割する．
             未設定なら RegexSenter を使って文分割する．
         jumanpp: Jumanpp のインスタンス．形態素解析がまだなら，先にこのインスタンスを用いて形態素解析する．
-            未設定なら Jumanpp （オプションなし）を使って形態素解析する．
+            未設定なら Jumanpp （オプションなし，プロセス数は pool_size）を使って形態素解析する．
         skip_sanity_check: True なら，KNP の起動時に sanity check をスキップする．
+        pool_size: 起動する KNP のプロセス数．入力は出力を待っている入力が最も少ないプロセスに割り当てられる．
 
     Example:
         >>> from rhoknp import KNP
@@ -38,6 +42,7 @@ class KNP(Processor):
 
     .. note::
         使用するには `KNP <https://github.com/ku-nlp/knp>`_ がインストールされている必要がある．
+        jumanpp が Jumanpp の場合，Juman++ の出力は解析されずにそのまま KNP に入力され，KNP の出力のみが解析される．
     """
 
     def __init__(
@@ -47,13 +52,17 @@ class KNP(Processor):
         senter: Processor | None = None,
         jumanpp: Processor | None = None,
         skip_sanity_check: bool = False,
+        pool_size: int = 1,
     ) -> None:
         self.executable = executable  #: KNP のパス．
         self.options = options or ["-tab"]  #: KNP のオプション．
         self.senter = senter
         self.jumanpp = jumanpp
+        self.pool_size = pool_size  #: 起動する KNP のプロセス数．
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be a positive integer: {pool_size}")
         self._lock = Lock()
-        self._proc: Popen | None = None
+        self._pool: ProcessPool | None = None
         if "-tab" not in self.options:
             raise ValueError("`-tab` option is required when you use KNP.")
         self.start_process(skip_sanity_check)
@@ -66,12 +75,14 @@ class KNP(Processor):
             arg_string += f", senter={self.senter!r}"
         if self.jumanpp is not None:
             arg_string += f", jumanpp={self.jumanpp!r}"
+        if self.pool_size != 1:
+            arg_string += f", pool_size={self.pool_size!r}"
         return f"{self.__class__.__name__}({arg_string})"
 
     def __del__(self) -> None:
         try:
-            if self._proc is not None:
-                self._proc.terminate()
+            if self._pool is not None:
+                self._pool.close()
         except AttributeError:  # pragma: no cover
             # for free-threaded Python interpreters
             pass  # pragma: no cover
@@ -83,10 +94,12 @@ class KNP(Processor):
             KNP がすでに起動している場合は再起動する．
             skip_sanity_check: True なら，KNP の起動時に sanity check をスキップする．
         """
-        if self._proc is not None:
-            self._proc.terminate()
+        if self._pool is not None:
+            self._pool.close()
         try:
-            self._proc = Popen(self.run_command, stdin=PIPE, stdout=PIPE, stderr=PIPE, encoding="utf-8")
+            self._pool = ProcessPool(
+                self.run_command, self.pool_size, name="KNP", delimiter=Sentence.EOS, stderr_logger=logger
+            )
             if skip_sanity_check is False:
                 _ = self.apply(Sentence.from_jumanpp("EOS"))
         except Exception as e:
@@ -94,7 +107,7 @@ class KNP(Processor):
 
     def is_available(self) -> bool:
         """KNP が利用可能であれば True を返す．"""
-        return self._proc is not None and self._proc.poll() is None
+        return self._pool is not None and self._pool.is_alive()
 
     @override
     def apply_to_document(self, document: Document | str, timeout: int = 10) -> Document:
@@ -125,9 +138,7 @@ class KNP(Processor):
                 self.senter = RegexSenter()
             document = self.senter.apply_to_document(document, timeout=timeout - int(time.time() - start))
 
-        sentences: list[Sentence] = []
-        for sentence in document.sentences:
-            sentences.append(self.apply_to_sentence(sentence, timeout=timeout - int(time.time() - start)))
+        sentences = list(self._apply_to_sentences(document.sentences, timeout, start=start))
         ret = Document.from_sentences(sentences)
         if doc_id != "":
             ret.doc_id = doc_id
@@ -155,62 +166,216 @@ class KNP(Processor):
         if isinstance(sentence, str):
             sentence = Sentence(sentence)
 
-        if sentence.is_jumanpp_required():
-            with self._lock:
-                if self.jumanpp is None:
-                    logger.debug("jumanpp is not specified when initializing KNP: use Jumanpp with no option")
-                    self.jumanpp = Jumanpp()
-            sentence = self.jumanpp.apply_to_sentence(sentence, timeout=timeout - int(time.time() - start))
-
-        stdout_text: str = ""
-
-        def worker() -> None:
-            nonlocal stdout_text
-            assert self._proc is not None
-            assert self._proc.stdin is not None
-            assert self._proc.stdout is not None
-            assert self._proc.stderr is not None
-
-            if sentence.is_knp_required():
-                self._proc.stdin.write(sentence.to_jumanpp())
-            else:
-                self._proc.stdin.write(sentence.to_knp())
-            self._proc.stdin.flush()
-
-            stdout_text = ""
-            while self.is_available():
-                line = self._proc.stdout.readline()
-                stdout_text += line
-                if line.strip() == Sentence.EOS:
-                    break
-
-                # Non-blocking read from stderr
-                stderr_text = ""
-                while self._proc.stderr in select.select([self._proc.stderr], [], [], 0)[0]:
-                    line = self._proc.stderr.readline()
-                    if line.strip() == "":
-                        break
-                    stderr_text += line
-                if stderr_text.strip() != "":
-                    logger.debug(stderr_text.strip())
+        request = self._submit_sentence(sentence, timeout - int(time.time() - start))
+        return self._receive_sentence(request, timeout - int(time.time() - start))
 
-        with self._lock:
-            thread = threading.Thread(target=worker, daemon=True)
-            thread.start()
-            thread.join(timeout)
+    @override
+    def apply_to_sentences(
+        self, sentences: Iterable[Sentence | str], timeout: int = 10, max_in_flight: int = 64
+    ) -> Iterator[Sentence]:
+        """文の列に KNP を適用し，解析結果を入力と同じ順に返す．
+
+        Args:
+            sentences: 文の列．
+            timeout: 1文あたりの最大処理時間．
+            max_in_flight: 解析結果を受け取る前に KNP に送る文の最大数．
+
+        Raises:
+            ValueError: max_in_flight が1未満の場合．
+
+        .. note::
+            形態素解析がまだなら，先に初期化時に設定した jumanpp で形態素解析する．
+            未設定なら Jumanpp （オプションなし）で形態素解析する．
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be a positive integer: {max_in_flight}")
+        if not self.is_available():
+            raise RuntimeError("KNP is not available.")
+        return self._apply_to_sentences(sentences, timeout, max_in_flight)
+
+    @override
+    async def apply_to_document_async(self, document: Document | str, timeout: int = 10) -> Document:
+        """文書に KNP を非同期に適用する．
+
+        Args:
+            document: 文書．
+            timeout: 最大処理時間．
 
-            if thread.is_alive():
-                self.start_process(skip_sanity_check=True)
-                raise TimeoutError(f"Operation timed out after {timeout} seconds.")
+        .. note::
+            文分割がまだなら，先に初期化時に設定した senter で文分割する．
+            未設定なら RegexSenter で文分割する．
+            形態素解析がまだなら，先に初期化時に設定した jumanpp で形態素解析する．
+            未設定なら Jumanpp （オプションなし）で形態素解析する．
+            タスクがキャンセルされた場合，送信済みの文の解析結果は破棄される．
+        """
+        if not self.is_available():
+            raise RuntimeError("KNP is not available.")
+
+        start: float = time.time()
 
-            if not self.is_available():
-                self.start_process(skip_sanity_check=True)
-                raise RuntimeError("KNP exited unexpectedly.")
+        if isinstance(document, str):
+            document = Document(document)
+        doc_id = document.doc_id
 
+        if document.is_senter_required():
+            if self.senter is None:
+                logger.debug("senter is not specified; use RegexSenter")
+                self.senter = RegexSenter()
+            document = await self.senter.apply_to_document_async(document, timeout=timeout - int(time.time() - start))
+
+        requests = await asyncio.gather(
+            *(
+                self._submit_sentence_async(sentence, timeout - int(time.time() - start))
+                for sentence in document.sentences
+            )
+        )
+        # Forward all outputs of Juman++ first so that KNP does not wait for the preceding sentences to be received.
+        for request in requests:
+            if request.jumanpp_pool is not None:
+                await self._forward_async(request, timeout - int(time.time() - start))
+        sentences: list[Sentence] = []
+        for request in requests:
+            sentences.append(await self._receive_sentence_async(request, timeout - int(time.time() - start)))
+        ret = Document.from_sentences(sentences)
+        if doc_id != "":
+            ret.doc_id = doc_id
+            for sentence in ret.sentences:
+                sentence.doc_id = doc_id
+        return ret
+
+    @override
+    async def apply_to_sentence_async(self, sentence: Sentence | str, timeout: int = 10) -> Sentence:
+        """文に KNP を非同期に適用する．
+
+        Args:
+            sentence: 文．
+            timeout: 最大処理時間．
+
+        .. note::
+            形態素解析がまだなら，先に初期化時に設定した jumanpp で形態素解析する．
+            未設定なら Jumanpp （オプションなし）で形態素解析する．
+            タスクがキャンセルされた場合，送信済みの文の解析結果は破棄される．
+        """
+        if not self.is_available():
+            raise RuntimeError("KNP is not available.")
+
+        start: float = time.time()
+
+        if isinstance(sentence, str):
+            sentence = Sentence(sentence)
+
+        request = await self._submit_sentence_async(sentence, timeout - int(time.time() - start))
+        return await self._receive_sentence_async(request, timeout - int(time.time() - start))
+
+    def _apply_to_sentences(
+        self, sentences: Iterable[Sentence | str], timeout: int, max_in_flight: int = 64, start: float | None = None
+    ) -> Iterator[Sentence]:
+        """文を KNP に先送りしながら解析結果を返す．
+
+        Args:
+            sentences: 文の列．
+            timeout: start が None なら1文あたりの，そうでなければ start からの最大処理時間．
+            max_in_flight: 解析結果を受け取る前に KNP に送る文の最大数．
+            start: 処理の開始時刻．
+        """
+        in_flight: deque[_Request] = deque()
+
+        def get_timeout() -> int:
+            return timeout if start is None else timeout - int(time.time() - start)
+
+        def forward_ready() -> None:
+            # Forward the outputs of Juman++ that have already arrived regardless of their order,
+            # since each KNP input gets its own future.
+            for request in in_flight:
+                if request.jumanpp_pool is not None and request.future.done() and request.future.exception() is None:
+                    self._forward(request, get_timeout())
+
+        for item in sentences:
+            sentence = Sentence(item) if isinstance(item, str) else item
+            in_flight.append(self._submit_sentence(sentence, get_timeout()))
+            forward_ready()
+            if len(in_flight) >= max_in_flight:
+                yield self._receive_sentence(in_flight.popleft(), get_timeout())
+        while in_flight:
+            forward_ready()
+            yield self._receive_sentence(in_flight.popleft(), get_timeout())
+
+    def _submit_sentence(self, sentence: Sentence, timeout: int) -> "_Request":
+        """文を KNP に送る．
+
+        形態素解析が必要な文は Juman++ に送り，その出力は解析せずにそのまま KNP に送る（``_forward``）．
+        jumanpp が Jumanpp でない場合は，形態素解析の結果を KNP に送る．
+        """
+        if sentence.is_jumanpp_required():
+            jumanpp = self._get_jumanpp()
+            if isinstance(jumanpp, Jumanpp) and jumanpp._pool is not None and jumanpp.is_available():
+                return _Request(sentence, *jumanpp._pool.submit(sentence.to_raw_text()), jumanpp_pool=jumanpp._pool)
+            sentence = jumanpp.apply_to_sentence(sentence, timeout=timeout)
+        assert self._pool is not None
+        return _Request(sentence, *self._pool.submit(self._gen_input_text(sentence)))
+
+    async def _submit_sentence_async(self, sentence: Sentence, timeout: int) -> "_Request":
+        """文を KNP に送る．``_submit_sentence`` の非同期版．"""
+        if sentence.is_jumanpp_required():
+            jumanpp = self._get_jumanpp()
+            if isinstance(jumanpp, Jumanpp) and jumanpp._pool is not None and jumanpp.is_available():
+                return _Request(sentence, *jumanpp._pool.submit(sentence.to_raw_text()), jumanpp_pool=jumanpp._pool)
+            sentence = await jumanpp.apply_to_sentence_async(sentence, timeout=timeout)
+        assert self._pool is not None
+        return _Request(sentence, *self._pool.submit(self._gen_input_text(sentence)))
+
+    def _forward(self, request: "_Request", timeout: int) -> None:
+        """Juman++ の出力を受け取り，解析せずに KNP に送る．"""
+        assert request.jumanpp_pool is not None
+        assert self._pool is not None
+        jumanpp_output = request.jumanpp_pool.receive(request.transport, request.future, timeout)
+        request.transport, request.future = self._pool.submit(jumanpp_output)
+        request.jumanpp_pool = None
+
+    async def _forward_async(self, request: "_Request", timeout: int) -> None:
+        """Juman++ の出力を非同期に受け取り，解析せずに KNP に送る．"""
+        assert request.jumanpp_pool is not None
+        assert self._pool is not None
+        jumanpp_output = await request.jumanpp_pool.receive_async(request.transport, request.future, timeout)
+        request.transport, request.future = self._pool.submit(jumanpp_output)
+        request.jumanpp_pool = None
+
+    def _receive_sentence(self, request: "_Request", timeout: int) -> Sentence:
+        """KNP の解析結果を受け取る．"""
+        start: float = time.time()
+        if request.jumanpp_pool is not None:
+            self._forward(request, timeout)
+        assert self._pool is not None
+        stdout_text = self._pool.receive(request.transport, request.future, timeout - int(time.time() - start))
+        return self._create_sentence(request.sentence, stdout_text)
+
+    async def _receive_sentence_async(self, request: "_Request", timeout: int) -> Sentence:
+        """KNP の解析結果を非同期に受け取る．"""
+        start: float = time.time()
+        if request.jumanpp_pool is not None:
+            await self._forward_async(request, timeout)
+        assert self._pool is not None
+        stdout_text = await self._pool.receive_async(
+            request.transport, request.future, timeout - int(time.time() - start)
+        )
+        return self._create_sentence(request.sentence, stdout_text)
+
+    def _get_jumanpp(self) -> Processor:
+        with self._lock:
+            if self.jumanpp is None:
+                logger.debug("jumanpp is not specified when initializing KNP: use Jumanpp with no option")
+                self.jumanpp = Jumanpp(pool_size=self.pool_size)
+        return self.jumanpp
+
+    @staticmethod
+    def _gen_input_text(sentence: Sentence) -> str:
+        return sentence.to_jumanpp() if sentence.is_knp_required() else sentence.to_knp()
+
+    @staticmethod
+    def _create_sentence(sentence: Sentence, stdout_text: str) -> Sentence:
         ret = Sentence.from_knp(stdout_text)
         if sentence.text and not ret.text:
             raise RuntimeError(f"KNP returned empty result for input: '{sentence.text}'")
-
         return ret
 
     def get_version(self) -> str:
@@ -229,3 +394,14 @@ class KNP(Processor):
     def version_command(self) -> list[str]:
         """バージョンを確認するコマンド．"""
         return [self.executable, "-v"]
+
+
+@dataclass
+class _Request:
+    """KNP に送った文と，その解析結果を待つための情報．"""
+
+    sentence: Sentence  #: 入力文．
+    transport: ProcessTransport  #: 出力を待っているプロセスとの入出力を行うオブジェクト．
+    future: "Future[str]"  #: 出力を結果とする ``Future``．
+    #: Juman++ の出力を待っている場合は Juman++ のプロセスプール．出力が KNP に送られると None になる．
+    jumanpp_pool: ProcessPool | None = None
@@ -1,9 +1,8 @@
 import logging
-import select
 import subprocess
-import threading
-from subprocess import PIPE, Popen
-from threading import Lock
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
 
 try:
     from typing import override  # type: ignore[attr-defined]
@@ -11,6 +10,7 @@ except ImportError:
     from typing_extensions import override
 
 from rhoknp.processors.processor import Processor
+from rhoknp.processors.transport import ProcessPool, ProcessTransport
 from rhoknp.units import Document, Morpheme, Sentence
 from rhoknp.utils.comment import is_comment_line
 
@@ -24,6 +24,7 @@ class KWJA(Processor):
         executable: KWJA のパス．
         options: KWJA のオプション．
         skip_sanity_check: True なら，KWJA の起動時に sanity check をスキップする．
+        pool_size: 起動する KWJA のプロセス数．入力は出力を待っている入力が最も少ないプロセスに割り当てられる．
 
     Example:
         >>> from rhoknp import KWJA
@@ -39,11 +40,14 @@ class KWJA(Processor):
         executable: str = "kwja",
         options: list[str] | None = None,
         skip_sanity_check: bool = False,
+        pool_size: int = 1,
     ) -> None:
         self.executable = executable  #: KWJA のパス．
         self.options: list[str] = options or []  #: KWJA のオプション．
-        self._proc: Popen | None = None
-        self._lock = Lock()
+        self.pool_size = pool_size  #: 起動する KWJA のプロセス数．
+        if pool_size < 1:
+            raise ValueError(f"pool_size must be a positive integer: {pool_size}")
+        self._pool: ProcessPool | None = None
         self._output_format: str = "knp"
         self._input_format: str = "raw"
         if "--tasks" in self.options:
@@ -70,12 +74,14 @@ class KWJA(Processor):
         arg_string = f"executable={self.executable!r}"
         if self.options:
             arg_string += f", options={self.options!r}"
+        if self.pool_size != 1:
+            arg_string += f", pool_size={self.pool_size!r}"
         return f"{self.__class__.__name__}({arg_string})"
 
     def __del__(self) -> None:
         try:
-            if self._proc is not None:
-                self._proc.terminate()
+            if self._pool is not None:
+                self._pool.close()
         except AttributeError:  # pragma: no cover
             # for free-threaded Python interpreters
             pass  # pragma: no cover
@@ -87,10 +93,18 @@ class KWJA(Processor):
             KWJA がすでに起動している場合は再起動する．
             skip_sanity_check: True なら，KWJA の起動時に sanity check をスキップする．
         """
-        if self._proc is not None:
-            self._proc.terminate()
+        if self._pool is not None:
+            self._pool.close()
         try:
-            self._proc = Popen(self.run_command, stdin=PIPE, stdout=PIPE, stderr=PIPE, encoding="utf-8")
+            self._pool = ProcessPool(
+                self.run_command,
+                self.pool_size,
+                name="KWJA",
+                delimiter=Document.EOD,
+                keep_delimiter=False,
+                stderr_logger=logger,
+                stderr_level=logging.WARNING,
+            )
             if skip_sanity_check is False:
                 if self._input_format == "raw":
                     empty_document = Document.from_raw_text("")
@@ -105,7 +119,7 @@ class KWJA(Processor):
 
     def is_available(self) -> bool:
         """KWJA が利用可能であれば True を返す．"""
-        return self._proc is not None and self._proc.poll() is None
+        return self._pool is not None and self._pool.is_alive()
 
     @override
     def apply_to_document(self, document: Document | str, timeout: int = 30) -> Document:
@@ -120,56 +134,70 @@ class KWJA(Processor):
 
         if isinstance(document, str):
             document = Document(document)
-        doc_id = document.doc_id
-
-        stdout_text: str = ""
-
-        def worker() -> None:
-            nonlocal stdout_text
-            assert self._proc is not None
-            assert self._proc.stdin is not None
-            assert self._proc.stdout is not None
-            assert self._proc.stderr is not None
-
-            self._proc.stdin.write(self._gen_input_text(document))
-            self._proc.stdin.flush()
-
-            stdout_text = ""
-            while self.is_available():
-                line = self._proc.stdout.readline()
-                if line.strip() == Document.EOD:
-                    break
-                stdout_text += line
-
-                # Non-blocking read from stderr
-                stderr_text = ""
-                while self._proc.stderr in select.select([self._proc.stderr], [], [], 0)[0]:
-                    line = self._proc.stderr.readline()
-                    if line.strip() == "":
-                        break
-                    stderr_text += line
-                if stderr_text.strip() != "":
-                    logger.warning(stderr_text.strip())
-
-        with self._lock:
-            thread = threading.Thread(target=worker, daemon=True)
-            thread.start()
-            thread.join(timeout)
-
-            if thread.is_alive():
-                self.start_process(skip_sanity_check=True)
-                raise TimeoutError(f"Operation timed out after {timeout} seconds.")
-
-            if not self.is_available():
-                self.start_process(skip_sanity_check=True)
-                raise RuntimeError("KWJA exited unexpectedly.")
+        pool = self._pool
+        assert pool is not None
+        stdout_text = pool.receive(*pool.submit(self._gen_input_text(document)), timeout)
+        return self._create_analyzed_document(document, stdout_text)
 
-        ret = self._create_document(stdout_text)
-        if doc_id != "":
-            ret.doc_id = doc_id
-            for sentence in ret.sentences:
-                sentence.doc_id = doc_id
-        return ret
+    @override
+    async def apply_to_document_async(self, document: Document | str, timeout: int = 30) -> Document:
+        """文書に KWJA を非同期に適用する．
+
+        Args:
+            document: 文書．
+            timeout: 最大処理時間．
+
+        .. note::
+            タスクがキャンセルされた場合，送信済みの文書の解析結果は破棄される．
+        """
+        if not self.is_available():
+            raise RuntimeError("KWJA is not available.")
+
+        if isinstance(document, str):
+            document = Document(document)
+        pool = self._pool
+        assert pool is not None
+        stdout_text = await pool.receive_async(*pool.submit(self._gen_input_text(document)), timeout)
+        return self._create_analyzed_document(document, stdout_text)
+
+    @override
+    def apply_to_documents(
+        self, documents: Iterable[Document | str], timeout: int = 30, max_in_flight: int = 64
+    ) -> Iterator[Document]:
+        """文書の列に KWJA を適用し，解析結果を入力と同じ順に返す．
+
+        Args:
+            documents: 文書の列．
+            timeout: 1文書あたりの最大処理時間．
+            max_in_flight: 解析結果を受け取る前に KWJA に送る文書の最大数．
+
+        Raises:
+            ValueError: max_in_flight が1未満の場合．
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be a positive integer: {max_in_flight}")
+        if not self.is_available():
+            raise RuntimeError("KWJA is not available.")
+        return self._apply_to_documents(documents, timeout, max_in_flight)
+
+    def _apply_to_documents(
+        self, documents: Iterable[Document | str], timeout: int, max_in_flight: int
+    ) -> Iterator[Document]:
+        pool = self._pool
+        assert pool is not None
+        in_flight: deque[tuple[Document, ProcessTransport, Future[str]]] = deque()
+
+        def receive() -> Document:
+            document, transport, future = in_flight.popleft()
+            return self._create_analyzed_document(document, pool.receive(transport, future, timeout))
+
+        for item in documents:
+            document = Document(item) if isinstance(item, str) else item
+            in_flight.append((document, *pool.submit(self._gen_input_text(document))))
+            if len(in_flight) >= max_in_flight:
+                yield receive()
+        while in_flight:
+            yield receive()
 
     @override
     def apply_to_sentence(self, sentence: Sentence | str, timeout: int = 10) -> Sentence:
@@ -192,6 +220,14 @@ class KWJA(Processor):
             raise AssertionError(f"invalid input format: {self._input_format}")
         return input_text + Document.EOD + "\n"
 
+    def _create_analyzed_document(self, document: Document, stdout_text: str) -> Document:
+        ret = self._create_document(stdout_text)
+        if document.doc_id != "":
+            ret.doc_id = document.doc_id
+            for sentence in ret.sentences:
+                sentence.doc_id = document.doc_id
+        return ret
+
     def _create_document(self, text: str) -> Document:
         if self._output_format == "raw":
             return Document.from_raw_text(text)
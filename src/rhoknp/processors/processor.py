@@ -1,4 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from typing import overload
 
 from rhoknp.units import Document, Sentence
@@ -66,6 +68,35 @@ class Processor(ABC):
         else:
             raise TypeError("Invalid type: text must be str, Sentence, or Document")
 
+    @overload
+    async def apply_async(self, text: str, timeout: int = 10) -> Document: ...
+
+    @overload
+    async def apply_async(self, text: Sentence, timeout: int = 10) -> Sentence: ...
+
+    @overload
+    async def apply_async(self, text: Document, timeout: int = 10) -> Document: ...
+
+    async def apply_async(self, text: str | Sentence | Document, timeout: int = 10) -> Document | Sentence:
+        """テキストに解析器を非同期に適用する．
+
+        Args:
+            text: 解析するテキスト．
+            timeout: 最大処理時間．
+
+        Raises:
+            TypeError: textの型がstr, Sentence, Document以外の場合．
+
+        .. note::
+            このメソッドは引数の型に応じて ``apply_to_document_async`` または ``apply_to_sentence_async`` を呼び出す．
+        """
+        if isinstance(text, (Document, str)):
+            return await self.apply_to_document_async(text, timeout=timeout)
+        elif isinstance(text, Sentence):
+            return await self.apply_to_sentence_async(text, timeout=timeout)
+        else:
+            raise TypeError("Invalid type: text must be str, Sentence, or Document")
+
     @abstractmethod
     def apply_to_document(self, document: Document | str, timeout: int = 10) -> Document:
         """文書に解析器を適用する．
@@ -85,3 +116,75 @@ class Processor(ABC):
             timeout: 最大処理時間．
         """
         raise NotImplementedError
+
+    async def apply_to_document_async(self, document: Document | str, timeout: int = 10) -> Document:
+        """文書に解析器を非同期に適用する．
+
+        Args:
+            document: 文書．
+            timeout: 最大処理時間．
+
+        .. note::
+            解析器が非同期処理に対応していない場合は，別のスレッドで ``apply_to_document`` を実行する．
+        """
+        return await asyncio.to_thread(self.apply_to_document, document, timeout)
+
+    async def apply_to_sentence_async(self, sentence: Sentence | str, timeout: int = 10) -> Sentence:
+        """文に解析器を非同期に適用する．
+
+        Args:
+            sentence: 文．
+            timeout: 最大処理時間．
+
+        .. note::
+            解析器が非同期処理に対応していない場合は，別のスレッドで ``apply_to_sentence`` を実行する．
+        """
+        return await asyncio.to_thread(self.apply_to_sentence, sentence, timeout)
+
+    def apply_to_sentences(
+        self,
+        sentences: Iterable[Sentence | str],
+        timeout: int = 10,
+        max_in_flight: int = 64,
+    ) -> Iterator[Sentence]:
+        """文の列に解析器を適用し，解析結果を入力と同じ順に返す．
+
+        Args:
+            sentences: 文の列．
+            timeout: 1文あたりの最大処理時間．
+            max_in_flight: 解析結果を受け取る前に解析器に送る文の最大数．
+
+        Raises:
+            ValueError: max_in_flight が1未満の場合．
+
+        .. note::
+            このメソッドは1文ずつ ``apply_to_sentence`` を適用し， ``max_in_flight`` は値の検査にのみ用いる．
+            解析器に文を先送りできるサブクラスは，このメソッドをオーバーライドして最大で ``max_in_flight`` 文を先に送る．
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be a positive integer: {max_in_flight}")
+        return (self.apply_to_sentence(sentence, timeout=timeout) for sentence in sentences)
+
+    def apply_to_documents(
+        self,
+        documents: Iterable[Document | str],
+        timeout: int = 10,
+        max_in_flight: int = 64,
+    ) -> Iterator[Document]:
+        """文書の列に解析器を適用し，解析結果を入力と同じ順に返す．
+
+        Args:
+            documents: 文書の列．
+            timeout: 1文書あたりの最大処理時間．
+            max_in_flight: 解析結果を受け取る前に解析器に送る文書の最大数．
+
+        Raises:
+            ValueError: max_in_flight が1未満の場合．
+
+        .. note::
+            このメソッドは1文書ずつ ``apply_to_document`` を適用し， ``max_in_flight`` は値の検査にのみ用いる．
+            解析器に文書を先送りできるサブクラスは，このメソッドをオーバーライドして最大で ``max_in_flight`` 文書を先に送る．
+        """
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be a positive integer: {max_in_flight}")
+        return (self.apply_to_document(document, timeout=timeout) for document in documents)
@@ -0,0 +1,374 @@
+import asyncio
+import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from subprocess import PIPE, Popen, TimeoutExpired
+from typing import IO, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessExitedError(RuntimeError):
+    """解析器のプロセスが応答を返す前に終了したことを表す例外．"""
+
+
+class ProcessTransport:
+    """解析器のサブプロセスとの入出力を行うクラス．
+
+    標準入力への書き込みと標準出力，標準エラー出力からの読み込みはそれぞれ専用のスレッドが行う．
+    入力は書き込まれた順に解析器に送られ，区切り行で終わる出力が入力と同じ順に対応付けられるため，
+    複数の入力を応答を待たずに送ることができる．
+
+    Args:
+        proc: 解析器のプロセス．標準入出力はテキストモードのパイプである必要がある．
+        delimiter: 1つの入力に対する出力の終わりを表す行．
+        keep_delimiter: True なら，区切り行を出力に含める．
+        stderr_logger: 標準エラー出力を記録するロガー．
+        stderr_level: 標準エラー出力を記録するログレベル．
+
+    .. note::
+        解析器は1つの入力に対して区切り行で終わる出力をちょうど1つ返す必要がある．
+    """
+
+    def __init__(
+        self,
+        proc: Popen,
+        delimiter: str,
+        keep_delimiter: bool = True,
+        stderr_logger: logging.Logger = logger,
+        stderr_level: int = logging.DEBUG,
+    ) -> None:
+        assert proc.stdin is not None
+        assert proc.stdout is not None
+        assert proc.stderr is not None
+        self.proc = proc  #: 解析器のプロセス．
+        self.delimiter = delimiter  #: 1つの入力に対する出力の終わりを表す行．
+        self.keep_delimiter = keep_delimiter  #: True なら，区切り行を出力に含める．
+        self._stderr_logger = stderr_logger
+        self._stderr_level = stderr_level
+        self._lock = threading.Lock()
+        # Futures waiting for outputs and their inputs, in the order the inputs are written.
+        self._pending: deque[tuple[Future[str], str]] = deque()
+        self._inputs: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._reader = threading.Thread(target=self._read_loop, daemon=True)
+        self._stderr_reader = threading.Thread(target=self._read_stderr_loop, daemon=True)
+        self._writer.start()
+        self._reader.start()
+        self._stderr_reader.start()
+
+    def is_alive(self) -> bool:
+        """プロセスが動作中であれば True を返す．"""
+        return not self._closed and self.proc.poll() is None
+
+    @property
+    def num_pending(self) -> int:
+        """出力を待っている入力の数．"""
+        return len(self._pending)
+
+    def submit(self, text: str, future: Optional["Future[str]"] = None) -> "Future[str]":
+        """入力を送り，対応する出力を結果とする ``Future`` を返す．
+
+        Args:
+            text: 解析器への入力．改行で終わる必要がある．
+            future: 出力を結果とする実行中の ``Future``．None なら新しく作成する．
+
+        Raises:
+            ProcessExitedError: プロセスが終了している場合．
+        """
+        if future is None:
+            future = Future()
+            # Running futures cannot be cancelled, so that every output has a future to receive it.
+            future.set_running_or_notify_cancel()
+        with self._lock:
+            if self._closed:
+                raise ProcessExitedError("process has already exited")
+            self._pending.append((future, text))
+            self._inputs.put(text)
+        return future
+
+    def close(self, timeout: float = 1.0) -> None:
+        """プロセスを終了し，出力を待っている入力をエラーとする．
+
+        Args:
+            timeout: プロセスの終了を待つ最大時間．超えた場合はプロセスを強制終了する．
+        """
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._inputs.put(None)
+        # poll() also reaps the process if it has already exited.
+        if self.proc.poll() is None:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout)
+            except TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+        self._fail_pending()
+
+    def _write_loop(self) -> None:
+        assert self.proc.stdin is not None
+        while (text := self._inputs.get()) is not None:
+            try:
+                self.proc.stdin.write(text)
+                self.proc.stdin.flush()
+            except (OSError, ValueError):
+                # The process has exited; the reader fails the pending futures on EOF.
+                break
+        # Each pipe is closed by the thread using it, so that no thread is blocked on a closed pipe.
+        _close_pipe(self.proc.stdin)
+
+    def _read_loop(self) -> None:
+        assert self.proc.stdout is not None
+        lines: list[str] = []
+        try:
+            for line in self.proc.stdout:
+                if line.strip() != self.delimiter:
+                    lines.append(line)
+                    continue
+                if self.keep_delimiter:
+                    lines.append(line)
+                output = "".join(lines)
+                lines = []
+                with self._lock:
+                    future = self._pending.popleft()[0] if self._pending else None
+                if future is None:
+                    logger.debug(f"discarded an output with no corresponding input: {output!r}")
+                    continue
+                future.set_result(output)
+        except (OSError, ValueError):
+            pass
+        _close_pipe(self.proc.stdout)
+        with self._lock:
+            self._closed = True
+            self._inputs.put(None)
+        self._fail_pending()
+
+    def _read_stderr_loop(self) -> None:
+        assert self.proc.stderr is not None
+        try:
+            for line in self.proc.stderr:
+                if line.strip() != "":
+                    self._stderr_logger.log(self._stderr_level, line.rstrip("\n"))
+        except (OSError, ValueError):
+            pass
+        _close_pipe(self.proc.stderr)
+
+    def _is_pending(self, future: "Future[str]") -> bool:
+        """future が出力を待っていれば True を返す．"""
+        with self._lock:
+            return any(pending_future is future for pending_future, _ in self._pending)
+
+    def _detach_pending(self) -> list[tuple["Future[str]", str]]:
+        """これ以上の入力を受け付けないようにし，出力を待っている ``Future`` とその入力を取り出す．
+
+        取り出した ``Future`` はこのプロセスの出力を受け取らなくなる．
+        """
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._inputs.put(None)
+            pending = list(self._pending)
+            self._pending.clear()
+        return pending
+
+    def _fail_pending(self) -> None:
+        with self._lock:
+            pending = list(self._pending)
+            self._pending.clear()
+        for future, _ in pending:
+            future.set_exception(ProcessExitedError("process exited before returning an output"))
+
+
+def _close_pipe(pipe: IO[str]) -> None:
+    try:
+        pipe.close()
+    except (OSError, ValueError):
+        pass
+
+
+class ProcessPool:
+    """同じ解析器の複数のプロセスを管理し，入力を空いているプロセスに割り当てるクラス．
+
+    Args:
+        command: 解析器を起動するコマンド．
+        size: プロセスの数．
+        name: 解析器の名前．エラーメッセージに用いる．None の場合はコマンド名を用いる．
+        delimiter: 1つの入力に対する出力の終わりを表す行．
+        keep_delimiter: True なら，区切り行を出力に含める．
+        stderr_logger: 標準エラー出力を記録するロガー．
+        stderr_level: 標準エラー出力を記録するログレベル．
+
+    .. note::
+        終了したプロセスは，次に入力を割り当てる際に再起動される．
+        出力を待つ間にタイムアウトした場合はその入力を処理しているプロセスを再起動し，
+        同じプロセスで出力を待っている他の入力は新しいプロセスに送り直す．
+    """
+
+    def __init__(
+        self,
+        command: list[str],
+        size: int = 1,
+        name: str | None = None,
+        delimiter: str = "EOS",
+        keep_delimiter: bool = True,
+        stderr_logger: logging.Logger = logger,
+        stderr_level: int = logging.DEBUG,
+    ) -> None:
+        if size < 1:
+            raise ValueError(f"size must be a positive integer: {size}")
+        self.command = command  #: 解析器を起動するコマンド．
+        self.name = name if name is not None else command[0]  #: 解析器の名前．
+        self._delimiter = delimiter
+        self._keep_delimiter = keep_delimiter
+        self._stderr_logger = stderr_logger
+        self._stderr_level = stderr_level
+        self._lock = threading.Lock()
+        self._closed = False
+        self.transports: list[ProcessTransport] = []  #: 各プロセスとの入出力を行うオブジェクト．
+        try:
+            for _ in range(size):
+                self.transports.append(self._start_transport())
+        except Exception:
+            self.close()
+            raise
+
+    def __len__(self) -> int:
+        return len(self.transports)
+
+    def is_alive(self) -> bool:
+        """動作中のプロセスがあれば True を返す．"""
+        return any(transport.is_alive() for transport in self.transports)
+
+    def submit(self, text: str) -> tuple[ProcessTransport, "Future[str]"]:
+        """出力を待っている入力が最も少ないプロセスに入力を送る．
+
+        Args:
+            text: 解析器への入力．改行で終わる必要がある．
+
+        Returns:
+            入力を送ったプロセスとの入出力を行うオブジェクトと，出力を結果とする ``Future`` の組．
+
+        Raises:
+            ProcessExitedError: プロセスが終了しており，再起動もできなかった場合．
+        """
+        with self._lock:
+            if self._closed:
+                raise ProcessExitedError(f"{self.name} has already been closed.")
+            for index, transport in enumerate(self.transports):
+                if not transport.is_alive():
+                    logger.debug(f"restart an exited process: {self.command}")
+                    self._replace(index)
+            alive_transports = [transport for transport in self.transports if transport.is_alive()]
+            if not alive_transports:
+                raise ProcessExitedError(f"{self.name} exited unexpectedly.")
+            transport = min(alive_transports, key=lambda t: t.num_pending)
+        try:
+            return transport, transport.submit(text)
+        except ProcessExitedError:
+            raise ProcessExitedError(f"{self.name} exited unexpectedly.") from None
+
+    def receive(self, transport: ProcessTransport, future: "Future[str]", timeout: float) -> str:
+        """``submit`` で送った入力に対する出力を受け取る．
+
+        Args:
+            transport: 入力を送ったプロセスとの入出力を行うオブジェクト．
+            future: 出力を結果とする ``Future``．
+            timeout: 最大待ち時間．
+
+        Raises:
+            TimeoutError: 最大待ち時間を超えた場合．
+            ProcessExitedError: プロセスが出力を返す前に終了した場合．
+
+        .. note::
+            タイムアウトした場合やプロセスが異常終了した場合はプロセスを再起動する．
+            タイムアウトした場合，同じプロセスで出力を待っている他の入力は新しいプロセスに送り直される．
+        """
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            self._abandon(future)
+            raise TimeoutError(f"Operation timed out after {timeout} seconds.") from None
+        except ProcessExitedError:
+            self.restart(transport)
+            raise ProcessExitedError(f"{self.name} exited unexpectedly.") from None
+
+    async def receive_async(self, transport: ProcessTransport, future: "Future[str]", timeout: float) -> str:
+        """``submit`` で送った入力に対する出力を非同期に受け取る．``receive`` の非同期版．
+
+        .. note::
+            プロセスの再起動はイベントループを止めないよう別のスレッドで行う．
+        """
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except asyncio.TimeoutError:
+            await asyncio.to_thread(self._abandon, future)
+            raise TimeoutError(f"Operation timed out after {timeout} seconds.") from None
+        except ProcessExitedError:
+            await asyncio.to_thread(self.restart, transport)
+            raise ProcessExitedError(f"{self.name} exited unexpectedly.") from None
+
+    def restart(self, transport: ProcessTransport) -> None:
+        """プロセスを再起動する．すでに再起動されているか，プールが閉じられていれば何もしない．
+
+        出力を待っている入力は新しいプロセスに送り直される．
+
+        Args:
+            transport: 再起動するプロセスとの入出力を行うオブジェクト．
+        """
+        with self._lock:
+            if not self._closed and transport in self.transports:
+                self._replace(self.transports.index(transport))
+
+    def close(self) -> None:
+        """すべてのプロセスを終了する．"""
+        with self._lock:
+            self._closed = True
+            for transport in self.transports:
+                transport.close()
+
+    def _abandon(self, future: "Future[str]") -> None:
+        """出力を待つのをやめた入力を取り除き，その入力を処理しているプロセスを再起動する．"""
+        with self._lock:
+            if self._closed:
+                return
+            # The input may have been moved to another process by an earlier restart.
+            for index, transport in enumerate(self.transports):
+                if transport._is_pending(future):
+                    self._replace(index, abandoned=future)
+                    return
+
+    def _replace(self, index: int, abandoned: Optional["Future[str]"] = None) -> None:
+        """index 番目のプロセスを終了し，新しいプロセスに置き換える．起動に失敗した場合は終了したままにする．
+
+        出力を待っている入力は abandoned を除いて新しいプロセスに送り直す．
+        """
+        old_transport = self.transports[index]
+        pending = old_transport._detach_pending()
+        old_transport.close()
+        new_transport: ProcessTransport | None = None
+        try:
+            new_transport = self._start_transport()
+            self.transports[index] = new_transport
+        except OSError as e:
+            logger.warning(f"failed to restart {self.command}: {e}")
+        for future, text in pending:
+            if future is abandoned or new_transport is None:
+                future.set_exception(ProcessExitedError(f"{self.name} exited unexpectedly."))
+            else:
+                new_transport.submit(text, future)
+
+    def _start_transport(self) -> ProcessTransport:
+        proc = Popen(self.command, stdin=PIPE, stdout=PIPE, stderr=PIPE, encoding="utf-8")
+        return ProcessTransport(
+            proc,
+            delimiter=self._delimiter,
+            keep_delimiter=self._keep_delimiter,
+            stderr_logger=self._stderr_logger,
+            stderr_level=self._stderr_level,
+        )
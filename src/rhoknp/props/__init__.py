@@ -1,4 +1,4 @@
-from rhoknp.props.dependency import DepType
+from rhoknp.props.dependency import DependencyArrays, DepType
 from rhoknp.props.feature import FeatureDict
 from rhoknp.props.memo import MemoTag
 from rhoknp.props.named_entity import NamedEntity, NamedEntityCategory
@@ -6,6 +6,7 @@ from rhoknp.props.semantics import SemanticsDict
 
 __all__ = [
     "DepType",
+    "DependencyArrays",
     "FeatureDict",
     "MemoTag",
     "NamedEntity",
@@ -1,3 +1,6 @@
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
 from enum import Enum
 
 
@@ -8,3 +11,92 @@ class DepType(Enum):
     PARALLEL = "P"
     APPOSITION = "A"
     IMPERFECT_PARALLEL = "I"
+
+
+DEP_TYPES: tuple[DepType, ...] = tuple(DepType)  #: 係り受けタイプのコードから係り受けタイプへの対応．
+_DEP_TYPE_CODES: dict[DepType, int] = {dep_type: code for code, dep_type in enumerate(DEP_TYPES)}
+
+
+@dataclass(frozen=True)
+class DependencyArrays:
+    """文内の文節もしくは基本句の係り受け構造を整数の配列で表したもの．
+
+    各配列の i 番目の要素は文内のインデックスが i の単位に対応する．
+    係り受け情報が設定されていない単位は係り先を持たないものとして扱う．
+
+    Example:
+        >>> arrays = sentence.dependency_arrays()
+        >>> children = arrays.children_of(0)  # インデックスが 0 の基本句に係っている基本句のインデックス
+    """
+
+    #: 係り先のインデックス．係り先がない場合は -1．
+    parent_indices: array
+    #: 係り受けタイプのコード．``DEP_TYPES`` のインデックスであり，係り受け情報がない場合は -1．
+    dep_type_codes: array
+    #: CSR 形式における各単位の係り元の開始位置．長さは単位数 + 1．
+    child_offsets: array
+    #: CSR 形式における係り元のインデックス．i 番目の単位の係り元は ``child_offsets[i]`` から ``child_offsets[i + 1]`` まで．
+    child_indices: array
+    #: 根からの深さ．根は 0，係り受けが循環しているなど根に到達できない場合は -1．
+    depths: array
+    #: 係り先が係り元よりも先に現れる順序（根から幅優先）．根に到達できない単位は含まれない．
+    topological_order: array
+
+    def __len__(self) -> int:
+        return len(self.parent_indices)
+
+    def children_of(self, index: int) -> array:
+        """係り元のインデックスの配列を返す．
+
+        Args:
+            index: 係り先のインデックス．
+        """
+        return self.child_indices[self.child_offsets[index] : self.child_offsets[index + 1]]
+
+    @classmethod
+    def from_dependencies(cls, dependencies: Sequence[tuple[int | None, DepType | None]]) -> "DependencyArrays":
+        """係り先のインデックスと係り受けタイプの組の列から作成．
+
+        Args:
+            dependencies: 各単位の係り先のインデックスと係り受けタイプの組の列．
+        """
+        num_units = len(dependencies)
+        parent_indices = array("i", [-1] * num_units)
+        dep_type_codes = array("i", [-1] * num_units)
+        child_counts = [0] * (num_units + 1)
+        for index, (parent_index, dep_type) in enumerate(dependencies):
+            if dep_type is not None:
+                dep_type_codes[index] = _DEP_TYPE_CODES[dep_type]
+            if parent_index is not None and 0 <= parent_index < num_units:
+                parent_indices[index] = parent_index
+                child_counts[parent_index + 1] += 1
+
+        # Build the CSR layout by counting sort; children are ordered by their indices.
+        for index in range(num_units):
+            child_counts[index + 1] += child_counts[index]
+        child_offsets = array("i", child_counts)
+        child_indices = array("i", [0] * child_counts[num_units])
+        positions = child_counts[:num_units]
+        for index, parent_index in enumerate(parent_indices):
+            if parent_index != -1:
+                child_indices[positions[parent_index]] = index
+                positions[parent_index] += 1
+
+        depths = array("i", [-1] * num_units)
+        order = [index for index in range(num_units) if parent_indices[index] == -1]
+        for index in order:
+            depths[index] = 0
+        # `order` grows while being iterated, which makes a breadth-first traversal.
+        for index in order:
+            for child_index in child_indices[child_offsets[index] : child_offsets[index + 1]]:
+                depths[child_index] = depths[index] + 1
+                order.append(child_index)
+
+        return cls(
+            parent_indices=parent_indices,
+            dep_type_codes=dep_type_codes,
+            child_offsets=child_offsets,
+            child_indices=child_indices,
+            depths=depths,
+            topological_order=array("i", order),
+        )
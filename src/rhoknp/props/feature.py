@@ -1,5 +1,6 @@
 import logging
 import re
+import sys
 from typing import ClassVar
 
 logger = logging.getLogger(__name__)
@@ -8,6 +9,8 @@ logger = logging.getLogger(__name__)
 class FeatureDict(dict[str, str | bool]):
     """文節，基本句，形態素の素性情報を表すクラス．"""
 
+    __slots__ = ()
+
     IGNORE_TAG_PREFIXES: ClassVar[set[str]] = {"rel ", "memo "}
     _FEATURE_KEY_PAT: ClassVar[re.Pattern] = re.compile(r"(?P<key>([^:\"]|\"[^\"]*?\")+?)")
     _FEATURE_VALUE_PAT: ClassVar[re.Pattern] = re.compile(r"(?P<value>([^>\\]|\\>?)+)")
@@ -17,6 +20,8 @@ class FeatureDict(dict[str, str | bool]):
     FEATURE_PAT: ClassVar[re.Pattern] = re.compile(
         rf"<(?!({'|'.join(IGNORE_TAG_PREFIXES)})){_FEATURE_KEY_PAT.pattern}(:{_FEATURE_VALUE_PAT.pattern})?>"
     )
+    _IGNORE_TAG_PREFIX_TUPLE: ClassVar[tuple[str, ...]] = tuple(IGNORE_TAG_PREFIXES)
+    _IGNORED_KEYS: ClassVar[frozenset[str]] = frozenset({"rel", "memo"})
 
     def __setitem__(self, key: str, value: str | bool) -> None:
         if key == "rel":
@@ -42,11 +47,70 @@ class FeatureDict(dict[str, str | bool]):
         Args:
             fstring: KNP 形式における素性文字列．
         """
+        split = cls._split_fstring(fstring)
+        if split is not None:
+            return split[0]
         features = cls()
         for match in cls.FEATURE_PAT.finditer(fstring):
-            features[match["key"]] = match["value"].replace(r"\>", ">") if match["value"] is not None else True
+            # Keys are interned since the same keys appear in most units.
+            features[sys.intern(match["key"])] = (
+                match["value"].replace(r"\>", ">") if match["value"] is not None else True
+            )
         return features
 
+    @classmethod
+    def _split_fstring(cls, fstring: str) -> tuple["FeatureDict", list[int]] | None:
+        """素性文字列をタグごとに分割し，素性と無視するタグ（rel タグ，memo タグ）の開始位置を返す．
+
+        タグの内部に "<"，">"，"\\" を含むなど，単純な分割では ``FEATURE_PAT`` と同じ結果が得られない場合は None を返す．
+
+        Args:
+            fstring: KNP 形式における素性文字列．
+        """
+        if fstring == "":
+            return cls(), []
+        if fstring[0] != "<" or fstring[-1] != ">" or "\\" in fstring:
+            return None
+        body = fstring[1:-1]
+        num_tags = body.count("><") + 1
+        # Every "<" and ">" must be a tag boundary, otherwise a tag may span several pieces.
+        if body.count("<") != num_tags - 1 or body.count(">") != num_tags - 1:
+            return None
+        items: list[tuple[str, str | bool]] = []
+        ignored_tag_starts: list[int] = []
+        position = 0
+        for tag in body.split("><"):
+            start = position
+            position += len(tag) + 2
+            if tag.startswith(cls._IGNORE_TAG_PREFIX_TUPLE):
+                ignored_tag_starts.append(start)
+                continue
+            key, sep, value = tag.partition(":")
+            if '"' in key:
+                # A quoted part of a key may contain ":".
+                key_end = cls._find_key_end(tag)
+                if key_end is None:
+                    return None
+                key, sep, value = tag[:key_end], tag[key_end : key_end + 1], tag[key_end + 1 :]
+            if key == "" or (sep and value == "") or key in cls._IGNORED_KEYS:
+                return None
+            items.append((sys.intern(key), value if sep else True))
+        return cls(items), ignored_tag_starts
+
+    @staticmethod
+    def _find_key_end(tag: str) -> int | None:
+        """キーに引用符を含むタグについて，キーの終了位置を返す．引用符が閉じていなければ None を返す．"""
+        position = 0
+        while True:
+            colon = tag.find(":", position)
+            quote = tag.find('"', position)
+            if quote == -1 or (colon != -1 and colon < quote):
+                return len(tag) if colon == -1 else colon
+            closing_quote = tag.find('"', quote + 1)
+            if closing_quote == -1:
+                return None
+            position = closing_quote + 1
+
     def to_fstring(self) -> str:
         """素性文字列に変換．"""
         return "".join(self._item_to_fstring(k, v) for k, v in self.items())
@@ -1,5 +1,6 @@
 import logging
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING, ClassVar, Optional
@@ -51,7 +52,7 @@ class NamedEntity:
         return "".join(m.text for m in self.morphemes)
 
     @classmethod
-    def from_fstring(cls, fstring: str, candidate_morphemes: list["Morpheme"]) -> Optional["NamedEntity"]:
+    def from_fstring(cls, fstring: str, candidate_morphemes: Sequence["Morpheme"]) -> Optional["NamedEntity"]:
         """KNP における素性文字列からオブジェクトを作成．"""
         match = cls.PAT.match(fstring)
         if match is None:
@@ -66,7 +67,7 @@ class NamedEntity:
         if span is None:
             logger.warning(f"{candidate_morphemes[0].sentence.sid}: morpheme span of '{name}' not found")
             return None
-        return NamedEntity(NamedEntityCategory(category), candidate_morphemes[span.start : span.stop])
+        return NamedEntity(NamedEntityCategory(category), list(candidate_morphemes[span.start : span.stop]))
 
     def to_fstring(self) -> str:
         """素性文字列に変換．"""
@@ -74,7 +75,7 @@ class NamedEntity:
         return f"<NE:{self.category.value}:{escaped_text}>"
 
     @staticmethod
-    def _find_morpheme_span(name: str, candidates: list["Morpheme"]) -> range | None:
+    def _find_morpheme_span(name: str, candidates: Sequence["Morpheme"]) -> range | None:
         """固有表現の文字列にマッチする形態素の範囲を返す．
 
         Args:
@@ -1,9 +1,12 @@
 import re
+import sys
 
 
 class SemanticsDict(dict[str, str | bool]):
     """形態素の意味情報を表すクラス．"""
 
+    __slots__ = ("nil",)
+
     NIL = "NIL"
     PAT = re.compile(rf'(?P<sems>("[^"]+?")|{NIL})')
     SEM_PAT = re.compile(r"(?P<key>[^:\s]+)(:(?P<value>\S+))?(\s|$)")
@@ -31,7 +34,7 @@ class SemanticsDict(dict[str, str | bool]):
         semantics = {}
         if not is_nil:
             for match in cls.SEM_PAT.finditer(sstring.strip('"')):
-                semantics[match["key"]] = match["value"] or True
+                semantics[sys.intern(match["key"])] = match["value"] or True
         return cls(semantics, is_nil)
 
     def to_sstring(self) -> str:
@@ -2,7 +2,6 @@ import dataclasses
 import itertools
 import logging
 import re
-from functools import cached_property
 from typing import TYPE_CHECKING, Any, Optional
 
 try:
@@ -11,7 +10,7 @@ except ImportError:
     from typing_extensions import override
 
 from rhoknp.cohesion.argument import Argument, EndophoraArgument, ExophoraArgument
-from rhoknp.cohesion.coreference import Entity, EntityManager
+from rhoknp.cohesion.coreference import Entity
 from rhoknp.cohesion.exophora import ExophoraReferent
 from rhoknp.cohesion.pas import CaseInfoFormat, Pas, normalize_case
 from rhoknp.cohesion.predicate import Predicate
@@ -34,10 +33,23 @@ logger = logging.getLogger(__name__)
 class BasePhrase(Unit):
     """基本句クラス．"""
 
+    __slots__ = (
+        "_morphemes",
+        "_phrase",
+        "dep_type",
+        "entities",
+        "entities_nonidentical",
+        "features",
+        "index",
+        "memo_tag",
+        "parent_index",
+        "pas",
+        "rel_tags",
+    )
+
     PAT = re.compile(
         rf"^\+( (?P<pid>-1|\d+)(?P<dtype>[{''.join(e.value for e in DepType)}]))?( {FeatureDict.PAT.pattern})?$"
     )
-    count = 0
 
     def __init__(
         self,
@@ -64,11 +76,10 @@ class BasePhrase(Unit):
         self.entities: set[Entity] = set()  #: 参照しているエンティティ．
         self.entities_nonidentical: set[Entity] = set()  #: ≒で参照しているエンティティ．
 
-        self.index = self.count  #: 文内におけるインデックス．
-        BasePhrase.count += 1
+        self.index = 0  #: 文内におけるインデックス．
 
     def __getstate__(self) -> dict[str, Any]:
-        state = self.__dict__.copy()
+        state = self._get_slot_state()
         # Dump a tuple instead of a set so that the __hash__ function won't be called.
         # `eids` is used to hash uninitialized Entity objects.
         state["entities"] = tuple(self.entities)
@@ -83,7 +94,8 @@ class BasePhrase(Unit):
             entity.eid = eid
         for entity, eid in zip(state["entities_nonidentical"], state.pop("eids_nonidentical"), strict=True):
             entity.eid = eid
-        self.__dict__.update(state)  # Entity objects are hashed by eid.
+        for name, value in state.items():  # Entity objects are hashed by eid.
+            setattr(self, name, value)
 
     @override
     def __post_init__(self) -> None:
@@ -113,27 +125,34 @@ class BasePhrase(Unit):
 
     @override
     def __hash__(self) -> int:
-        return hash((self.parent_unit, self.index))
+        sentence = self._find_sentence()
+        if sentence is None:
+            return id(self)
+        return hash((sentence, self.index))
 
     @override
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, type(self)):
+        if self is other:
+            return True
+        if not isinstance(other, type(self)) or self.index != other.index:
             return False
-        if self.parent_unit != other.parent_unit:
+        sentence = self._find_sentence()
+        other_sentence = other._find_sentence()
+        if sentence is None or other_sentence is None:
+            # 文に属さない場合はインデックスが定まらないため同一性で比較する
             return False
-        return self.index == other.index
+        return sentence is other_sentence or sentence == other_sentence
+
+    def _find_sentence(self) -> Optional["Sentence"]:
+        """属する文．文に属さない場合は None．"""
+        if self._phrase is not None:
+            return self._phrase._find_sentence()
+        return None
 
-    @cached_property
+    @property
     def global_index(self) -> int:
         """文書全体におけるインデックス．"""
-        if not self.sentence.has_document():
-            return self.index
-        if self.sentence.index == 0:
-            return self.index
-        if self.index > 0:
-            return self.sentence.base_phrases[0].global_index + self.index
-        prev_sentence = self.document.sentences[self.sentence.index - 1]
-        return prev_sentence.base_phrases[0].global_index + len(prev_sentence.base_phrases)
+        return self.sentence._get_global_offset("base_phrases") + self.index
 
     @property
     def parent_unit(self) -> Optional["Phrase"]:
@@ -196,9 +215,12 @@ class BasePhrase(Unit):
         Args:
             morphemes: 形態素のリスト．
         """
-        for morpheme in morphemes:
+        for index, morpheme in enumerate(morphemes):
             morpheme.base_phrase = self
+            morpheme.index = index
         self._morphemes = morphemes
+        # Indices are reassigned over the whole sentence if this base phrase belongs to one.
+        self._clear_cache()
 
     @property
     def head(self) -> Morpheme:
@@ -207,10 +229,11 @@ class BasePhrase(Unit):
         head = self.morphemes[0]
         current_priority = -1
         for morpheme in self.morphemes:
-            if not morpheme.features:
+            features = morpheme._features
+            if not features:
                 continue
             for feature, priority in feature_to_priority.items():
-                if feature in morpheme.features and priority > current_priority:
+                if feature in features and priority > current_priority:
                     head = morpheme
                     current_priority = priority
         return head
@@ -228,14 +251,16 @@ class BasePhrase(Unit):
             return None
         return self.sentence.base_phrases[self.parent_index]
 
-    @cached_property
+    @property
     def children(self) -> list["BasePhrase"]:
         """この基本句に係っている基本句のリスト．
 
         Raises:
             AttributeError: 解析結果にアクセスできない場合．
         """
-        return [base_phrase for base_phrase in self.sentence.base_phrases if base_phrase.parent == self]
+        sentence = self.sentence
+        base_phrases = sentence.base_phrases
+        return [base_phrases[index] for index in sentence.dependency_arrays("base_phrase").children_of(self.index)]
 
     @property
     def entities_all(self) -> set[Entity]:
@@ -253,13 +278,7 @@ class BasePhrase(Unit):
         match = cls.PAT.match(first_line)
         if match is None:
             raise ValueError(f"malformed base phrase line: {first_line}")
-        base_phrase = cls(
-            parent_index=int(match["pid"]) if match["pid"] is not None else None,
-            dep_type=DepType(match["dtype"]) if match["dtype"] is not None else None,
-            features=FeatureDict.from_fstring(match["feats"] or ""),
-            rel_tags=RelTagList.from_fstring(match["feats"] or ""),
-            memo_tag=MemoTag.from_fstring(match["feats"] or ""),
-        )
+        base_phrase = cls._from_match(match)
 
         morphemes: list[Morpheme] = []
         for line in lines:
@@ -269,6 +288,47 @@ class BasePhrase(Unit):
         base_phrase.morphemes = morphemes
         return base_phrase
 
+    @classmethod
+    def _from_match(cls, match: re.Match) -> "BasePhrase":
+        """基本句行にマッチした結果から基本句クラスのインスタンスを初期化．
+
+        Args:
+            match: ``PAT`` による基本句行のマッチ結果．
+        """
+        features, rel_tags, memo_tag = cls._parse_fstring(match["feats"] or "")
+        return cls(
+            parent_index=int(match["pid"]) if match["pid"] is not None else None,
+            dep_type=DepType(match["dtype"]) if match["dtype"] is not None else None,
+            features=features,
+            rel_tags=rel_tags,
+            memo_tag=memo_tag,
+        )
+
+    @staticmethod
+    def _parse_fstring(fstring: str) -> tuple[FeatureDict, RelTagList, MemoTag]:
+        """素性文字列を素性，rel タグ，memo タグに分割．
+
+        Args:
+            fstring: KNP 形式における素性文字列．
+        """
+        split = FeatureDict._split_fstring(fstring)
+        if split is None:
+            return FeatureDict.from_fstring(fstring), RelTagList.from_fstring(fstring), MemoTag.from_fstring(fstring)
+        features, ignored_tag_starts = split
+        # Tags can start only at the positions found by the split, so the patterns are tried only there.
+        rel_tags = RelTagList()
+        memo_match: re.Match | None = None
+        end = 0
+        for start in ignored_tag_starts:
+            if fstring.startswith("<memo ", start):
+                if memo_match is None:
+                    memo_match = MemoTag.PAT.match(fstring, start)
+            elif start >= end and (rel_match := RelTag.PAT.match(fstring, start)) is not None:
+                rel_tags.append(RelTag._from_match(rel_match))
+                end = rel_match.end()
+        memo_tag = MemoTag(text=memo_match["text"]) if memo_match is not None else MemoTag()
+        return features, rel_tags, memo_tag
+
     def to_knp(self) -> str:
         """KNP フォーマットに変換．"""
         ret = "+"
@@ -311,28 +371,30 @@ class BasePhrase(Unit):
     def _add_argument(self, rel_tag: RelTag) -> None:
         """自身を述語とする述語項構造に項を追加．"""
         case = normalize_case(rel_tag.type)
+        entity_manager = self.sentence.entity_manager
         argument: Argument
         if rel_tag.sid is not None:
             arg_base_phrase = self._get_target_base_phrase(rel_tag)
             if arg_base_phrase is None:
                 return
-            if not arg_base_phrase.entities:
-                EntityManager.get_or_create_entity().add_mention(arg_base_phrase)
+            if not entity_manager._get_entities(arg_base_phrase):
+                entity_manager._add_mention(entity_manager.get_or_create_entity(), arg_base_phrase)
             argument = EndophoraArgument(case, arg_base_phrase, self.pas.predicate)
         else:
             if rel_tag.target == "なし":
                 self.pas.set_arguments_optional(case)
                 return
             exophora_referent = ExophoraReferent(rel_tag.target)
-            entity = EntityManager.get_or_create_entity(exophora_referent)
+            entity = entity_manager.get_or_create_entity(exophora_referent)
             argument = ExophoraArgument(case, exophora_referent, entity.eid)
         self.pas.add_argument(argument, mode=rel_tag.mode)
 
     def _add_coreference(self, rel_tag: RelTag) -> None:
         """共参照関係を追加．"""
+        entity_manager = self.sentence.entity_manager
         # create source entity
-        if not self.entities:
-            EntityManager.get_or_create_entity().add_mention(self)
+        if not entity_manager._get_entities(self):
+            entity_manager._add_mention(entity_manager.get_or_create_entity(), self)
 
         is_nonidentical: bool = rel_tag.type.endswith("≒")
         if rel_tag.sid is not None:
@@ -343,30 +405,40 @@ class BasePhrase(Unit):
                 logger.warning(f"{self.sentence.sid}: coreference with self found: {self}")
                 return
             # create target entity
-            if not target_base_phrase.entities:
-                EntityManager.get_or_create_entity().add_mention(target_base_phrase)
-            for source_entity, target_entity in itertools.product(self.entities_all, target_base_phrase.entities_all):
+            if not entity_manager._get_entities(target_base_phrase):
+                entity_manager._add_mention(entity_manager.get_or_create_entity(), target_base_phrase)
+            for source_entity, target_entity in itertools.product(
+                entity_manager._get_entities(self, include_nonidentical=True),
+                entity_manager._get_entities(target_base_phrase, include_nonidentical=True),
+            ):
                 # Because entities are dynamically deleted within this loop, we need to check if they exist.
-                if source_entity in self.entities_all and target_entity in target_base_phrase.entities_all:
-                    EntityManager.merge_entities(
+                source_entities = entity_manager._get_entities(self, include_nonidentical=True)
+                target_entities = entity_manager._get_entities(target_base_phrase, include_nonidentical=True)
+                if source_entity in source_entities and target_entity in target_entities:
+                    entity_manager.merge_entities(
                         self, target_base_phrase, source_entity, target_entity, is_nonidentical
                     )
         else:
             # exophora
-            target_entity = EntityManager.get_or_create_entity(exophora_referent=ExophoraReferent(rel_tag.target))
-            for source_entity in self.entities_all:
+            target_entity = entity_manager.get_or_create_entity(exophora_referent=ExophoraReferent(rel_tag.target))
+            for source_entity in entity_manager._get_entities(self, include_nonidentical=True):
                 # Because entities are dynamically deleted within this loop, we need to check if they exist.
-                if source_entity in self.entities_all and target_entity in EntityManager.entities.values():
-                    EntityManager.merge_entities(self, None, source_entity, target_entity, is_nonidentical)
+                if (
+                    source_entity in entity_manager._get_entities(self, include_nonidentical=True)
+                    and entity_manager.entities.get(target_entity.eid) is target_entity
+                ):
+                    entity_manager.merge_entities(self, None, source_entity, target_entity, is_nonidentical)
 
     def _get_target_base_phrase(self, rel_tag: RelTag) -> Optional["BasePhrase"]:
         """rel_tag が指す基本句を返す．見つからなければ None を返す．"""
-        sentences = self.document.sentences if self.sentence.has_document() else [self.sentence]
-        sentences = [sent for sent in sentences if sent.sid == rel_tag.sid]
-        if not sentences:
+        assert rel_tag.sid is not None
+        if self.sentence.has_document():
+            sentence = self.document.find_sentence(rel_tag.sid)
+        else:
+            sentence = self.sentence if self.sentence.sid == rel_tag.sid else None
+        if sentence is None:
             logger.warning(f"{self.sentence.sid}: relation with unknown sid found: {rel_tag.sid}")
             return None
-        sentence = sentences[0]
         assert rel_tag.base_phrase_index is not None
         if rel_tag.base_phrase_index >= len(sentence.base_phrases):
             logger.warning(f"{self.sentence.sid}: index out of range")
@@ -1,5 +1,4 @@
 import logging
-from functools import cached_property
 from typing import TYPE_CHECKING, Optional
 
 try:
@@ -23,7 +22,17 @@ logger = logging.getLogger(__name__)
 class Clause(Unit):
     """節クラス．"""
 
-    count = 0
+    __slots__ = (
+        "_base_phrases_cache",
+        "_children_cache",
+        "_head_cache",
+        "_morphemes_cache",
+        "_parent_index_cache",
+        "_phrases",
+        "_sentence",
+        "discourse_relations",
+        "index",
+    )
 
     def __init__(self) -> None:
         super().__init__()
@@ -34,10 +43,18 @@ class Clause(Unit):
         # child units
         self._phrases: list[Phrase] | None = None
 
+        # caches of flattened views
+        self._base_phrases_cache: tuple[BasePhrase, ...] | None = None
+        self._morphemes_cache: tuple[Morpheme, ...] | None = None
+
         self.discourse_relations: list[DiscourseRelation] = []  #: 談話関係のリスト．
 
-        self.index = self.count  #: 文内におけるインデックス．
-        Clause.count += 1
+        self.index = 0  #: 文内におけるインデックス．
+
+        # caches of derived values
+        self._head_cache: BasePhrase | None = None
+        self._parent_index_cache: int | None = None  # -1 if the clause has no parent
+        self._children_cache: list["Clause"] | None = None
 
     @override
     def __post_init__(self) -> None:
@@ -72,27 +89,45 @@ class Clause(Unit):
 
     @override
     def __hash__(self) -> int:
-        return hash((self.parent_unit, self.index))
+        sentence = self._find_sentence()
+        if sentence is None:
+            return id(self)
+        return hash((sentence, self.index))
 
     @override
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, type(self)):
+        if self is other:
+            return True
+        if not isinstance(other, type(self)) or self.index != other.index:
             return False
-        if self.parent_unit != other.parent_unit:
+        sentence = self._find_sentence()
+        other_sentence = other._find_sentence()
+        if sentence is None or other_sentence is None:
+            # 文に属さない場合はインデックスが定まらないため同一性で比較する
             return False
-        return self.index == other.index
+        return sentence is other_sentence or sentence == other_sentence
+
+    def _find_sentence(self) -> Optional["Sentence"]:
+        """属する文．文に属さない場合は None．"""
+        return self._sentence
+
+    @override
+    def _clear_cache(self) -> None:
+        self._base_phrases_cache = None
+        self._morphemes_cache = None
+        self._head_cache = None
+        self._clear_relation_cache()
+        super()._clear_cache()
+
+    def _clear_relation_cache(self) -> None:
+        """他の節にも依存する係り先と係り元のキャッシュを破棄．文の言語単位が更新された際に呼び出される．"""
+        self._parent_index_cache = None
+        self._children_cache = None
 
-    @cached_property
+    @property
     def global_index(self) -> int:
         """文書全体におけるインデックス．"""
-        if not self.sentence.has_document():
-            return self.index
-        if self.sentence.index == 0:
-            return self.index
-        if self.index > 0:
-            return self.sentence.clauses[0].global_index + self.index
-        prev_sentence = self.document.sentences[self.sentence.index - 1]
-        return prev_sentence.clauses[0].global_index + len(prev_sentence.clauses)
+        return self.sentence._get_global_offset("clauses") + self.index
 
     @property
     def parent_unit(self) -> Optional["Sentence"]:
@@ -141,23 +176,46 @@ class Clause(Unit):
         Args:
             phrases: 文節のリスト．
         """
-        for phrase in phrases:
+        for index, phrase in enumerate(phrases):
             phrase.clause = self
+            phrase.index = index
+        base_phrases = [base_phrase for phrase in phrases for base_phrase in phrase.base_phrases]
+        for index, base_phrase in enumerate(base_phrases):
+            base_phrase.index = index
+        for index, morpheme in enumerate(
+            morpheme for base_phrase in base_phrases for morpheme in base_phrase.morphemes
+        ):
+            morpheme.index = index
         self._phrases = phrases
+        # Indices are reassigned over the whole sentence if this clause belongs to one.
+        self._clear_cache()
 
     @property
-    def base_phrases(self) -> list[BasePhrase]:
+    def base_phrases(self) -> tuple[BasePhrase, ...]:
         """基本句のリスト．"""
-        return [base_phrase for phrase in self.phrases for base_phrase in phrase.base_phrases]
+        if self._base_phrases_cache is None:
+            self._base_phrases_cache = tuple(
+                base_phrase for phrase in self.phrases for base_phrase in phrase.base_phrases
+            )
+        return self._base_phrases_cache
 
     @property
-    def morphemes(self) -> list[Morpheme]:
+    def morphemes(self) -> tuple[Morpheme, ...]:
         """形態素のリスト．"""
-        return [morpheme for base_phrase in self.base_phrases for morpheme in base_phrase.morphemes]
+        if self._morphemes_cache is None:
+            self._morphemes_cache = tuple(
+                morpheme for base_phrase in self.base_phrases for morpheme in base_phrase.morphemes
+            )
+        return self._morphemes_cache
 
-    @cached_property
+    @property
     def head(self) -> BasePhrase:
         """節主辞の基本句．"""
+        if self._head_cache is None:
+            self._head_cache = self._find_head()
+        return self._head_cache
+
+    def _find_head(self) -> BasePhrase:
         heads: list[BasePhrase] = []
         for base_phrase in self.base_phrases:
             if "節-主辞" in base_phrase.features:
@@ -176,21 +234,30 @@ class Clause(Unit):
         """節区切の基本句．"""
         return self.base_phrases[-1]
 
-    @cached_property
+    @property
     def parent(self) -> Optional["Clause"]:
         """係り先の節．ないなら None．"""
+        if self._parent_index_cache is None:
+            self._parent_index_cache = self._find_parent_index()
+        if self._parent_index_cache == -1:
+            return None
+        return self.sentence.clauses[self._parent_index_cache]
+
+    def _find_parent_index(self) -> int:
         head_parent = self.head.parent
         while head_parent in self.base_phrases:
             head_parent = head_parent.parent
         for clause in self.sentence.clauses:
             if head_parent in clause.base_phrases:
-                return clause
-        return None
+                return clause.index
+        return -1
 
-    @cached_property
+    @property
     def children(self) -> list["Clause"]:
         """この節に係っている節のリスト．"""
-        return [clause for clause in self.sentence.clauses if clause.parent == self]
+        if self._children_cache is None:
+            self._children_cache = [clause for clause in self.sentence.clauses if clause.parent == self]
+        return self._children_cache
 
     def is_adnominal(self) -> bool:
         """連体修飾節なら True．"""
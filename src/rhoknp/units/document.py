@@ -6,6 +6,7 @@ try:
 except ImportError:
     from typing_extensions import override
 
+from rhoknp.cohesion.coreference import EntityManager
 from rhoknp.cohesion.pas import Pas
 from rhoknp.props.named_entity import NamedEntity
 from rhoknp.units.base_phrase import BasePhrase
@@ -14,7 +15,9 @@ from rhoknp.units.morpheme import Morpheme
 from rhoknp.units.phrase import Phrase
 from rhoknp.units.sentence import Sentence
 from rhoknp.units.unit import Unit
+from rhoknp.utils.binary import decode_sentences, encode_sentences
 from rhoknp.utils.comment import is_comment_line
+from rhoknp.utils.table import MorphemeTable
 
 logger = logging.getLogger(__name__)
 
@@ -28,27 +31,36 @@ class Document(Unit):
 
     EOD = "EOD"
 
-    count = 0
-
     def __init__(self, text: str | None = None) -> None:
         super().__init__()
 
-        Sentence.count = 0
-
         # child units
         self._sentences: list[Sentence] | None = None
 
+        # caches of flattened views
+        self._clauses_cache: tuple[Clause, ...] | None = None
+        self._phrases_cache: tuple[Phrase, ...] | None = None
+        self._base_phrases_cache: tuple[BasePhrase, ...] | None = None
+        self._morphemes_cache: tuple[Morpheme, ...] | None = None
+        self._pas_list_cache: tuple[Pas, ...] | None = None
+        # index to look up sentences by their sentence IDs
+        self._sid_to_sentence: dict[str, Sentence] = {}
+        # prefix sums of the numbers of units (or characters) in the preceding sentences
+        self._prefix_offsets_cache: dict[str, list[int]] = {}
+
         if text is not None:
             self.text = text
 
-        self.index = self.count
-        Document.count += 1
-
+        self.index = 0  #: インデックス．後方互換性のために残しており，常に 0．
         self.doc_id: str = ""  #: 文書 ID．
 
+        self.entity_manager = EntityManager()  #: 文書中のエンティティを管理するオブジェクト．
+
     @override
     def __post_init__(self) -> None:
-        super().__post_init__()
+        # Coreference relations across sentences are merged in a batch and reflected to entities at the end.
+        with self.entity_manager._batch():
+            super().__post_init__()
 
         # Set doc_id.
         if not self.is_senter_required() and len(self.sentences) > 0:
@@ -69,6 +81,49 @@ class Document(Unit):
             return False
         return self.doc_id == other.doc_id and self.text == other.text
 
+    @override
+    def _clear_cache(self) -> None:
+        self._clauses_cache = None
+        self._phrases_cache = None
+        self._base_phrases_cache = None
+        self._morphemes_cache = None
+        self._pas_list_cache = None
+        self._prefix_offsets_cache = {}
+        super()._clear_cache()
+
+    def _get_prefix_offsets(self, attr: str) -> list[int]:
+        """各文より前にある言語単位の数もしくは文字数の累積和を取得．
+
+        Args:
+            attr: "clauses"，"phrases"，"base_phrases"，"morphemes"，"text" のいずれか．
+
+        Raises:
+            AttributeError: 解析結果にアクセスできない場合．
+
+        .. note::
+            i 番目の要素が i 番目の文より前にある言語単位の数（もしくは文字数）を表す．
+            結果は文のリストが更新されるまでキャッシュされる．
+        """
+        offsets = self._prefix_offsets_cache.get(attr)
+        if offsets is None:
+            offsets = [0]
+            for sentence in self.sentences:
+                offsets.append(offsets[-1] + len(getattr(sentence, attr)))
+            self._prefix_offsets_cache[attr] = offsets
+        return offsets
+
+    def _parse_knp_lines(self) -> None:
+        """遅延読み込みされた文の解析結果を構築し，文書全体に対する追加処理を文の順に行う．"""
+        sentences = [sentence for sentence in self.sentences if sentence._knp_lines is not None]
+        for sentence in sentences:
+            assert sentence._knp_lines is not None
+            sentence._build_from_knp_lines(sentence._knp_lines)
+        with self.entity_manager._batch():
+            for sentence in sentences:
+                if sentence._post_init_on_parse is True:
+                    sentence._post_init_on_parse = False
+                    sentence.__post_init__()
+
     @property
     def parent_unit(self) -> None:
         """上位の言語単位．文書は最上位の言語単位なので常に None．"""
@@ -111,45 +166,80 @@ class Document(Unit):
         Args:
             sentences: 文のリスト．
         """
-        for sentence in sentences:
+        for index, sentence in enumerate(sentences):
             sentence.document = self
+            sentence.index = index
         self._sentences = sentences
+        self._build_sid_index()
+        self._clear_cache()
+
+    def find_sentence(self, sid: str) -> Sentence | None:
+        """文 ID から文を検索．見つからなければ None．
+
+        Args:
+            sid: 文 ID．
+
+        .. note::
+            同じ文 ID を持つ文が複数ある場合は最初の文を返す．
+        """
+        sentence = self._sid_to_sentence.get(sid)
+        if sentence is None or sentence.sid != sid:
+            # The index may be stale if sentence IDs have been edited.
+            self._build_sid_index()
+            sentence = self._sid_to_sentence.get(sid)
+        return sentence
+
+    def _build_sid_index(self) -> None:
+        """文 ID から文への索引を作成．"""
+        self._sid_to_sentence = {}
+        for sentence in self._sentences or []:
+            self._sid_to_sentence.setdefault(sentence.sid, sentence)
 
     @property
-    def clauses(self) -> list[Clause]:
+    def clauses(self) -> tuple[Clause, ...]:
         """節のリスト．
 
         Raises:
             AttributeError: 解析結果にアクセスできない場合．
         """
-        return [clause for sentence in self.sentences for clause in sentence.clauses]
+        if self._clauses_cache is None:
+            self._clauses_cache = tuple(clause for sentence in self.sentences for clause in sentence.clauses)
+        return self._clauses_cache
 
     @property
-    def phrases(self) -> list[Phrase]:
+    def phrases(self) -> tuple[Phrase, ...]:
         """文節のリスト．
 
         Raises:
             AttributeError: 解析結果にアクセスできない場合．
         """
-        return [phrase for sentence in self.sentences for phrase in sentence.phrases]
+        if self._phrases_cache is None:
+            self._phrases_cache = tuple(phrase for sentence in self.sentences for phrase in sentence.phrases)
+        return self._phrases_cache
 
     @property
-    def base_phrases(self) -> list[BasePhrase]:
+    def base_phrases(self) -> tuple[BasePhrase, ...]:
         """基本句のリスト．
 
         Raises:
             AttributeError: 解析結果にアクセスできない場合．
         """
-        return [base_phrase for sentence in self.sentences for base_phrase in sentence.base_phrases]
+        if self._base_phrases_cache is None:
+            self._base_phrases_cache = tuple(
+                base_phrase for sentence in self.sentences for base_phrase in sentence.base_phrases
+            )
+        return self._base_phrases_cache
 
     @property
-    def morphemes(self) -> list[Morpheme]:
+    def morphemes(self) -> tuple[Morpheme, ...]:
         """形態素のリスト．
 
         Raises:
             AttributeError: 解析結果にアクセスできない場合．
         """
-        return [morpheme for sentence in self.sentences for morpheme in sentence.morphemes]
+        if self._morphemes_cache is None:
+            self._morphemes_cache = tuple(morpheme for sentence in self.sentences for morpheme in sentence.morphemes)
+        return self._morphemes_cache
 
     @property
     def named_entities(self) -> list[NamedEntity]:
@@ -161,13 +251,25 @@ class Document(Unit):
         return [ne for sentence in self.sentences for ne in sentence.named_entities]
 
     @property
-    def pas_list(self) -> list[Pas]:
+    def pas_list(self) -> tuple[Pas, ...]:
         """述語項構造のリスト．
 
         Raises:
             AttributeError: 解析結果にアクセスできない場合．
         """
-        return [pas for sentence in self.sentences for pas in sentence.pas_list]
+        if self._pas_list_cache is None:
+            self._pas_list_cache = tuple(pas for sentence in self.sentences for pas in sentence.pas_list)
+        return self._pas_list_cache
+
+    def morpheme_table(self) -> MorphemeTable:
+        """形態素の属性を列ごとに格納した表を作成．
+
+        基本句のインデックスと文字レベルのスパンは文書全体における位置を表す．
+
+        Raises:
+            AttributeError: 解析結果にアクセスできない場合．
+        """
+        return MorphemeTable.from_sentences(self.sentences)
 
     @classmethod
     def from_raw_text(cls, text: str) -> "Document":
@@ -302,11 +404,13 @@ class Document(Unit):
         return document
 
     @classmethod
-    def from_knp(cls, knp_text: str) -> "Document":
+    def from_knp(cls, knp_text: str, lazy: bool = False) -> "Document":
         """文書クラスのインスタンスを KNP の解析結果から初期化．
 
         Args:
             knp_text: KNP の解析結果．
+            lazy: True なら各文の文 ID と文字列のみを読み込み，節・文節・基本句・形態素などは
+                いずれかの文の解析結果に最初にアクセスされた際に構築する．
 
         Raises:
             ValueError: 解析結果読み込み中にエラーが発生した場合．
@@ -348,25 +452,45 @@ class Document(Unit):
 
         .. note::
             複数文の解析結果が含まれている場合，一つの文書として扱われる．
+            ``lazy`` が True の場合，解析結果の形式の誤りは解析結果が構築される際に報告される．
         """
         document = cls()
         sentences = []
         sentence_lines: list[str] = []
         for line in knp_text.split("\n"):
-            if line.strip() == "":
+            if not line or line.isspace():
                 continue
             sentence_lines.append(line)
             if line.strip() == Sentence.EOS:
-                sentences.append(Sentence.from_knp("\n".join(sentence_lines) + "\n", post_init=False))
+                sentences.append(Sentence._from_knp_lines(sentence_lines, post_init=False, lazy=lazy))
                 sentence_lines = []
         if sentence_lines:
             logger.warning(f"the last sentence does not end with EOS: {sentence_lines}")
             sentence_lines.append(Sentence.EOS)
-            sentences.append(Sentence.from_knp("\n".join(sentence_lines) + "\n", post_init=False))
+            sentences.append(Sentence._from_knp_lines(sentence_lines, post_init=False, lazy=lazy))
         document.sentences = sentences
         document.__post_init__()
         return document
 
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Document":
+        """文書クラスのインスタンスを ``to_bytes`` によって作成されたバイナリから初期化．
+
+        Args:
+            data: バイナリ形式の文書．
+
+        Raises:
+            ValueError: 形式が正しくない，もしくはバージョンが異なる場合．
+        """
+        sentences, text = decode_sentences(data)
+        if sentences is None:
+            document = cls(text)
+        else:
+            document = cls()
+            document.sentences = sentences
+        document.__post_init__()
+        return document
+
     def is_senter_required(self) -> bool:
         """文分割がまだなら True．"""
         return self._sentences is None
@@ -422,3 +546,14 @@ class Document(Unit):
             AttributeError: 解析結果にアクセスできない場合．
         """
         return "".join(sentence.to_knp() for sentence in self.sentences)
+
+    def to_bytes(self) -> bytes:
+        """バイナリ形式に変換．
+
+        .. note::
+            ``from_bytes`` によって KNP 形式から読み込むよりも高速に復元できる．
+            解析済みのコーパスをキャッシュする用途を想定しており，形式は rhoknp のバージョン間で互換性を持たない場合がある．
+        """
+        if self.is_senter_required():
+            return encode_sentences(None, self.text)
+        return encode_sentences(self.sentences)
@@ -1,5 +1,6 @@
 import re
-from functools import cached_property
+import sys
+import warnings
 from typing import TYPE_CHECKING, ClassVar, Optional, Union
 
 try:
@@ -20,7 +21,34 @@ if TYPE_CHECKING:
 
 
 class Morpheme(Unit):
-    """形態素クラス．"""
+    """形態素クラス．
+
+    .. note::
+        大規模なコーパスを扱う際のメモリ使用量を抑えるため ``__slots__`` を用いている．
+        意味情報，素性，同形の形態素のリストは最初にアクセスされた際に作成される．
+
+    .. deprecated::
+        引数 ``homograph`` は効果がなく，指定すると ``DeprecationWarning`` を送出する．
+    """
+
+    __slots__ = (
+        "_base_phrase",
+        "_features",
+        "_homographs",
+        "_semantics",
+        "_sentence",
+        "conjform",
+        "conjform_id",
+        "conjtype",
+        "conjtype_id",
+        "index",
+        "lemma",
+        "pos",
+        "pos_id",
+        "reading",
+        "subpos",
+        "subpos_id",
+    )
 
     _ATTRIBUTES = (
         "surf",
@@ -64,8 +92,6 @@ class Morpheme(Unit):
     _ESCAPE_MAP_CONTROL_CHAR: ClassVar[dict[str, str]] = {"\t": r"\t", " ": r"\␣"}
     _UNESCAPE_MAP_CONTROL_CHAR: ClassVar[dict[str, str]] = {v: k for k, v in _ESCAPE_MAP_CONTROL_CHAR.items()}
 
-    count = 0
-
     def __init__(
         self,
         text: str,
@@ -81,58 +107,67 @@ class Morpheme(Unit):
         conjform_id: int,
         semantics: SemanticsDict | None = None,
         features: FeatureDict | None = None,
-        homograph: bool = False,
+        homograph: bool | None = None,
     ) -> None:
         super().__init__()
+        if homograph is not None:
+            warnings.warn("'homograph' is deprecated and has no effect.", DeprecationWarning, stacklevel=2)
         self.text = text
         self.reading = reading  #: 読み．
         self.lemma = lemma  #: 原形．
-        self.pos = pos  #: 品詞．
+        # POS tags come from a small closed vocabulary and are interned so that equal values share one object.
+        self.pos = sys.intern(pos)  #: 品詞．
         self.pos_id = pos_id  #: 品詞ID．
-        self.subpos = subpos  #: 品詞細分類．
+        self.subpos = sys.intern(subpos)  #: 品詞細分類．
         self.subpos_id = subpos_id  #: 品詞細分類ID．
-        self.conjtype = conjtype  #: 活用型．
+        self.conjtype = sys.intern(conjtype)  #: 活用型．
         self.conjtype_id = conjtype_id  #: 活用型ID．
-        self.conjform = conjform  #: 活用形ID．
+        self.conjform = sys.intern(conjform)  #: 活用形ID．
         self.conjform_id = conjform_id  #: 活用形ID．
 
         # parent unit
         self._base_phrase: "BasePhrase" | None = None
         self._sentence: "Sentence" | None = None
 
-        self.semantics: SemanticsDict = (
-            semantics if semantics is not None else SemanticsDict()
-        )  #: 辞書に記載の意味情報．
-        self.features: FeatureDict = features if features is not None else FeatureDict()  #: 素性．
-        self.homographs: list["Morpheme"] = []  #: 同形の形態素のリスト．
+        # allocated on first access
+        self._semantics: SemanticsDict | None = semantics
+        self._features: FeatureDict | None = features
+        self._homographs: list["Morpheme"] | None = None
 
-        self.index = self.count  #: 文内におけるインデックス．
-        if homograph is False:
-            Morpheme.count += 1
+        self.index = 0  #: 文内におけるインデックス．
 
     @override
     def __hash__(self) -> int:
-        return hash((self.parent_unit, self.index))
+        sentence = self._find_sentence()
+        if sentence is None:
+            return id(self)
+        return hash((sentence, self.index))
 
     @override
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, type(self)):
+        if self is other:
+            return True
+        if not isinstance(other, type(self)) or self.index != other.index:
             return False
-        if self.parent_unit != other.parent_unit:
+        sentence = self._find_sentence()
+        other_sentence = other._find_sentence()
+        if sentence is None or other_sentence is None:
+            # 文に属さない場合はインデックスが定まらないため同一性で比較する
             return False
-        return self.index == other.index
+        return sentence is other_sentence or sentence == other_sentence
+
+    def _find_sentence(self) -> Optional["Sentence"]:
+        """属する文．文に属さない場合は None．"""
+        if self._sentence is not None:
+            return self._sentence
+        if self._base_phrase is not None:
+            return self._base_phrase._find_sentence()
+        return None
 
-    @cached_property
+    @property
     def global_index(self) -> int:
         """文書全体におけるインデックス．"""
-        if not self.sentence.has_document():
-            return self.index
-        if self.sentence.index == 0:
-            return self.index
-        if self.index > 0:
-            return self.sentence.morphemes[0].global_index + self.index
-        prev_sentence = self.document.sentences[self.sentence.index - 1]
-        return prev_sentence.morphemes[0].global_index + len(prev_sentence.morphemes)
+        return self.sentence._get_global_offset("morphemes") + self.index
 
     @property
     def parent_unit(self) -> Union["BasePhrase", "Sentence"] | None:
@@ -213,6 +248,54 @@ class Morpheme(Unit):
         """
         self._base_phrase = base_phrase
 
+    @property
+    def semantics(self) -> SemanticsDict:
+        """辞書に記載の意味情報．"""
+        if self._semantics is None:
+            self._semantics = SemanticsDict()
+        return self._semantics
+
+    @semantics.setter
+    def semantics(self, semantics: SemanticsDict) -> None:
+        """辞書に記載の意味情報．
+
+        Args:
+            semantics: 辞書に記載の意味情報．
+        """
+        self._semantics = semantics
+
+    @property
+    def features(self) -> FeatureDict:
+        """素性．"""
+        if self._features is None:
+            self._features = FeatureDict()
+        return self._features
+
+    @features.setter
+    def features(self, features: FeatureDict) -> None:
+        """素性．
+
+        Args:
+            features: 素性．
+        """
+        self._features = features
+
+    @property
+    def homographs(self) -> list["Morpheme"]:
+        """同形の形態素のリスト．"""
+        if self._homographs is None:
+            self._homographs = []
+        return self._homographs
+
+    @homographs.setter
+    def homographs(self, homographs: list["Morpheme"]) -> None:
+        """同形の形態素のリスト．
+
+        Args:
+            homographs: 同形の形態素のリスト．
+        """
+        self._homographs = homographs
+
     @property
     def surf(self) -> str:
         """表層表現．"""
@@ -221,7 +304,9 @@ class Morpheme(Unit):
     @property
     def canon(self) -> str | None:
         """代表表記．"""
-        canon = self.semantics.get("代表表記")
+        if self._semantics is None:
+            return None
+        canon = self._semantics.get("代表表記")
         assert canon is None or isinstance(canon, str)
         return canon
 
@@ -235,7 +320,7 @@ class Morpheme(Unit):
         """Juman++ フォーマットの素性．"""
         return self.features.to_fstring()
 
-    @cached_property
+    @property
     def parent(self) -> Optional["Morpheme"]:
         """係り先の形態素．ないなら None．"""
         if self.base_phrase.head == self:
@@ -244,29 +329,30 @@ class Morpheme(Unit):
             return None
         return self.base_phrase.head
 
-    @cached_property
+    @property
     def span(self) -> tuple[int, int]:
         """文における文字レベルのスパン．"""
-        if self.index == 0:
-            start = 0
-        else:
-            _, start = self.sentence.morphemes[self.index - 1].span
+        start = self.sentence._get_morpheme_offsets()[self.index]
         end = start + len(self.text)  # TODO: correctly handle multibyte characters
         return start, end
 
-    @cached_property
+    @property
     def global_span(self) -> tuple[int, int]:
         """文書全体における文字レベルのスパン．"""
-        offset = 0
-        for prev_sentence in self.document.sentences[: self.sentence.index]:
-            offset += len(prev_sentence.text)
+        offset = self.document._get_prefix_offsets("text")[self.sentence.index]
         start, end = self.span
         return start + offset, end + offset
 
-    @cached_property
+    @property
     def children(self) -> list["Morpheme"]:
-        """この形態素に係っている形態素のリスト．"""
-        return [morpheme for morpheme in self.sentence.morphemes if morpheme.parent == self]
+        """この形態素に係っている形態素のリスト．
+
+        Raises:
+            AttributeError: 解析結果にアクセスできない場合．
+        """
+        sentence = self.sentence
+        morphemes = sentence.morphemes
+        return [morphemes[index] for index in sentence.dependency_arrays("morpheme").children_of(self.index)]
 
     @classmethod
     def from_jumanpp(cls, jumanpp_text: str) -> "Morpheme":
@@ -282,69 +368,122 @@ class Morpheme(Unit):
         morpheme = cls._from_jumanpp_line(first_line)
         for line in lines:
             assert cls.is_homograph_line(line)
-            homograph = cls._from_jumanpp_line(line[2:], homograph=True)
+            homograph = cls._from_jumanpp_line(line[2:])
             morpheme.homographs.append(homograph)
         return morpheme
 
     @classmethod
-    def _from_jumanpp_line(cls, jumanpp_line: str, homograph: bool = False) -> "Morpheme":
+    def _from_jumanpp_line(cls, jumanpp_line: str) -> "Morpheme":
         """形態素クラスのインスタンスを Juman++ の解析結果から初期化．
 
         Args:
             jumanpp_line: Juman++ の解析結果．
-            homograph: 同形かどうかを表すフラグ．
 
         Raises:
             ValueError: 解析結果読み込み中にエラーが発生した場合．
         """
-        match = cls.PAT.match(jumanpp_line) or cls.PAT_REPEATED.match(jumanpp_line)
-        if match is None:
+        tokens = cls._tokenize_jumanpp_line(jumanpp_line)
+        if tokens is None:
             raise ValueError(f"malformed morpheme line: {jumanpp_line}")
-        match_attr = cls._ATTRIBUTE_PAT.match(match["attrs"]) or cls._ATTRIBUTE_PAT_REPEATED.match(match["attrs"])
-        assert match_attr is not None
-        attributes = match_attr.groups()
-        surf, reading, lemma = match["surf"], attributes[0], attributes[1]
-        semantics = SemanticsDict.from_sstring(match["sems"] or "")
+        attributes, sstring, fstring = tokens
+        surf, reading, lemma = attributes[0], attributes[1], attributes[2]
+        semantics = SemanticsDict.from_sstring(sstring) if sstring else None
 
         # Resume text if it is escaped (Juman++ 2.0.0-rc3)
-        if semantics.get("元半角") is True:
+        if semantics is not None and semantics.get("元半角") is True:
             surf, reading, lemma = (  # pragma: no cover
                 cls._UNESCAPE_MAP_HALF_TO_FULL_WIDTH.get(s, s) for s in (surf, reading, lemma)
             )
-        surf, reading, lemma = (cls._UNESCAPE_MAP_CONTROL_CHAR.get(s, s) for s in (surf, reading, lemma))
+        unescape_map = cls._UNESCAPE_MAP_CONTROL_CHAR
+        surf, reading, lemma = (
+            unescape_map.get(surf, surf),
+            unescape_map.get(reading, reading),
+            unescape_map.get(lemma, lemma),
+        )
 
         return cls(
             surf,
             reading,
             lemma,
-            attributes[2],
-            int(attributes[3]),
-            attributes[4],
-            int(attributes[5]),
-            attributes[6],
-            int(attributes[7]),
-            attributes[8],
-            int(attributes[9]),
+            attributes[3],
+            int(attributes[4]),
+            attributes[5],
+            int(attributes[6]),
+            attributes[7],
+            int(attributes[8]),
+            attributes[9],
+            int(attributes[10]),
             semantics=semantics,
-            features=FeatureDict.from_fstring(match["feats"] or ""),
-            homograph=homograph,
+            features=FeatureDict.from_fstring(fstring) if fstring else None,
         )
 
+    @classmethod
+    def _tokenize_jumanpp_line(cls, jumanpp_line: str) -> tuple[list[str], str | None, str | None] | None:
+        """形態素行を 11 個の属性，意味情報文字列，素性文字列に分割．形態素行でなければ None を返す．
+
+        空白を含まない属性は空白で分割するだけで取り出し，そうでない行は正規表現で解析する．
+        """
+        fields = jumanpp_line.split(" ", 11)
+        if (
+            len(fields) >= 11
+            and fields[4].isdecimal()
+            and fields[6].isdecimal()
+            and fields[8].isdecimal()
+            and fields[10].isdecimal()
+            and all(fields[:4])
+            and fields[5]
+            and fields[7]
+            and fields[9]
+        ):
+            tail = cls._split_jumanpp_tail(fields[11] if len(fields) == 12 else "")
+            if tail is not None:
+                return fields[:11], *tail
+
+        # Surface strings containing spaces cannot be split by spaces.
+        if jumanpp_line.count(" ") < 10:
+            return None
+        match = cls.PAT.match(jumanpp_line) or cls.PAT_REPEATED.match(jumanpp_line)
+        if match is None:
+            return None
+        match_attr = cls._ATTRIBUTE_PAT.match(match["attrs"]) or cls._ATTRIBUTE_PAT_REPEATED.match(match["attrs"])
+        assert match_attr is not None
+        return [match["surf"], *match_attr.groups()], match["sems"], match["feats"]
+
+    @staticmethod
+    def _split_jumanpp_tail(tail: str) -> tuple[str | None, str | None] | None:
+        """属性に続く部分を意味情報文字列と素性文字列に分割．形式に合わなければ None を返す．"""
+        sstring: str | None = None
+        if tail.startswith('"'):
+            end = tail.find('"', 1)
+            if end <= 1:
+                return None
+            sstring, tail = tail[: end + 1], tail[end + 1 :]
+        elif tail.startswith(SemanticsDict.NIL):
+            sstring, tail = SemanticsDict.NIL, tail[len(SemanticsDict.NIL) :]
+        if sstring is not None and tail:
+            # The semantics string and the feature string are separated by a space.
+            if not tail.startswith(" "):
+                return None
+            tail = tail[1:]
+        if tail and FeatureDict.PAT.fullmatch(tail) is None:
+            return None
+        return sstring, tail or None
+
     def to_jumanpp(self) -> str:
         """Juman++ フォーマットに変換．"""
         ret = self._to_jumanpp_line()
-        if self.features:
-            ret += f" {self.features.to_fstring()}"
+        if self._features:
+            ret += f" {self._features.to_fstring()}"
         ret += "\n"
-        for homograph in self.homographs:
+        for homograph in self._homographs or ():
             ret += f"@ {homograph.to_jumanpp()}"
         return ret
 
     def to_knp(self) -> str:
         """KNP フォーマットに変換．"""
         ret = self._to_jumanpp_line()
-        features = FeatureDict(self.features)  # deep copy
-        for homograph in self.homographs:
+        features = FeatureDict(self._features or {})  # deep copy
+        for homograph in self._homographs or ():
             alt_feature_key = "ALT-{}-{}-{}-{}-{}-{}-{}-{}".format(  # noqa: UP032
                 homograph.surf,
                 homograph.reading,
@@ -370,14 +509,14 @@ class Morpheme(Unit):
                 attr = self._ESCAPE_MAP_CONTROL_CHAR.get(attr, attr)
             attrs.append(str(attr))
         ret = " ".join(attrs)
-        if self.semantics or self.semantics.is_nil():
-            ret += f" {self.semantics.to_sstring()}"
+        if self._semantics is not None and (self._semantics or self._semantics.is_nil()):
+            ret += f" {self._semantics.to_sstring()}"
         return ret
 
     @staticmethod
     def is_morpheme_line(line: str) -> bool:
         """形態素行なら True を返す．"""
-        return Morpheme.PAT.match(line) is not None or Morpheme.PAT_REPEATED.match(line) is not None
+        return Morpheme._tokenize_jumanpp_line(line) is not None
 
     @staticmethod
     def is_homograph_line(line: str) -> bool:
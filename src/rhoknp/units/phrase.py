@@ -1,5 +1,4 @@
 import re
-from functools import cached_property
 from typing import TYPE_CHECKING, Optional, Union
 
 try:
@@ -22,8 +21,18 @@ if TYPE_CHECKING:
 class Phrase(Unit):
     """文節クラス．"""
 
+    __slots__ = (
+        "_base_phrases",
+        "_clause",
+        "_morphemes_cache",
+        "_sentence",
+        "dep_type",
+        "features",
+        "index",
+        "parent_index",
+    )
+
     PAT = re.compile(rf"^\*( (?P<pid>-1|\d+)(?P<dtype>[DPAI]))?( {FeatureDict.PAT.pattern})?$")
-    count = 0
 
     def __init__(
         self,
@@ -40,36 +49,52 @@ class Phrase(Unit):
         # child units
         self._base_phrases: list[BasePhrase] | None = None
 
+        # caches of flattened views
+        self._morphemes_cache: tuple[Morpheme, ...] | None = None
+
         self.parent_index: int | None = parent_index  #: 係り先の文節の文内におけるインデックス．
         self.dep_type: DepType | None = dep_type  #: 係り受けの種類．
         self.features: FeatureDict = features or FeatureDict()  #: 素性．
 
-        self.index = self.count  #: 文内におけるインデックス．
-        Phrase.count += 1
+        self.index = 0  #: 文内におけるインデックス．
 
     @override
     def __hash__(self) -> int:
-        return hash((self.parent_unit, self.index))
+        sentence = self._find_sentence()
+        if sentence is None:
+            return id(self)
+        return hash((sentence, self.index))
 
     @override
     def __eq__(self, other: object) -> bool:
-        if not isinstance(other, type(self)):
+        if self is other:
+            return True
+        if not isinstance(other, type(self)) or self.index != other.index:
             return False
-        if self.parent_unit != other.parent_unit:
+        sentence = self._find_sentence()
+        other_sentence = other._find_sentence()
+        if sentence is None or other_sentence is None:
+            # 文に属さない場合はインデックスが定まらないため同一性で比較する
             return False
-        return self.index == other.index
+        return sentence is other_sentence or sentence == other_sentence
 
-    @cached_property
+    def _find_sentence(self) -> Optional["Sentence"]:
+        """属する文．文に属さない場合は None．"""
+        if self._sentence is not None:
+            return self._sentence
+        if self._clause is not None:
+            return self._clause._find_sentence()
+        return None
+
+    @override
+    def _clear_cache(self) -> None:
+        self._morphemes_cache = None
+        super()._clear_cache()
+
+    @property
     def global_index(self) -> int:
         """文書全体におけるインデックス．"""
-        if not self.sentence.has_document():
-            return self.index
-        if self.sentence.index == 0:
-            return self.index
-        if self.index > 0:
-            return self.sentence.phrases[0].global_index + self.index
-        prev_sentence = self.document.sentences[self.sentence.index - 1]
-        return prev_sentence.phrases[0].global_index + len(prev_sentence.phrases)
+        return self.sentence._get_global_offset("phrases") + self.index
 
     @property
     def parent_unit(self) -> Union["Clause", "Sentence"] | None:
@@ -141,14 +166,25 @@ class Phrase(Unit):
         Args:
             base_phrases: 基本句のリスト．
         """
-        for base_phrase in base_phrases:
+        for index, base_phrase in enumerate(base_phrases):
             base_phrase.phrase = self
+            base_phrase.index = index
+        for index, morpheme in enumerate(
+            morpheme for base_phrase in base_phrases for morpheme in base_phrase.morphemes
+        ):
+            morpheme.index = index
         self._base_phrases = base_phrases
+        # Indices are reassigned over the whole sentence if this phrase belongs to one.
+        self._clear_cache()
 
     @property
-    def morphemes(self) -> list[Morpheme]:
+    def morphemes(self) -> tuple[Morpheme, ...]:
         """形態素のリスト．"""
-        return [morpheme for base_phrase in self.base_phrases for morpheme in base_phrase.morphemes]
+        if self._morphemes_cache is None:
+            self._morphemes_cache = tuple(
+                morpheme for base_phrase in self.base_phrases for morpheme in base_phrase.morphemes
+            )
+        return self._morphemes_cache
 
     @property
     def parent(self) -> Optional["Phrase"]:
@@ -163,14 +199,16 @@ class Phrase(Unit):
             return None
         return self.sentence.phrases[self.parent_index]
 
-    @cached_property
+    @property
     def children(self) -> list["Phrase"]:
         """この文節に係っている文節のリスト．
 
         Raises:
             AttributeError: 解析結果にアクセスできない場合．
         """
-        return [phrase for phrase in self.sentence.phrases if phrase.parent == self]
+        sentence = self.sentence
+        phrases = sentence.phrases
+        return [phrases[index] for index in sentence.dependency_arrays("phrase").children_of(self.index)]
 
     @classmethod
     def from_knp(cls, knp_text: str) -> "Phrase":
@@ -186,10 +224,7 @@ class Phrase(Unit):
         match = cls.PAT.match(first_line)
         if match is None:
             raise ValueError(f"malformed phrase line: {first_line}")
-        parent_index = int(match["pid"]) if match["pid"] is not None else None
-        dep_type = DepType(match["dtype"]) if match["dtype"] is not None else None
-        features = FeatureDict.from_fstring(match["feats"] or "")
-        phrase = cls(parent_index, dep_type, features)
+        phrase = cls._from_match(match)
 
         base_phrases: list[BasePhrase] = []
         base_phrase_lines: list[str] = []
@@ -204,6 +239,18 @@ class Phrase(Unit):
         phrase.base_phrases = base_phrases
         return phrase
 
+    @classmethod
+    def _from_match(cls, match: re.Match) -> "Phrase":
+        """文節行にマッチした結果から文節クラスのインスタンスを初期化．
+
+        Args:
+            match: ``PAT`` による文節行のマッチ結果．
+        """
+        parent_index = int(match["pid"]) if match["pid"] is not None else None
+        dep_type = DepType(match["dtype"]) if match["dtype"] is not None else None
+        features = FeatureDict.from_fstring(match["feats"] or "")
+        return cls(parent_index, dep_type, features)
+
     def to_knp(self) -> str:
         """KNP フォーマットに変換．"""
         ret = "*"
@@ -1,6 +1,7 @@
 import logging
 import re
-from typing import TYPE_CHECKING, Optional
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Literal, Optional
 
 try:
     from typing import override  # type: ignore[attr-defined]
@@ -8,6 +9,7 @@ except ImportError:
     from typing_extensions import override
 
 from rhoknp.cohesion import EntityManager, Pas
+from rhoknp.props.dependency import DependencyArrays, DepType
 from rhoknp.props.named_entity import NamedEntity
 from rhoknp.units.base_phrase import BasePhrase
 from rhoknp.units.clause import Clause
@@ -15,6 +17,7 @@ from rhoknp.units.morpheme import Morpheme
 from rhoknp.units.phrase import Phrase
 from rhoknp.units.unit import Unit
 from rhoknp.utils.comment import extract_did_and_sid, is_comment_line
+from rhoknp.utils.table import MorphemeTable
 
 if TYPE_CHECKING:
     from rhoknp.units.document import Document
@@ -33,39 +36,55 @@ class Sentence(Unit):
     SID_PAT = re.compile(r"^(?P<sid>(?P<did>[a-zA-Z\d\-_]*?)-?\d*)$")
     SID_PAT_KWDLC = re.compile(r"^(?P<sid>(?P<did>w\d{6}-\d{10})(-\d+){1,2})$")
     SID_PAT_WAC = re.compile(r"^(?P<sid>(?P<did>wiki\d{8})(-\d{2})(-\d{2})?)$")
-    count = 0
+    # phrase or base phrase line, distinguished from a morpheme line whose surface string is "*" or "+"
+    _TAG_LINE_PAT = re.compile(r"^[*+]( (-1|\d+)[DPAI])?( <|$)")
 
     def __init__(self, text: str | None = None) -> None:
         super().__init__()
         if text is not None:
             self.text = text.replace("\r", "").replace("\n", "")
 
-        Clause.count = 0
-        Phrase.count = 0
-        BasePhrase.count = 0
-        Morpheme.count = 0
-        EntityManager.reset()
-
         # parent unit
         self._document: "Document" | None = None
 
+        # entity manager used when the sentence does not belong to a document
+        self._entity_manager: EntityManager | None = None
+
         # child units
         self._clauses: list[Clause] | None = None
         self._phrases: list[Phrase] | None = None
         self._morphemes: list[Morpheme] | None = None
 
+        # caches of flattened views
+        self._phrases_cache: tuple[Phrase, ...] | None = None
+        self._base_phrases_cache: tuple[BasePhrase, ...] | None = None
+        self._morphemes_cache: tuple[Morpheme, ...] | None = None
+        self._pas_list_cache: tuple[Pas, ...] | None = None
+        self._dependency_arrays_cache: dict[str, DependencyArrays] = {}
+        self._morpheme_offsets_cache: list[int] | None = None
+
+        # KNP lines kept until the sentence is first accessed in lazy mode
+        self._knp_lines: list[str] | None = None
+        self._has_clause_tags: bool = False
+        self._post_init_on_parse: bool = False
+
         self.sent_id: str = ""
         self.doc_id: str = ""
         self.misc_comment: str = ""
 
-        self.named_entities: list[NamedEntity] = []
+        self._named_entities: list[NamedEntity] = []
 
-        self.index = self.count  #: 文書全体におけるインデックス．
-        Sentence.count += 1
+        self.index = 0  #: 文書全体におけるインデックス．
 
     @override
     def __post_init__(self) -> None:
-        super().__post_init__()
+        if self._knp_lines is not None:
+            # Defer until the sentence is parsed.
+            self._post_init_on_parse = True
+            return
+        # Coreference relations are merged in a batch and reflected to entities at the end.
+        with self.entity_manager._batch():
+            super().__post_init__()
 
         # Find named entities in the sentence.
         self.named_entities = []
@@ -87,28 +106,71 @@ class Sentence(Unit):
 
     @override
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, type(self)):
             return False
         return self.sent_id == other.sent_id and self.text == other.text
 
+    @override
+    def _clear_cache(self) -> None:
+        self._phrases_cache = None
+        self._base_phrases_cache = None
+        self._morphemes_cache = None
+        self._pas_list_cache = None
+        self._dependency_arrays_cache = {}
+        self._morpheme_offsets_cache = None
+        if self._clauses is not None:
+            for clause in self._clauses:
+                clause._clear_relation_cache()
+        # Indices of units in this sentence may have changed.
+        self._assign_indices()
+        super()._clear_cache()
+
+    def _clear_pas_list_cache(self) -> None:
+        """この文と文書の述語項構造のリストのキャッシュを破棄する．"""
+        self._pas_list_cache = None
+        if self._document is not None:
+            self._document._pas_list_cache = None
+
     @property
     def global_index(self) -> int:
         """文書全体におけるインデックス．"""
         return self.index
 
+    def _get_global_offset(self, attr: str) -> int:
+        """文書全体においてこの文より前にある言語単位の数もしくは文字数．文書に属さない場合は 0．
+
+        Args:
+            attr: "clauses"，"phrases"，"base_phrases"，"morphemes"，"text" のいずれか．
+        """
+        if self._document is None:
+            return 0
+        return self._document._get_prefix_offsets(attr)[self.index]
+
+    def _get_morpheme_offsets(self) -> list[int]:
+        """各形態素の文内における開始位置のリスト．"""
+        if self._morpheme_offsets_cache is None:
+            offsets = [0]
+            for morpheme in self.morphemes:
+                offsets.append(offsets[-1] + len(morpheme.text))
+            self._morpheme_offsets_cache = offsets
+        return self._morpheme_offsets_cache
+
     @property
     def parent_unit(self) -> Optional["Document"]:
         """上位の言語単位（文書）．未登録なら None．"""
         return self._document
 
     @property
-    def child_units(self) -> list[Clause] | list[Phrase] | list[Morpheme] | None:
+    def child_units(self) -> Sequence[Clause] | Sequence[Phrase] | Sequence[Morpheme] | None:
         """下位の言語単位（節もしくは形態素）のリスト．解析結果にアクセスできないなら None．
 
         .. note::
             KNP によって解析済みなら節， Jumanpp によって解析済みなら形態素のリストを返却．
             KNP による素性が付与されていない場合は節境界が判断できないため文節を返却．
         """
+        self._parse_knp_lines()
         if self._clauses is not None:
             return self._clauses
         elif self._phrases is not None:
@@ -172,6 +234,7 @@ class Sentence(Unit):
         Raises:
             AttributeError: 解析結果にアクセスできない場合．
         """
+        self._parse_knp_lines()
         if self._clauses is None:
             raise AttributeError("clauses have not been set")
         return self._clauses
@@ -185,19 +248,24 @@ class Sentence(Unit):
         """
         for clause in clauses:
             clause.sentence = self
+        self._knp_lines = None
         self._clauses = clauses
+        self._clear_cache()
 
     @property
-    def phrases(self) -> list[Phrase]:
+    def phrases(self) -> Sequence[Phrase]:
         """文節のリスト．
 
         Raises:
             AttributeError: 解析結果にアクセスできない場合．
         """
+        self._parse_knp_lines()
         if self._phrases is not None:
             return self._phrases
         if self._clauses is not None:
-            return [phrase for clause in self.clauses for phrase in clause.phrases]
+            if self._phrases_cache is None:
+                self._phrases_cache = tuple(phrase for clause in self._clauses for phrase in clause.phrases)
+            return self._phrases_cache
         raise AttributeError("phrases have not been set")
 
     @phrases.setter
@@ -209,31 +277,41 @@ class Sentence(Unit):
         """
         for phrase in phrases:
             phrase.sentence = self
+        self._knp_lines = None
         self._phrases = phrases
+        self._clear_cache()
 
     @property
-    def base_phrases(self) -> list[BasePhrase]:
+    def base_phrases(self) -> tuple[BasePhrase, ...]:
         """基本句のリスト．
 
         Raises:
             AttributeError: 解析結果にアクセスできない場合．
         """
-        return [base_phrase for phrase in self.phrases for base_phrase in phrase.base_phrases]
+        if self._base_phrases_cache is None:
+            self._base_phrases_cache = tuple(
+                base_phrase for phrase in self.phrases for base_phrase in phrase.base_phrases
+            )
+        return self._base_phrases_cache
 
     @property
-    def morphemes(self) -> list[Morpheme]:
+    def morphemes(self) -> Sequence[Morpheme]:
         """形態素のリスト．
 
         Raises:
             AttributeError: 解析結果にアクセスできない場合．
         """
-        if self._clauses is not None:
-            return [morpheme for clause in self.clauses for morpheme in clause.morphemes]
-        if self._phrases is not None:
-            return [morpheme for phrase in self.phrases for morpheme in phrase.morphemes]
-        if self._morphemes is not None:
-            return self._morphemes
-        raise AttributeError("morphemes have not been set")
+        self._parse_knp_lines()
+        if self._morphemes_cache is None:
+            if self._clauses is not None or self._phrases is not None:
+                self._morphemes_cache = tuple(
+                    morpheme for base_phrase in self.base_phrases for morpheme in base_phrase.morphemes
+                )
+            elif self._morphemes is not None:
+                self._morphemes_cache = tuple(self._morphemes)
+            else:
+                raise AttributeError("morphemes have not been set")
+        return self._morphemes_cache
 
     @morphemes.setter
     def morphemes(self, morphemes: list[Morpheme]) -> None:
@@ -244,7 +322,24 @@ class Sentence(Unit):
         """
         for morpheme in morphemes:
             morpheme.sentence = self
+        self._knp_lines = None
         self._morphemes = morphemes
+        self._clear_cache()
+
+    @property
+    def named_entities(self) -> list[NamedEntity]:
+        """固有表現のリスト．"""
+        self._parse_knp_lines()
+        return self._named_entities
+
+    @named_entities.setter
+    def named_entities(self, named_entities: list[NamedEntity]) -> None:
+        """固有表現のリスト．
+
+        Args:
+            named_entities: 固有表現のリスト．
+        """
+        self._named_entities = named_entities
 
     @property
     def comment(self) -> str:
@@ -275,13 +370,78 @@ class Sentence(Unit):
         self.misc_comment = rest
 
     @property
-    def pas_list(self) -> list[Pas]:
+    def pas_list(self) -> tuple[Pas, ...]:
         """述語項構造のリスト．
 
         Raises:
             AttributeError: 解析結果にアクセスできない場合．
         """
-        return [base_phrase.pas for base_phrase in self.base_phrases if not base_phrase.pas.is_empty()]
+        if self._pas_list_cache is None:
+            self._pas_list_cache = tuple(
+                base_phrase.pas for base_phrase in self.base_phrases if not base_phrase.pas.is_empty()
+            )
+        return self._pas_list_cache
+
+    def dependency_arrays(self, unit: Literal["base_phrase", "phrase", "morpheme"] = "base_phrase") -> DependencyArrays:
+        """基本句，文節，もしくは形態素の係り受け構造を表す整数の配列を取得．
+
+        Args:
+            unit: "base_phrase" なら基本句，"phrase" なら文節，"morpheme" なら形態素の係り受け構造を返す．
+
+        Raises:
+            AttributeError: 解析結果にアクセスできない場合，もしくは係り先が設定されていない単位がある場合．
+            ValueError: ``unit`` が不正な値の場合．
+
+        .. note::
+            結果はキャッシュされる．係り受けを編集した場合は ``reparse`` を実行する必要がある．
+        """
+        arrays = self._dependency_arrays_cache.get(unit)
+        if arrays is None:
+            if unit == "base_phrase":
+                units: Sequence[BasePhrase] | Sequence[Phrase] = self.base_phrases
+            elif unit == "phrase":
+                units = self.phrases
+            elif unit == "morpheme":
+                units = self.base_phrases
+            else:
+                raise ValueError(f"invalid unit: {unit}")
+            if any(u.parent_index is None for u in units):
+                raise AttributeError("parent_index has not been set")
+            if unit == "morpheme":
+                arrays = DependencyArrays.from_dependencies(self._get_morpheme_dependencies())
+            else:
+                arrays = DependencyArrays.from_dependencies([(u.parent_index, u.dep_type) for u in units])
+            self._dependency_arrays_cache[unit] = arrays
+        return arrays
+
+    def _get_morpheme_dependencies(self) -> list[tuple[int | None, DepType | None]]:
+        """形態素の係り先のインデックスと係り受けタイプの組のリスト．
+
+        基本句の主辞は係り先の基本句の主辞に係り，それ以外の形態素は同じ基本句の主辞に係る．
+        """
+        base_phrases = self.base_phrases
+        dependencies: list[tuple[int | None, DepType | None]] = []
+        for base_phrase in base_phrases:
+            head = base_phrase.head
+            for morpheme in base_phrase.morphemes:
+                if morpheme is not head:
+                    dependencies.append((head.index, None))
+                elif base_phrase.parent_index == -1:
+                    dependencies.append((-1, base_phrase.dep_type))
+                else:
+                    assert base_phrase.parent_index is not None
+                    dependencies.append((base_phrases[base_phrase.parent_index].head.index, base_phrase.dep_type))
+        return dependencies
+
+    def morpheme_table(self) -> MorphemeTable:
+        """形態素の属性を列ごとに格納した表を作成．
+
+        基本句のインデックスと文字レベルのスパンは文内における位置を表す．
+
+        Raises:
+            AttributeError: 解析結果にアクセスできない場合．
+        """
+        return MorphemeTable.from_sentences([self])
 
     @classmethod
     def from_raw_text(cls, text: str, post_init: bool = True) -> "Sentence":
@@ -366,12 +526,13 @@ class Sentence(Unit):
         return sentence
 
     @classmethod
-    def from_knp(cls, knp_text: str, post_init: bool = True) -> "Sentence":
+    def from_knp(cls, knp_text: str, post_init: bool = True, lazy: bool = False) -> "Sentence":
         """文クラスのインスタンスを KNP の解析結果から初期化．
 
         Args:
             knp_text: KNP の解析結果．
             post_init: インスタンス作成後の追加処理を行うなら True．
+            lazy: True なら文 ID と文字列のみを読み込み，節・文節・基本句・形態素などは最初にアクセスされた際に構築する．
 
         Raises:
             ValueError: 解析結果読み込み中にエラーが発生した場合．
@@ -396,71 +557,226 @@ class Sentence(Unit):
             ... EOS
             ... \"\"\"
             >>> sent = Sentence.from_knp(knp_text)
+
+        .. note::
+            ``lazy`` が True の場合，解析結果の形式の誤りは節・文節・基本句・形態素が構築される際に報告される．
         """
-        lines = knp_text.split("\n")
+        return cls._from_knp_lines(knp_text.split("\n"), post_init=post_init, lazy=lazy)
+
+    @classmethod
+    def _from_knp_lines(cls, lines: Iterable[str], post_init: bool = True, lazy: bool = False) -> "Sentence":
+        """文クラスのインスタンスを KNP の解析結果の行の列から初期化．
+
+        各行の種類を先頭文字をもとに一度だけ判定し，節・文節・基本句・形態素を一度の走査で構築する．
+
+        Args:
+            lines: KNP の解析結果の各行．
+            post_init: インスタンス作成後の追加処理を行うなら True．
+            lazy: True なら行を保持するのみで，節・文節・基本句・形態素は最初にアクセスされた際に構築する．
+
+        Raises:
+            ValueError: 解析結果読み込み中にエラーが発生した場合．
+        """
+        if lazy is True:
+            sentence = cls._from_knp_lines_lazily(lines)
+            if post_init is True:
+                sentence.__post_init__()
+            return sentence
         sentence = cls()
-        has_clause_boundary = any("節-区切" in line for line in lines if BasePhrase.is_base_phrase_line(line))
-        clauses: list[Clause] = []
         phrases: list[Phrase] = []
-        child_lines: list[str] = []
-        is_clause_end = False
+        is_clause_ends: list[bool] = []  # 各文節が節区切の基本句を含むかどうか
+        phrase_children: list[list[BasePhrase]] = []
+        base_phrases: list[BasePhrase] = []
+        base_phrase_children: list[list[Morpheme]] = []
         for line in lines:
-            if line.strip() == "":
+            if not line or line.isspace():
                 continue
-            if is_comment_line(line):
-                sentence.comment = line
-                continue
-            if Phrase.is_phrase_line(line):
-                if has_clause_boundary and is_clause_end and child_lines:
-                    clauses.append(Clause.from_knp("\n".join(child_lines)))
-                    child_lines = []
-                    is_clause_end = False
-                elif has_clause_boundary is False and child_lines:
-                    phrases.append(Phrase.from_knp("\n".join(child_lines)))
-                    child_lines = []
-                child_lines.append(line)
+            first_char = line[0]
+            if first_char == "*" and (match := Phrase.PAT.match(line)) is not None:
+                phrases.append(Phrase._from_match(match))
+                is_clause_ends.append(False)
+                phrase_children.append([])
                 continue
-            if BasePhrase.is_base_phrase_line(line):
+            if first_char == "+" and (match := BasePhrase.PAT.match(line)) is not None:
+                if not phrases:
+                    raise ValueError(f"malformed line: {line}")
+                base_phrase = BasePhrase._from_match(match)
+                base_phrases.append(base_phrase)
+                base_phrase_children.append([])
+                phrase_children[-1].append(base_phrase)
                 if "節-区切" in line:
-                    is_clause_end = True
-                child_lines.append(line)
+                    is_clause_ends[-1] = True
                 continue
-            if Morpheme.is_morpheme_line(line) or Morpheme.is_homograph_line(line):
-                child_lines.append(line)
+            if first_char == "#" and is_comment_line(line):
+                sentence.comment = line
                 continue
             if line.strip() == cls.EOS:
                 break
-            raise ValueError(f"malformed line: {line}")
+            try:
+                morpheme = Morpheme._from_jumanpp_line(line)
+            except ValueError:
+                if not Morpheme.is_homograph_line(line) or not base_phrase_children or not base_phrase_children[-1]:
+                    raise ValueError(f"malformed line: {line}") from None
+                homograph = Morpheme._from_jumanpp_line(line[2:])
+                base_phrase_children[-1][-1].homographs.append(homograph)
+                continue
+            if not base_phrases:
+                raise ValueError(f"malformed line: {line}")
+            base_phrase_children[-1].append(morpheme)
         else:
-            logger.warning(f"sentence does not end with EOS: {child_lines}")
+            logger.warning(f"sentence does not end with EOS: {sentence.sid}")
 
-        if child_lines:
-            if has_clause_boundary:
-                clauses.append(Clause.from_knp("\n".join(child_lines)))
-            else:
-                phrases.append(Phrase.from_knp("\n".join(child_lines)))
-        if has_clause_boundary:
-            sentence.clauses = clauses
+        for base_phrase, morphemes in zip(base_phrases, base_phrase_children, strict=True):
+            base_phrase.morphemes = morphemes
+        for phrase, children in zip(phrases, phrase_children, strict=True):
+            phrase.base_phrases = children
+
+        if any(is_clause_ends):
+            sentence.clauses = cls._group_phrases_into_clauses(phrases, is_clause_ends)
         else:
             sentence.phrases = phrases
         if post_init is True:
             sentence.__post_init__()
         return sentence
 
+    @classmethod
+    def _from_knp_lines_lazily(cls, lines: Iterable[str]) -> "Sentence":
+        """KNP の解析結果の行を保持し，コメント行と文字列のみを読み込んだ文クラスのインスタンスを作成．
+
+        Args:
+            lines: KNP の解析結果の各行．
+        """
+        sentence = cls()
+        knp_lines: list[str] = []
+        surfs: list[str] | None = []
+        for line in lines:
+            if not line or line.isspace():
+                continue
+            first_char = line[0]
+            if first_char in "*+" and cls._TAG_LINE_PAT.match(line) is not None:
+                if first_char == "+" and "節-区切" in line:
+                    sentence._has_clause_tags = True
+            elif first_char == "#" and is_comment_line(line):
+                sentence.comment = line
+                continue
+            elif line.strip() == cls.EOS:
+                knp_lines.append(line)
+                break
+            elif surfs is not None and not (first_char == "@" and cls._is_homograph_line_fast(line)):
+                fields = line.split(" ", 11)
+                # Leave the text to be built from morphemes if the surface string may contain spaces or be escaped.
+                if len(fields) < 11 or not all(fields[i].isdigit() for i in (4, 6, 8, 10)) or "元半角" in line:
+                    surfs = None
+                else:
+                    surfs.append(Morpheme._UNESCAPE_MAP_CONTROL_CHAR.get(fields[0], fields[0]))
+            knp_lines.append(line)
+        else:
+            logger.warning(f"sentence does not end with EOS: {sentence.sid}")
+            knp_lines.append(cls.EOS)
+        if surfs is not None:
+            sentence.text = "".join(surfs)
+        sentence._knp_lines = knp_lines
+        return sentence
+
+    @staticmethod
+    def _is_homograph_line_fast(line: str) -> bool:
+        """同形行なら True．"@" で始まり，品詞 ID の位置に数字がなければ同形行とみなす．"""
+        fields = line.split(" ", 5)
+        return len(fields) > 4 and not fields[4].isdigit()
+
+    def _parse_knp_lines(self) -> None:
+        """遅延読み込みされた KNP の解析結果から節・文節・基本句・形態素を構築．
+
+        .. note::
+            文書に属する場合，関係タグが他の文を参照し得るため文書中の全ての文を構築する．
+        """
+        knp_lines = self._knp_lines
+        if knp_lines is None:
+            return
+        if self._document is not None:
+            self._document._parse_knp_lines()
+            return
+        self._build_from_knp_lines(knp_lines)
+        if self._post_init_on_parse is True:
+            self._post_init_on_parse = False
+            self.__post_init__()
+
+    def _build_from_knp_lines(self, knp_lines: list[str]) -> None:
+        """保持していた KNP の解析結果から節・文節・基本句・形態素を構築．追加処理は行わない．"""
+        self._knp_lines = None
+        parsed = Sentence._from_knp_lines(knp_lines, post_init=False, lazy=False)
+        if parsed._clauses is not None:
+            self.clauses = parsed._clauses
+        else:
+            assert parsed._phrases is not None
+            self.phrases = parsed._phrases
+
+    @staticmethod
+    def _group_phrases_into_clauses(phrases: list[Phrase], is_clause_ends: list[bool]) -> list[Clause]:
+        """文節の列を節区切で分割し，節のリストを構築．
+
+        Args:
+            phrases: 文節のリスト．
+            is_clause_ends: 各文節が節区切の基本句を含むなら True となるリスト．
+        """
+        clauses: list[Clause] = []
+        clause_phrases: list[Phrase] = []
+        for phrase, is_clause_end in zip(phrases, is_clause_ends, strict=True):
+            clause_phrases.append(phrase)
+            if is_clause_end:
+                clause = Clause()
+                clause.phrases = clause_phrases
+                clauses.append(clause)
+                clause_phrases = []
+        if clause_phrases:
+            clause = Clause()
+            clause.phrases = clause_phrases
+            clauses.append(clause)
+        return clauses
+
+    def _assign_indices(self) -> None:
+        """下位の言語単位に文内におけるインデックスを割り当てる．"""
+        if self._clauses is not None:
+            for index, clause in enumerate(self._clauses):
+                clause.index = index
+        if not self.is_knp_required():
+            for index, phrase in enumerate(self.phrases):
+                phrase.index = index
+            for index, base_phrase in enumerate(self.base_phrases):
+                base_phrase.index = index
+        if not self.is_jumanpp_required():
+            for index, morpheme in enumerate(self.morphemes):
+                morpheme.index = index
+
+    @property
+    def entity_manager(self) -> EntityManager:
+        """エンティティを管理するオブジェクト．文書に属する場合は文書のものを返す．"""
+        if self._document is not None:
+            return self._document.entity_manager
+        if self._entity_manager is None:
+            self._entity_manager = EntityManager()
+        return self._entity_manager
+
     def has_document(self) -> bool:
         """文書が設定されていたら True．"""
         return self._document is not None
 
     def is_jumanpp_required(self) -> bool:
         """Juman++ による形態素解析がまだなら True．"""
+        if self._knp_lines is not None:
+            return False
         return self._morphemes is None and self._phrases is None and self._clauses is None
 
     def is_knp_required(self) -> bool:
         """KNP による構文解析がまだなら True．"""
+        if self._knp_lines is not None:
+            return False
         return self._phrases is None and self._clauses is None
 
     def is_clause_tag_required(self) -> bool:
         """KNP による節-主辞・節-区切のタグ付与がまだなら True．"""
+        if self._knp_lines is not None:
+            return not self._has_clause_tags
         return self._clauses is None
 
     def to_raw_text(self) -> str:
@@ -489,6 +805,7 @@ class Sentence(Unit):
         Raises:
             AttributeError: 解析結果にアクセスできない場合．
         """
+        self._parse_knp_lines()
         ret = ""
         if self.comment != "":
             ret += self.comment + "\n"
@@ -1,11 +1,13 @@
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from typing import Optional
+from typing import Any, Optional
 
 
 class Unit(ABC):
     """言語単位の基底クラス・"""
 
+    __slots__ = ("_text",)
+
     def __init__(self) -> None:
         self._text: str | None = None
 
@@ -14,6 +16,25 @@ class Unit(ABC):
             for child_unit in self.child_units:
                 child_unit.__post_init__()
 
+    def _clear_cache(self) -> None:
+        """下位の言語単位から導出したキャッシュを破棄し，上位の言語単位にも伝播させる．
+
+        .. note::
+            下位の言語単位のリストが更新された際に呼び出される．
+        """
+        parent_unit = self.parent_unit
+        if parent_unit is not None:
+            parent_unit._clear_cache()
+
+    def _get_slot_state(self) -> dict[str, Any]:
+        """``__slots__`` に格納された属性を辞書として取得．"""
+        return {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+
     @abstractmethod
     def __hash__(self) -> int:
         raise NotImplementedError
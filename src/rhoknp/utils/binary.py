@@ -0,0 +1,355 @@
+import struct
+import sys
+from array import array
+from collections.abc import Callable, Sequence
+
+from rhoknp.cohesion.rel import RelMode, RelTag, RelTagList
+from rhoknp.props.dependency import DepType
+from rhoknp.props.feature import FeatureDict
+from rhoknp.props.memo import MemoTag
+from rhoknp.props.semantics import SemanticsDict
+from rhoknp.units.base_phrase import BasePhrase
+from rhoknp.units.clause import Clause
+from rhoknp.units.morpheme import Morpheme
+from rhoknp.units.phrase import Phrase
+from rhoknp.units.sentence import Sentence
+
+MAGIC = b"RKNP"
+FORMAT_VERSION = 1  #: バイナリ形式のバージョン．形式を変更した際にはインクリメントする．
+
+# magic, version, flags, number of integers, number of strings
+_HEADER = struct.Struct("<4sHHII")
+_FLAG_SENTER_REQUIRED = 1
+
+# levels of analysis of a sentence
+_LEVEL_RAW = 0
+_LEVEL_JUMANPP = 1
+_LEVEL_KNP = 2
+_LEVEL_CLAUSE = 3
+
+# special values in place of string IDs
+_NONE = -1
+_TRUE = -2
+_FALSE = -3
+
+_DEP_TYPES = list(DepType)
+_DEP_TYPE_CODES = {dep_type: code for code, dep_type in enumerate(_DEP_TYPES)}
+_REL_MODES = list(RelMode)
+_REL_MODE_CODES = {mode: code for code, mode in enumerate(_REL_MODES)}
+
+
+def encode_sentences(sentences: Sequence[Sentence] | None, text: str = "") -> bytes:
+    """文のリストをバイナリ形式に変換．
+
+    Args:
+        sentences: 文のリスト．文分割されていない文書の場合は None．
+        text: 文分割されていない文書の文字列．
+
+    .. note::
+        整数列と文字列表からなる．品詞や素性などの文字列は文字列表に一度だけ格納され，整数列からは ID で参照される．
+    """
+    encoder = _Encoder()
+    flags = 0
+    if sentences is None:
+        flags |= _FLAG_SENTER_REQUIRED
+        encoder.ints.append(encoder.string(text))
+    else:
+        encoder.ints.append(len(sentences))
+        for sentence in sentences:
+            encoder.sentence(sentence)
+    ints = array("i", encoder.ints)
+    lengths = array("I", (len(string) for string in encoder.strings))
+    if sys.byteorder == "big":
+        ints.byteswap()  # pragma: no cover
+        lengths.byteswap()  # pragma: no cover
+    return b"".join(
+        (
+            _HEADER.pack(MAGIC, FORMAT_VERSION, flags, len(ints), len(lengths)),
+            ints.tobytes(),
+            lengths.tobytes(),
+            "".join(encoder.strings).encode("utf-8"),
+        )
+    )
+
+
+def decode_sentences(data: bytes) -> tuple[list[Sentence] | None, str]:
+    """バイナリ形式から文のリストを復元．
+
+    Args:
+        data: ``encode_sentences`` によって作成されたバイナリ．
+
+    Returns:
+        文のリストと文書の文字列の組．文分割されていない文書の場合は文のリストが None になる．
+
+    Raises:
+        ValueError: 形式が正しくない場合．
+
+    .. note::
+        復元した文に対する ``__post_init__`` の呼び出しは呼び出し側で行う．
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("data is too short")
+    magic, version, flags, num_ints, num_strings = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError(f"invalid magic number: {magic!r}")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"unsupported format version: {version} (expected {FORMAT_VERSION})")
+    offset = _HEADER.size
+    ints = array("i")
+    lengths = array("I")
+    if len(data) < offset + num_ints * ints.itemsize + num_strings * lengths.itemsize:
+        raise ValueError("data is truncated")
+    ints.frombytes(data[offset : offset + num_ints * ints.itemsize])
+    offset += num_ints * ints.itemsize
+    lengths.frombytes(data[offset : offset + num_strings * lengths.itemsize])
+    offset += num_strings * lengths.itemsize
+    if sys.byteorder == "big":
+        ints.byteswap()  # pragma: no cover
+        lengths.byteswap()  # pragma: no cover
+    try:
+        blob = bytes(data[offset:]).decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise ValueError("corrupted rhoknp binary data") from e
+    if sum(lengths) != len(blob):
+        raise ValueError("data is truncated")
+    strings: list[str] = []
+    start = 0
+    for length in lengths:
+        strings.append(blob[start : start + length])
+        start += length
+
+    decoder = _Decoder(iter(ints).__next__, strings)
+    try:
+        if flags & _FLAG_SENTER_REQUIRED:
+            return None, strings[decoder.next()]
+        return [decoder.sentence() for _ in range(decoder.next())], ""
+    except (StopIteration, IndexError) as e:
+        # The integer sequence ends early or refers to strings that do not exist.
+        raise ValueError("corrupted rhoknp binary data") from e
+
+
+class _Encoder:
+    """言語単位を整数列と文字列表に変換する．"""
+
+    def __init__(self) -> None:
+        self.ints: list[int] = []
+        self.strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+
+    def string(self, string: str) -> int:
+        """文字列を文字列表に登録し，その ID を返す．"""
+        string_id = self._string_ids.get(string)
+        if string_id is None:
+            string_id = self._string_ids[string] = len(self.strings)
+            self.strings.append(string)
+        return string_id
+
+    def optional_string(self, string: str | None) -> int:
+        return _NONE if string is None else self.string(string)
+
+    def value(self, value: str | bool) -> int:
+        if value is True:
+            return _TRUE
+        if value is False:
+            return _FALSE
+        return self.string(value)
+
+    def items(self, items: dict[str, str | bool]) -> None:
+        self.ints.append(len(items))
+        for key, value in items.items():
+            self.ints += (self.string(key), self.value(value))
+
+    def sentence(self, sentence: Sentence) -> None:
+        if not sentence.is_clause_tag_required():
+            level = _LEVEL_CLAUSE
+        elif not sentence.is_knp_required():
+            level = _LEVEL_KNP
+        elif not sentence.is_jumanpp_required():
+            level = _LEVEL_JUMANPP
+        else:
+            level = _LEVEL_RAW
+        self.ints += (
+            level,
+            self.string(sentence.sent_id),
+            self.string(sentence.doc_id),
+            self.string(sentence.misc_comment),
+        )
+        if level == _LEVEL_CLAUSE:
+            self.ints.append(len(sentence.clauses))
+            for clause in sentence.clauses:
+                self.ints.append(len(clause.phrases))
+                for phrase in clause.phrases:
+                    self.phrase(phrase)
+        elif level == _LEVEL_KNP:
+            self.ints.append(len(sentence.phrases))
+            for phrase in sentence.phrases:
+                self.phrase(phrase)
+        elif level == _LEVEL_JUMANPP:
+            self.ints.append(len(sentence.morphemes))
+            for morpheme in sentence.morphemes:
+                self.morpheme(morpheme)
+        else:
+            self.ints.append(self.string(sentence.text))
+
+    def dependency(self, parent_index: int | None, dep_type: DepType | None) -> None:
+        if parent_index is None or dep_type is None:
+            self.ints.append(_NONE)
+        else:
+            self.ints += (_DEP_TYPE_CODES[dep_type], parent_index)
+
+    def phrase(self, phrase: Phrase) -> None:
+        self.dependency(phrase.parent_index, phrase.dep_type)
+        self.items(phrase.features)
+        self.ints.append(len(phrase.base_phrases))
+        for base_phrase in phrase.base_phrases:
+            self.base_phrase(base_phrase)
+
+    def base_phrase(self, base_phrase: BasePhrase) -> None:
+        self.dependency(base_phrase.parent_index, base_phrase.dep_type)
+        self.items(base_phrase.features)
+        self.ints.append(len(base_phrase.rel_tags))
+        for rel_tag in base_phrase.rel_tags:
+            self.ints += (
+                self.string(rel_tag.type),
+                self.string(rel_tag.target),
+                self.optional_string(rel_tag.sid),
+                _NONE if rel_tag.base_phrase_index is None else rel_tag.base_phrase_index,
+                _NONE if rel_tag.mode is None else _REL_MODE_CODES[rel_tag.mode],
+            )
+        self.ints.append(self.string(base_phrase.memo_tag.text))
+        self.ints.append(len(base_phrase.morphemes))
+        for morpheme in base_phrase.morphemes:
+            self.morpheme(morpheme)
+
+    def morpheme(self, morpheme: Morpheme) -> None:
+        string = self.string
+        self.ints += (
+            string(morpheme.text),
+            string(morpheme.reading),
+            string(morpheme.lemma),
+            string(morpheme.pos),
+            morpheme.pos_id,
+            string(morpheme.subpos),
+            morpheme.subpos_id,
+            string(morpheme.conjtype),
+            morpheme.conjtype_id,
+            string(morpheme.conjform),
+            morpheme.conjform_id,
+            int(morpheme._semantics is not None and morpheme._semantics.is_nil()),
+        )
+        # avoid allocating empty dicts and lists on access
+        self.items(morpheme._semantics or {})
+        self.items(morpheme._features or {})
+        homographs = morpheme._homographs or []
+        self.ints.append(len(homographs))
+        for homograph in homographs:
+            self.morpheme(homograph)
+
+
+class _Decoder:
+    """整数列と文字列表から言語単位を復元する．"""
+
+    def __init__(self, next_int: Callable[[], int], strings: list[str]) -> None:
+        self.next = next_int
+        self.strings = strings
+
+    def optional_string(self) -> str | None:
+        string_id = self.next()
+        return None if string_id == _NONE else self.strings[string_id]
+
+    def items(self) -> list[tuple[str, str | bool]]:
+        next_, strings = self.next, self.strings
+        items: list[tuple[str, str | bool]] = []
+        for _ in range(next_()):
+            key = strings[next_()]
+            value_id = next_()
+            items.append((key, True if value_id == _TRUE else False if value_id == _FALSE else strings[value_id]))
+        return items
+
+    def sentence(self) -> Sentence:
+        next_, strings = self.next, self.strings
+        level = next_()
+        sentence = Sentence()
+        sentence.sent_id = strings[next_()]
+        sentence.doc_id = strings[next_()]
+        sentence.misc_comment = strings[next_()]
+        if level == _LEVEL_CLAUSE:
+            clauses: list[Clause] = []
+            for _ in range(next_()):
+                clause = Clause()
+                clause.phrases = [self.phrase() for _ in range(next_())]
+                clauses.append(clause)
+            sentence.clauses = clauses
+        elif level == _LEVEL_KNP:
+            sentence.phrases = [self.phrase() for _ in range(next_())]
+        elif level == _LEVEL_JUMANPP:
+            sentence.morphemes = [self.morpheme() for _ in range(next_())]
+        elif level == _LEVEL_RAW:
+            sentence.text = strings[next_()]
+        else:
+            raise ValueError(f"invalid sentence level: {level}")
+        return sentence
+
+    def dependency(self) -> tuple[int | None, DepType | None]:
+        code = self.next()
+        if code == _NONE:
+            return None, None
+        return self.next(), _DEP_TYPES[code]
+
+    def phrase(self) -> Phrase:
+        parent_index, dep_type = self.dependency()
+        phrase = Phrase(parent_index, dep_type, FeatureDict(self.items()))
+        phrase.base_phrases = [self.base_phrase() for _ in range(self.next())]
+        return phrase
+
+    def base_phrase(self) -> BasePhrase:
+        next_, strings = self.next, self.strings
+        parent_index, dep_type = self.dependency()
+        features = FeatureDict(self.items())
+        rel_tags = RelTagList()
+        for _ in range(next_()):
+            type_, target, sid = strings[next_()], strings[next_()], self.optional_string()
+            base_phrase_index, mode = next_(), next_()
+            rel_tags.append(
+                RelTag(
+                    type=type_,
+                    target=target,
+                    sid=sid,
+                    base_phrase_index=None if base_phrase_index == _NONE else base_phrase_index,
+                    mode=None if mode == _NONE else _REL_MODES[mode],
+                )
+            )
+        memo_tag = MemoTag(strings[next_()])
+        base_phrase = BasePhrase(parent_index, dep_type, features, rel_tags, memo_tag)
+        base_phrase.morphemes = [self.morpheme() for _ in range(next_())]
+        return base_phrase
+
+    def morpheme(self) -> Morpheme:
+        next_, strings = self.next, self.strings
+        text, reading, lemma = strings[next_()], strings[next_()], strings[next_()]
+        pos, pos_id = strings[next_()], next_()
+        subpos, subpos_id = strings[next_()], next_()
+        conjtype, conjtype_id = strings[next_()], next_()
+        conjform, conjform_id = strings[next_()], next_()
+        is_nil = next_() == 1
+        semantics_items, feature_items = self.items(), self.items()
+        # leave empty dicts to be allocated on first access
+        semantics = SemanticsDict(dict(semantics_items), is_nil=is_nil) if semantics_items or is_nil else None
+        features = FeatureDict(feature_items) if feature_items else None
+        morpheme = Morpheme(
+            text,
+            reading,
+            lemma,
+            pos,
+            pos_id,
+            subpos,
+            subpos_id,
+            conjtype,
+            conjtype_id,
+            conjform,
+            conjform_id,
+            semantics=semantics,
+            features=features,
+        )
+        morpheme.homographs = [self.morpheme() for _ in range(next_())]
+        return morpheme
@@ -0,0 +1,265 @@
+import json
+import logging
+import mmap
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from types import TracebackType
+
+try:
+    from typing import Self  # type: ignore[attr-defined]
+except ImportError:
+    from typing_extensions import Self
+
+from rhoknp import Document, Sentence
+from rhoknp.utils.comment import extract_did_and_sid, is_comment_line
+from rhoknp.utils.reader import _get_doc_id_extractor
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1  #: 索引ファイルの形式のバージョン．
+
+
+class KNPCorpus:
+    """KNP 形式の解析結果ファイルに文書 ID と文 ID による索引を付け，ランダムアクセスを可能にするクラス．
+
+    ファイルは ``mmap`` によって開かれ，要求された文書や文の範囲のみが読み込まれる．
+
+    Args:
+        path: KNP 形式の解析結果ファイルのパス．
+        doc_id_format: 文書IDのフォーマット．``rhoknp.utils.reader.chunk_by_document`` を参照．
+        index_path: 索引ファイルのパス．指定された場合，索引ファイルが存在し解析結果ファイルと対応していれば読み込み，
+            そうでなければ索引を作成して保存する．None の場合は索引を毎回作成する．
+
+    Example:
+        >>> from rhoknp.utils.corpus import KNPCorpus
+        >>> with KNPCorpus("corpus.knp", doc_id_format="kwdlc", index_path="corpus.knp.index") as corpus:
+        ...     document = corpus.get_document("w201106-0000060050")
+        ...     sentence = corpus.get_sentence("w201106-0000060050-1")
+        ...     document = corpus[42]  # 42 番目の文書
+
+    .. note::
+        文書の区切りは ``chunk_by_document`` と同様に決定される．
+        文書IDを持たない文書は ``get_document`` では取得できないが，位置を指定すれば取得できる．
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        doc_id_format: str | Callable = "default",
+        index_path: str | Path | None = None,
+    ) -> None:
+        self.path = Path(path)  #: 解析結果ファイルのパス．
+        self._file = self.path.open("rb")
+        # mmap cannot map an empty file
+        self._mmap: mmap.mmap | bytes = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.path.stat().st_size > 0 else b""
+        )
+
+        #: 文書 ID と文書のバイト範囲のリスト（ファイル中の出現順）．
+        self.documents: list[tuple[str | None, int, int]] = []
+        #: 文 ID と文のバイト範囲のリスト（ファイル中の出現順）．
+        self.sentences: list[tuple[str | None, int, int]] = []
+        if index_path is not None and self._load_index(Path(index_path), doc_id_format):
+            logger.debug(f"loaded index from {index_path}")
+        else:
+            self._build_index(_get_doc_id_extractor(doc_id_format))
+            if index_path is not None:
+                self._save_index(Path(index_path), doc_id_format)
+        self._doc_id_to_position: dict[str, int] = {}
+        for position, (doc_id, _, _) in enumerate(self.documents):
+            if doc_id is not None:
+                self._doc_id_to_position.setdefault(doc_id, position)
+        self._sid_to_position: dict[str, int] = {}
+        for position, (sid, _, _) in enumerate(self.sentences):
+            if sid is not None:
+                self._sid_to_position.setdefault(sid, position)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def __getitem__(self, key: int | str) -> Document:
+        if isinstance(key, int):
+            _, start, end = self.documents[key]
+            return Document.from_knp(self._read(start, end))
+        return self.get_document(key)
+
+    def __iter__(self) -> Iterator[Document]:
+        for _, start, end in self.documents:
+            yield Document.from_knp(self._read(start, end))
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._doc_id_to_position
+
+    @property
+    def doc_ids(self) -> list[str]:
+        """文書 ID のリスト．"""
+        return list(self._doc_id_to_position.keys())
+
+    @property
+    def sids(self) -> list[str]:
+        """文 ID のリスト．"""
+        return list(self._sid_to_position.keys())
+
+    def get_document(self, doc_id: str) -> Document:
+        """文書 ID から文書を取得．
+
+        Args:
+            doc_id: 文書 ID．
+
+        Raises:
+            KeyError: 文書が存在しない場合．
+        """
+        return Document.from_knp(self.get_document_knp(doc_id))
+
+    def get_document_knp(self, doc_id: str) -> str:
+        """文書 ID から KNP 形式の文書を取得．
+
+        Args:
+            doc_id: 文書 ID．
+
+        Raises:
+            KeyError: 文書が存在しない場合．
+        """
+        _, start, end = self.documents[self._doc_id_to_position[doc_id]]
+        return self._read(start, end)
+
+    def get_sentence(self, sid: str) -> Sentence:
+        """文 ID から文を取得．
+
+        Args:
+            sid: 文 ID．
+
+        Raises:
+            KeyError: 文が存在しない場合．
+
+        .. note::
+            文は文書に属さない状態で読み込まれるため，他の文を参照する関係タグは解決されない．
+        """
+        return Sentence.from_knp(self.get_sentence_knp(sid))
+
+    def get_sentence_knp(self, sid: str) -> str:
+        """文 ID から KNP 形式の文を取得．
+
+        Args:
+            sid: 文 ID．
+
+        Raises:
+            KeyError: 文が存在しない場合．
+        """
+        _, start, end = self.sentences[self._sid_to_position[sid]]
+        return self._read(start, end)
+
+    def close(self) -> None:
+        """ファイルを閉じる．"""
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._file.close()
+
+    def _read(self, start: int, end: int) -> str:
+        return self._mmap[start:end].decode("utf-8")
+
+    def _build_index(self, extract_doc_id: Callable[[str], str | None]) -> None:
+        """ファイルを走査して索引を作成．"""
+        eos = Sentence.EOS.encode("utf-8")
+        data = self._mmap
+        size = len(data)
+        prev_doc_id: str | None = None
+        doc_start: int | None = None
+        sentence_start: int | None = None
+        first_line = ""
+        position = 0
+        while position < size:
+            line_end = data.find(b"\n", position)
+            next_position = size if line_end == -1 else line_end + 1
+            line = data[position:next_position]
+            if line.strip() != b"":
+                if sentence_start is None:
+                    sentence_start = position
+                    first_line = line.decode("utf-8").rstrip("\n")
+                if line.rstrip(b"\n") == eos:
+                    doc_start, prev_doc_id = self._add_sentence(
+                        sentence_start, next_position, first_line, extract_doc_id, doc_start, prev_doc_id
+                    )
+                    sentence_start = None
+            position = next_position
+        if sentence_start is not None:
+            doc_start, prev_doc_id = self._add_sentence(
+                sentence_start, size, first_line, extract_doc_id, doc_start, prev_doc_id
+            )
+        if doc_start is not None:
+            self.documents.append((prev_doc_id, doc_start, size))
+
+    def _add_sentence(
+        self,
+        start: int,
+        end: int,
+        first_line: str,
+        extract_doc_id: Callable[[str], str | None],
+        doc_start: int | None,
+        prev_doc_id: str | None,
+    ) -> tuple[int, str | None]:
+        """文を索引に追加し，必要に応じて直前の文書を確定させる．
+
+        Returns:
+            現在の文書の開始位置と文書 ID の組．
+        """
+        sid: str | None = None
+        if is_comment_line(first_line):
+            _, sid, _ = extract_did_and_sid(
+                first_line, patterns=[Sentence.SID_PAT_KWDLC, Sentence.SID_PAT_WAC, Sentence.SID_PAT]
+            )
+        self.sentences.append((sid, start, end))
+        doc_id = extract_doc_id(first_line)
+        if doc_start is not None and (prev_doc_id != doc_id or doc_id is None):
+            self.documents.append((prev_doc_id, doc_start, start))
+            doc_start = None
+        if doc_start is None:
+            doc_start = start
+        return doc_start, doc_id
+
+    def _load_index(self, index_path: Path, doc_id_format: str | Callable) -> bool:
+        """索引ファイルを読み込む．解析結果ファイルと対応していなければ False を返す．"""
+        if not isinstance(doc_id_format, str) or not index_path.exists():
+            return False
+        with index_path.open() as f:
+            index = json.load(f)
+        stat = self.path.stat()
+        if (
+            index.get("version") != INDEX_VERSION
+            or index.get("doc_id_format") != doc_id_format
+            or index.get("size") != stat.st_size
+            or index.get("mtime_ns") != stat.st_mtime_ns
+        ):
+            logger.info(f"index is outdated and will be rebuilt: {index_path}")
+            return False
+        self.documents = [(doc_id, start, end) for doc_id, start, end in index["documents"]]
+        self.sentences = [(sid, start, end) for sid, start, end in index["sentences"]]
+        return True
+
+    def _save_index(self, index_path: Path, doc_id_format: str | Callable) -> None:
+        """索引ファイルを保存．"""
+        if not isinstance(doc_id_format, str):
+            logger.warning("index is not saved because doc_id_format is not a string")
+            return
+        stat = self.path.stat()
+        index = {
+            "version": INDEX_VERSION,
+            "doc_id_format": doc_id_format,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "documents": self.documents,
+            "sentences": self.sentences,
+        }
+        with index_path.open("w") as f:
+            json.dump(index, f, ensure_ascii=False)
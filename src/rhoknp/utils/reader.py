@@ -1,10 +1,15 @@
+import itertools
 import logging
+import os
 import re
-from collections.abc import Callable, Iterator
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, as_completed, wait
 from functools import partial
+from pathlib import Path
 from typing import TextIO
 
-from rhoknp import Sentence
+from rhoknp import Document, Sentence
 from rhoknp.utils.comment import extract_did_and_sid
 
 logger = logging.getLogger(__name__)
@@ -64,20 +69,7 @@ def chunk_by_document(f: TextIO, doc_id_format: str | Callable = "default") -> I
             >>> def default_doc_id_format(line: str) -> str:
             ...     return line.lstrip("# S-ID:").rsplit("-", maxsplit=1)[0]
     """
-    extract_doc_id: Callable[[str], str | None]
-    if isinstance(doc_id_format, str):
-        if doc_id_format == "default":
-            extract_doc_id = partial(_extract_doc_id, pat=Sentence.SID_PAT)
-        elif doc_id_format == "kwdlc":
-            extract_doc_id = partial(_extract_doc_id, pat=Sentence.SID_PAT_KWDLC)
-        elif doc_id_format == "wac":
-            extract_doc_id = partial(_extract_doc_id, pat=Sentence.SID_PAT_WAC)
-        else:
-            raise ValueError(f"Invalid doc_id_format: {doc_id_format}")
-    elif callable(doc_id_format):
-        extract_doc_id = doc_id_format
-    else:
-        raise TypeError(f"Invalid doc_id_format: {doc_id_format}")
+    extract_doc_id = _get_doc_id_extractor(doc_id_format)
 
     prev_doc_id: str | None = None
     buffer: list[str] = []
@@ -92,6 +84,93 @@ def chunk_by_document(f: TextIO, doc_id_format: str | Callable = "default") -> I
         yield "".join(buffer)
 
 
+def load_documents(
+    sources: Iterable[str | os.PathLike[str]],
+    max_workers: int | None = None,
+    chunksize: int = 1,
+    ordered: bool = True,
+) -> Iterator[Document]:
+    """KNP 形式の解析結果を複数のプロセスで並列に読み込むジェネレータ．
+
+    Args:
+        sources: 読み込む文書のイテラブル．``Path`` などの ``os.PathLike`` はファイルのパス，
+            ``str`` は KNP 形式の文字列とみなす．ファイルを読み込む場合は ``str`` ではなく ``Path`` を渡す．
+        max_workers: ワーカープロセス数．None の場合 CPU 数を用いる．
+        chunksize: 一度にワーカープロセスに送る文書数．
+        ordered: True なら入力の順に，False なら解析が完了した順に文書を返す．
+
+    Example:
+        >>> from rhoknp.utils.reader import chunk_by_document, load_documents
+        >>> with open("example.knp") as f:
+        ...     for document in load_documents(chunk_by_document(f), max_workers=4, chunksize=16):
+        ...         print(document.doc_id)
+
+    .. note::
+        同時に解析するチャンクは高々 ``max_workers`` の 2 倍に制限されるため，
+        巨大なコーパスでも入力全体をメモリに載せることなく読み込める．
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be positive: {chunksize}")
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_pending = max_workers * 2
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        chunks = _batch(sources, chunksize)
+        if ordered is True:
+            queue: deque[Future[list[Document]]] = deque()
+            for chunk in chunks:
+                queue.append(executor.submit(_load_documents, chunk))
+                if len(queue) >= max_pending:
+                    yield from queue.popleft().result()
+            while queue:
+                yield from queue.popleft().result()
+        else:
+            pending: set[Future[list[Document]]] = set()
+            for chunk in chunks:
+                pending.add(executor.submit(_load_documents, chunk))
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+            for future in as_completed(pending):
+                yield from future.result()
+
+
+def _load_documents(sources: list[str | os.PathLike[str]]) -> list[Document]:
+    """ワーカープロセスで文書を読み込む．
+
+    Args:
+        sources: 読み込む文書のリスト．
+    """
+    return [Document.from_knp(source if isinstance(source, str) else Path(source).read_text()) for source in sources]
+
+
+def _batch(iterable: Iterable[str | os.PathLike[str]], size: int) -> Iterator[list[str | os.PathLike[str]]]:
+    """イテラブルを指定した大きさのリストに分割する．"""
+    iterator = iter(iterable)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def _get_doc_id_extractor(doc_id_format: str | Callable) -> Callable[[str], str | None]:
+    """文解析結果の先頭行から文書IDを取り出す関数を返す．
+
+    Args:
+        doc_id_format: 文書IDのフォーマット．``chunk_by_document`` を参照．
+    """
+    if isinstance(doc_id_format, str):
+        if doc_id_format == "default":
+            return partial(_extract_doc_id, pat=Sentence.SID_PAT)
+        if doc_id_format == "kwdlc":
+            return partial(_extract_doc_id, pat=Sentence.SID_PAT_KWDLC)
+        if doc_id_format == "wac":
+            return partial(_extract_doc_id, pat=Sentence.SID_PAT_WAC)
+        raise ValueError(f"Invalid doc_id_format: {doc_id_format}")
+    if callable(doc_id_format):
+        return doc_id_format
+    raise TypeError(f"Invalid doc_id_format: {doc_id_format}")
+
+
 def _extract_doc_id(line: str, pat: re.Pattern) -> str | None:
     """文書IDを抽出する．
 
@@ -0,0 +1,84 @@
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rhoknp.units.sentence import Sentence
+
+
+def _int_array() -> array:
+    return array("i")
+
+
+@dataclass
+class MorphemeTable:
+    """形態素の属性を列ごとに格納した表．
+
+    各列の i 番目の要素が i 番目の形態素に対応する．整数の列は ``array.array`` であり，
+    NumPy を用いる場合は ``numpy.asarray`` によりコピーせずに配列に変換できる．
+
+    Example:
+        >>> import numpy as np
+        >>> table = document.morpheme_table()
+        >>> pos_ids = np.asarray(table.pos_ids)
+        >>> num_nouns = int((pos_ids == 6).sum())  # 名詞の数
+    """
+
+    surfs: list[str] = field(default_factory=list)  #: 表層文字列．
+    readings: list[str] = field(default_factory=list)  #: 読み．
+    lemmas: list[str] = field(default_factory=list)  #: 原形．
+    pos_ids: array = field(default_factory=_int_array)  #: 品詞ID．
+    subpos_ids: array = field(default_factory=_int_array)  #: 品詞細分類ID．
+    conjtype_ids: array = field(default_factory=_int_array)  #: 活用型ID．
+    conjform_ids: array = field(default_factory=_int_array)  #: 活用形ID．
+    #: 形態素が属する基本句のインデックス．基本句が存在しない場合は -1．
+    base_phrase_indices: array = field(default_factory=_int_array)
+    sentence_indices: array = field(default_factory=_int_array)  #: 形態素が属する文のインデックス．
+    starts: array = field(default_factory=_int_array)  #: 文字レベルのスパンの開始位置．
+    ends: array = field(default_factory=_int_array)  #: 文字レベルのスパンの終了位置（この位置を含まない）．
+
+    def __len__(self) -> int:
+        return len(self.surfs)
+
+    @classmethod
+    def from_sentences(cls, sentences: Iterable["Sentence"]) -> "MorphemeTable":
+        """文の列から表を作成．
+
+        基本句のインデックスと文字レベルのスパンは，与えられた文を連結したものの中での位置を表す．
+
+        Args:
+            sentences: 文の列．
+
+        Raises:
+            AttributeError: 形態素解析がされていない文が含まれる場合．
+        """
+        table = cls()
+        char_offset = 0
+        base_phrase_offset = 0
+        for sentence in sentences:
+            sentence_offset = char_offset
+            morphemes = sentence.morphemes
+            num_morphemes = len(morphemes)
+            if sentence.is_knp_required():
+                table.base_phrase_indices.extend([-1] * num_morphemes)
+            else:
+                for base_phrase in sentence.base_phrases:
+                    index = base_phrase_offset + base_phrase.index
+                    table.base_phrase_indices.extend([index] * len(base_phrase.morphemes))
+                base_phrase_offset += len(sentence.base_phrases)
+            table.sentence_indices.extend([sentence.index] * num_morphemes)
+            for morpheme in morphemes:
+                text = morpheme.text
+                table.surfs.append(text)
+                table.readings.append(morpheme.reading)
+                table.lemmas.append(morpheme.lemma)
+                table.pos_ids.append(morpheme.pos_id)
+                table.subpos_ids.append(morpheme.subpos_id)
+                table.conjtype_ids.append(morpheme.conjtype_id)
+                table.conjform_ids.append(morpheme.conjform_id)
+                table.starts.append(char_offset)
+                char_offset += len(text)
+                table.ends.append(char_offset)
+            char_offset = sentence_offset + len(sentence.text)
+        return table
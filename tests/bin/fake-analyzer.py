@@ -0,0 +1,68 @@
+"""Juman++，KNP，KWJA の入出力形式を模倣する解析器．
+
+``python tests/bin/fake-analyzer.py {jumanpp,knp,kwja}`` として起動する．
+入力文の各文字を1つの形態素とし，文ごとに1つの文節と基本句を作る．
+文が "sleep" なら応答の前に3秒待ち，"exit" なら応答せずに異常終了する．
+"""
+
+import sys
+import time
+
+
+def morpheme_line(char: str) -> str:
+    return f"{char} {char} {char} 名詞 6 普通名詞 1 * 0 * 0"
+
+
+def respond(lines: list[str], text: str) -> None:
+    if text == "sleep":
+        time.sleep(3)
+    elif text == "exit":
+        sys.exit(1)
+    sys.stdout.write("".join(line + "\n" for line in lines))
+    sys.stdout.flush()
+
+
+def run_jumanpp() -> None:
+    for raw_line in sys.stdin:
+        line = raw_line.rstrip("\n")
+        if line.startswith("#"):
+            sys.stdout.write(line + "\n")
+            continue
+        respond([morpheme_line(char) for char in line] + ["EOS"], line)
+
+
+def knp_lines(comments: list[str], morphemes: list[str]) -> list[str]:
+    if not morphemes:
+        return [*comments, "EOS"]
+    return [*comments, "* -1D", "+ -1D", *morphemes, "EOS"]
+
+
+def run_knp() -> None:
+    comments: list[str] = []
+    morphemes: list[str] = []
+    for raw_line in sys.stdin:
+        line = raw_line.rstrip("\n")
+        if line == "EOS":
+            text = "".join(morpheme.split(" ")[0] for morpheme in morphemes)
+            respond(knp_lines(comments, morphemes), text)
+            comments, morphemes = [], []
+        elif line.startswith("#"):
+            comments.append(line)
+        elif not line.startswith(("* ", "+ ", "@ ")):
+            morphemes.append(line)
+
+
+def run_kwja() -> None:
+    texts: list[str] = []
+    for raw_line in sys.stdin:
+        line = raw_line.rstrip("\n")
+        if line != "EOD":
+            texts.append(line)
+            continue
+        text = "".join(texts)
+        respond([*knp_lines([], [morpheme_line(char) for char in text]), "EOD"], text)
+        texts = []
+
+
+if __name__ == "__main__":
+    {"jumanpp": run_jumanpp, "knp": run_knp, "kwja": run_kwja}[sys.argv[1]]()
@@ -1,5 +1,7 @@
+import json
 import tempfile
 import textwrap
+from pathlib import Path
 
 import pytest
 from typer.testing import CliRunner
@@ -79,6 +81,17 @@ def test_convert_stdin() -> None:
         assert result.exit_code == 0
 
 
+def test_convert_workers() -> None:
+    with tempfile.NamedTemporaryFile("wt") as f:
+        f.write("".join(path.read_text() for path in sorted(Path("tests/data").glob("w2011*.knp"))))
+        f.flush()
+        for format_ in ("text", "jumanpp", "knp"):
+            expected = runner.invoke(app, ["convert", f.name, "--format", format_])
+            result = runner.invoke(app, ["convert", f.name, "--format", format_, "--workers", "2", "--chunksize", "2"])
+            assert result.exit_code == 0
+            assert result.stdout == expected.stdout
+
+
 def test_convert_value_error() -> None:
     doc = Document.from_knp(knp_text)
     with tempfile.NamedTemporaryFile("wt") as f:
@@ -119,6 +132,17 @@ def test_stats_json() -> None:
         assert result.exit_code == 0
 
 
+def test_stats_workers() -> None:
+    with tempfile.NamedTemporaryFile("wt") as f:
+        f.write("".join(path.read_text() for path in sorted(Path("tests/data").glob("w2011*.knp"))))
+        f.flush()
+        expected = runner.invoke(app, ["stats", f.name, "--json"])
+        result = runner.invoke(app, ["stats", f.name, "--json", "--workers", "2"])
+        assert result.exit_code == 0
+        for key in ("sentence", "phrase", "base_phrase", "morpheme"):
+            assert json.loads(result.stdout)["unit"][key] == json.loads(expected.stdout)["unit"][key]
+
+
 def test_stats_error() -> None:
     result = runner.invoke(app, ["stats", "foo.knp"])  # not exist
     assert result.exit_code == 2
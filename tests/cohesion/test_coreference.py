@@ -4,7 +4,7 @@ from pathlib import Path
 import pytest
 
 from rhoknp import Sentence
-from rhoknp.cohesion import Entity, EntityManager, ExophoraArgument, ExophoraReferent
+from rhoknp.cohesion import Entity, ExophoraArgument, ExophoraReferent
 from rhoknp.units import BasePhrase, Document
 
 
@@ -69,7 +69,7 @@ def test_exophora_entity() -> None:
 
 
 def test_coref_sentence() -> None:
-    _ = Sentence.from_knp(
+    sentence = Sentence.from_knp(
         textwrap.dedent(
             """\
             # S-ID:000-0-0
@@ -92,7 +92,7 @@ def test_coref_sentence() -> None:
         )
     )
 
-    entities: list[Entity] = sorted(EntityManager.entities.values(), key=lambda e: e.eid)
+    entities: list[Entity] = sorted(sentence.entity_manager.entities.values(), key=lambda e: e.eid)
     assert len(entities) == 2
 
     entity = entities[0]
@@ -114,9 +114,9 @@ def test_coref_sentence() -> None:
 
 def test_coref1() -> None:
     doc_id = "w201106-0000060050"
-    _ = Document.from_knp(Path(f"tests/data/{doc_id}.knp").read_text())
+    document = Document.from_knp(Path(f"tests/data/{doc_id}.knp").read_text())
 
-    entities: list[Entity] = sorted(EntityManager.entities.values(), key=lambda e: e.eid)
+    entities: list[Entity] = sorted(document.entity_manager.entities.values(), key=lambda e: e.eid)
     assert len(entities) == 19
 
     entity = entities[0]
@@ -249,8 +249,8 @@ def test_coref1() -> None:
 
 def test_coref2() -> None:
     doc_id = "w201106-0000060560"
-    _ = Document.from_knp(Path(f"tests/data/{doc_id}.knp").read_text())
-    entities: list[Entity] = sorted(EntityManager.entities.values(), key=lambda e: e.eid)
+    document = Document.from_knp(Path(f"tests/data/{doc_id}.knp").read_text())
+    entities: list[Entity] = sorted(document.entity_manager.entities.values(), key=lambda e: e.eid)
     assert len(entities) == 15
 
     entity: Entity = entities[12]
@@ -274,7 +274,7 @@ def test_coref2() -> None:
 @pytest.mark.parametrize("doc_id", ["w201106-0000060050", "w201106-0000060560", "w201106-0000060877"])
 def test_coref_link(doc_id: str) -> None:
     document = Document.from_knp(Path(f"tests/data/{doc_id}.knp").read_text())
-    entities: list[Entity] = sorted(EntityManager.entities.values(), key=lambda e: e.eid)
+    entities: list[Entity] = sorted(document.entity_manager.entities.values(), key=lambda e: e.eid)
 
     for entity in entities:
         for mention in entity.mentions:
@@ -288,6 +288,19 @@ def test_coref_link(doc_id: str) -> None:
             assert mention in entity.mentions_nonidentical
 
 
+def test_entity_manager_per_document() -> None:
+    doc_id = "w201106-0000060050"
+    document = Document.from_knp(Path(f"tests/data/{doc_id}.knp").read_text())
+    another_document = Document.from_knp(Path("tests/data/w201106-0000060560.knp").read_text())
+    assert document.entity_manager is not another_document.entity_manager
+    assert len(document.entity_manager.entities) == 19
+    for sentence in document.sentences:
+        assert sentence.entity_manager is document.entity_manager
+    for base_phrase in document.base_phrases:
+        for entity in base_phrase.entities_all:
+            assert document.entity_manager.entities[entity.eid] is entity
+
+
 def test_coreferents() -> None:
     doc_id = "w201106-0000060560"
     document = Document.from_knp(Path(f"tests/data/{doc_id}.knp").read_text())
@@ -310,7 +323,7 @@ def test_coreferents_nonidentical() -> None:
 
 
 def test_coref_with_self() -> None:
-    _ = Sentence.from_knp(
+    sentence = Sentence.from_knp(
         textwrap.dedent(
             """\
             # S-ID:000-0-0
@@ -322,7 +335,7 @@ def test_coref_with_self() -> None:
         )
     )
 
-    entities: list[Entity] = sorted(EntityManager.entities.values(), key=lambda e: e.eid)
+    entities: list[Entity] = sorted(sentence.entity_manager.entities.values(), key=lambda e: e.eid)
     assert len(entities) == 1
     entity = entities[0]
     assert entity.exophora_referent is None
@@ -352,7 +365,7 @@ def test_coref_include_self() -> None:
 
 
 def test_merge_entity_0() -> None:
-    _ = Sentence.from_knp(
+    sentence = Sentence.from_knp(
         textwrap.dedent(
             """\
             # S-ID:000-0-0
@@ -370,7 +383,7 @@ def test_merge_entity_0() -> None:
         )
     )
 
-    entities: list[Entity] = sorted(EntityManager.entities.values(), key=lambda e: e.eid)
+    entities: list[Entity] = sorted(sentence.entity_manager.entities.values(), key=lambda e: e.eid)
     assert len(entities) == 2
 
     entity = entities[0]
@@ -401,7 +414,7 @@ def test_merge_entity_0() -> None:
 
 
 def test_merge_entity_1() -> None:
-    _ = Sentence.from_knp(
+    sentence = Sentence.from_knp(
         textwrap.dedent(
             """\
             # S-ID:000-0-0
@@ -416,7 +429,7 @@ def test_merge_entity_1() -> None:
         )
     )
 
-    entities: list[Entity] = sorted(EntityManager.entities.values(), key=lambda e: e.eid)
+    entities: list[Entity] = sorted(sentence.entity_manager.entities.values(), key=lambda e: e.eid)
     assert len(entities) == 1
 
     entity = entities[0]
@@ -432,7 +445,7 @@ def test_merge_entity_1() -> None:
 
 
 def test_merge_entity_2() -> None:
-    _ = Sentence.from_knp(
+    sentence = Sentence.from_knp(
         textwrap.dedent(
             """\
             # S-ID:000-0-0
@@ -447,7 +460,7 @@ def test_merge_entity_2() -> None:
         )
     )
 
-    entities: list[Entity] = sorted(EntityManager.entities.values(), key=lambda e: e.eid)
+    entities: list[Entity] = sorted(sentence.entity_manager.entities.values(), key=lambda e: e.eid)
     assert len(entities) == 1
 
     entity = entities[0]
@@ -463,7 +476,7 @@ def test_merge_entity_2() -> None:
 
 
 def test_merge_entity_3() -> None:
-    _ = Sentence.from_knp(
+    sentence = Sentence.from_knp(
         textwrap.dedent(
             """\
             # S-ID:000-0-0
@@ -478,7 +491,7 @@ def test_merge_entity_3() -> None:
         )
     )
 
-    entities: list[Entity] = sorted(EntityManager.entities.values(), key=lambda e: e.eid)
+    entities: list[Entity] = sorted(sentence.entity_manager.entities.values(), key=lambda e: e.eid)
     assert len(entities) == 2
 
     entity = entities[0]
@@ -519,15 +532,16 @@ def test_merge_entity_4() -> None:
             """
         )
     )
-    EntityManager.reset()
+    entity_manager = sentence.entity_manager
+    entity_manager.reset()
     target_mention = sentence.base_phrases[0]
-    entity = EntityManager.get_or_create_entity()
+    entity = entity_manager.get_or_create_entity()
     entity.add_mention(target_mention, is_nonidentical=True)
     source_mention = sentence.base_phrases[1]
     entity.add_mention(source_mention, is_nonidentical=False)
-    EntityManager.merge_entities(source_mention, target_mention, entity, entity, is_nonidentical=False)
+    entity_manager.merge_entities(source_mention, target_mention, entity, entity, is_nonidentical=False)
 
-    assert len(EntityManager.entities) == 1
+    assert len(entity_manager.entities) == 1
     assert entity.exophora_referent is None
     assert len(entity.mentions_all) == 2
     mentions_identical = sorted(entity.mentions, key=lambda x: x.global_index)
@@ -566,4 +580,91 @@ def test_update_argument_eid() -> None:
     exophora_arguments = [arg for arg in pas.get_arguments("ヲ") if isinstance(arg, ExophoraArgument)]
     assert len(exophora_arguments) == 1
     assert exophora_arguments[0].eid == 2
-    assert len(EntityManager.entities) == 2
+    assert len(doc.entity_manager.entities) == 2
+
+
+def test_update_optional_argument_eid() -> None:
+    doc = Document.from_knp(
+        textwrap.dedent(
+            """\
+            # S-ID:000-0-0
+            * -1D
+            + -1D <rel type="ヲ" target="不特定:人１"/><rel type="ヲ" target="なし"/>
+            見た みた 見る 動詞 2 * 0 母音動詞 1 タ形 10
+            EOS
+            # S-ID:000-0-1
+            * -1D
+            + -1D <rel type="=" target="不特定:人１"/>
+            彼 かれ 彼 名詞 6 普通名詞 1 * 0 * 0
+            EOS
+            """
+        )
+    )
+    pas = doc.base_phrases[0].pas
+    exophora_arguments = pas.get_arguments("ヲ", relax=False, include_optional=True)
+    assert len(exophora_arguments) == 1
+    assert isinstance(exophora_arguments[0], ExophoraArgument)
+    assert exophora_arguments[0].eid in doc.entity_manager.entities
+    entity = doc.entity_manager.entities[exophora_arguments[0].eid]
+    assert entity.exophora_referent == ExophoraReferent("不特定:人１")
+    assert entity.mentions == [doc.base_phrases[1]]
+
+
+def test_long_coreference_chain() -> None:
+    num_sentences = 300
+    knp = ""
+    for i in range(num_sentences):
+        rel_tag = f'<rel type="=" target="彼" sid="000-{i - 1}" id="0"/>' if i > 0 else ""
+        if i == num_sentences // 2:
+            rel_tag += '<rel type="=≒" target="著者"/>'
+        knp += textwrap.dedent(
+            f"""\
+            # S-ID:000-{i}
+            * -1D
+            + -1D {rel_tag}
+            彼 かれ 彼 名詞 6 普通名詞 1 * 0 * 0
+            EOS
+            """
+        )
+    doc = Document.from_knp(knp)
+    assert len(doc.entity_manager.entities) == 2
+    chain = next(e for e in doc.entity_manager.entities.values() if e.exophora_referent is None)
+    author = next(e for e in doc.entity_manager.entities.values() if e.exophora_referent is not None)
+    assert author.exophora_referent == ExophoraReferent("著者")
+    assert sorted(m.global_index for m in chain.mentions) == list(range(num_sentences))
+    assert chain.mentions_nonidentical == []
+    # The nonidentical relation is propagated to the succeeding mentions in the chain.
+    assert author.mentions == []
+    assert sorted(m.global_index for m in author.mentions_nonidentical) == list(
+        range(num_sentences // 2, num_sentences)
+    )
+    for base_phrase in doc.base_phrases:
+        assert base_phrase.entities == {chain}
+        expected = {author} if base_phrase.global_index >= num_sentences // 2 else set()
+        assert base_phrase.entities_nonidentical == expected
+
+
+def test_delete_entity() -> None:
+    sentence = Sentence.from_knp(
+        textwrap.dedent(
+            """\
+            # S-ID:000-0-0
+            * 1D
+            + 1D
+            わたし わたし わたし 名詞 6 普通名詞 1 * 0 * 0
+            * -1D
+            + -1D <rel type="=≒" target="わたし" sid="000-0-0" id="0"/>
+            自分 じぶん 自分 名詞 6 普通名詞 1 * 0 * 0
+            EOS
+            """
+        )
+    )
+    entity_manager = sentence.entity_manager
+    source_mention, target_mention = sentence.base_phrases[1], sentence.base_phrases[0]
+    (target_entity,) = target_mention.entities
+    assert source_mention.entities_nonidentical == {target_entity}
+    entity_manager.delete_entity(target_entity)
+    assert target_entity.eid not in entity_manager.entities
+    assert target_entity.mentions_all == []
+    assert target_mention.entities == set()
+    assert source_mention.entities_nonidentical == set()
@@ -6,7 +6,7 @@ from typing import Any
 import pytest
 
 from rhoknp import Sentence
-from rhoknp.cohesion import ArgumentType, EndophoraArgument, ExophoraArgument
+from rhoknp.cohesion import ArgumentType, EndophoraArgument, ExophoraArgument, ExophoraReferent
 from rhoknp.cohesion.pas import normalize_case
 from rhoknp.units import Document
 
@@ -591,6 +591,86 @@ def test_get_all_arguments() -> None:
     assert {str(arg) for arg in all_arguments["ヲ"]} == {"トスを"}
 
 
+def test_get_arguments_nonidentical_does_not_modify_arguments() -> None:
+    doc = Document.from_knp(
+        textwrap.dedent(
+            """\
+            # S-ID:000-0
+            * 1D
+            + 1D
+            彼 かれ 彼 名詞 6 普通名詞 1 * 0 * 0
+            * -1D
+            + -1D <rel type="ガ" target="彼" sid="000-0" id="0"/><rel type="ガ≒" target="著者"/>
+            見た みた 見る 動詞 2 * 0 母音動詞 1 タ形 10
+            EOS
+            """
+        )
+    )
+    pas = doc.base_phrases[1].pas
+    assert {str(arg) for arg in pas.get_arguments("ガ", relax=False, include_nonidentical=True)} == {"彼", "著者"}
+    assert {str(arg) for arg in pas.get_arguments("ガ", relax=False)} == {"彼"}
+    assert len(pas._arguments["ガ"]) == 1
+
+
+def test_get_arguments_cache() -> None:
+    doc = Document.from_knp(
+        textwrap.dedent(
+            """\
+            # S-ID:000-0
+            * 2D
+            + 2D
+            彼 かれ 彼 名詞 6 普通名詞 1 * 0 * 0
+            * 2D
+            + 2D
+            太郎 たろう 太郎 名詞 6 人名 5 * 0 * 0
+            * -1D
+            + -1D <rel type="ガ" target="彼" sid="000-0" id="0"/>
+            見た みた 見る 動詞 2 * 0 母音動詞 1 タ形 10
+            EOS
+            """
+        )
+    )
+    pas = doc.base_phrases[2].pas
+    arguments = pas.get_arguments("ガ")
+    assert {str(arg) for arg in arguments} == {"彼"}
+    assert pas.get_arguments("ガ") == arguments
+    assert pas.get_all_arguments()["ガ"] == arguments
+
+    # Modifying the returned list does not affect the cache.
+    arguments.clear()
+    assert {str(arg) for arg in pas.get_arguments("ガ")} == {"彼"}
+    arguments = pas.get_arguments("ガ")
+
+    # Coreference changes in another document do not invalidate the cache.
+    num_changes = doc.entity_manager._num_changes
+    other_doc = Document.from_knp(doc.to_knp())
+    (other_entity,) = other_doc.base_phrases[0].entities
+    other_entity.add_mention(other_doc.base_phrases[1])
+    assert doc.entity_manager._num_changes == num_changes
+
+    # The cache is invalidated when coreference relations change.
+    (entity,) = doc.base_phrases[0].entities
+    entity.add_mention(doc.base_phrases[1])
+    arguments = pas.get_arguments("ガ")
+    assert {str(arg) for arg in arguments} == {"彼", "太郎"}
+    assert all(arg.pas is pas for arg in arguments)
+    assert pas.get_arguments("ガ", relax=False) == [arguments[0]]
+
+    # The cache is invalidated when an argument is added.
+    pas.add_argument(ExophoraArgument("ヲ", ExophoraReferent("不特定:物"), eid=100))
+    assert {str(arg) for arg in pas.get_arguments("ヲ", relax=False)} == {"不特定:物"}
+
+    # Adding an argument updates the PAS lists without discarding caches of the unit tree.
+    base_phrases = doc.base_phrases
+    other_pas = doc.base_phrases[1].pas
+    assert other_pas not in doc.pas_list
+    assert other_pas not in doc.sentences[0].pas_list
+    other_pas.add_argument(ExophoraArgument("ガ", ExophoraReferent("著者"), eid=101))
+    assert other_pas in doc.pas_list
+    assert other_pas in doc.sentences[0].pas_list
+    assert doc.base_phrases is base_phrases
+
+
 @pytest.mark.parametrize(
     "case",
     [("が", "ガ"), ("を", "ヲ"), ("ヲ", "ヲ"), ("が2", "ガ２"), ("判が", "判ガ"), ("外の関係", "外の関係")],
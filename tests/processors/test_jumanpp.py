@@ -1,4 +1,7 @@
+import asyncio
 import concurrent.futures
+import sys
+import time
 
 import pytest
 
@@ -6,6 +9,8 @@ from rhoknp import Document, Jumanpp, RegexSenter, Sentence
 
 is_jumanpp_available = Jumanpp(options=["--juman"]).is_available()
 
+fake_jumanpp_options = ["tests/bin/fake-analyzer.py", "jumanpp"]
+
 
 @pytest.mark.skipif(not is_jumanpp_available, reason="Juman++ is not available")
 def test_call() -> None:
@@ -73,6 +78,82 @@ def test_apply_to_document(text: str) -> None:
     assert doc.text == text.replace("\r", "").replace("\n", "")
 
 
+@pytest.mark.skipif(not is_jumanpp_available, reason="Juman++ is not available")
+def test_apply_to_sentences() -> None:
+    jumanpp = Jumanpp()
+    texts = ["外国人参政権", "望遠鏡で泳いでいる少女を見た。", "エネルギーを素敵にENEOS"] * 10
+    sentences = jumanpp.apply_to_sentences(texts, max_in_flight=4)
+    assert [sentence.text for sentence in sentences] == texts
+
+
+def test_apply_to_sentences_mock() -> None:
+    jumanpp = Jumanpp("tests/bin/jumanpp-mock.sh", skip_sanity_check=True)
+    sentences = list(jumanpp.apply_to_sentences((f"テスト{i}" for i in range(10)), max_in_flight=3))
+    assert len(sentences) == 10
+    assert all(sentence.text == "こんにちはさようなら" for sentence in sentences)
+
+    with pytest.raises(TimeoutError):
+        _ = list(jumanpp.apply_to_sentences(["テスト", "time consuming input", "テスト"], timeout=1))
+
+
+@pytest.mark.skipif(not is_jumanpp_available, reason="Juman++ is not available")
+def test_apply_async() -> None:
+    jumanpp = Jumanpp()
+    texts = ["外国人参政権", "望遠鏡で泳いでいる少女を見た。", "エネルギーを素敵にENEOS"]
+
+    async def main() -> list[Sentence | Document]:
+        return await asyncio.gather(
+            *(jumanpp.apply_async(Sentence(text)) for text in texts), jumanpp.apply_async("".join(texts))
+        )
+
+    *sentences, document = asyncio.run(main())
+    assert [sentence.text for sentence in sentences] == texts
+    assert isinstance(document, Document)
+    assert document.text == "".join(texts)
+
+
+def test_apply_async_mock() -> None:
+    jumanpp = Jumanpp("tests/bin/jumanpp-mock.sh", skip_sanity_check=True)
+
+    async def cancel() -> Sentence:
+        task = asyncio.create_task(jumanpp.apply_to_sentence_async("knp time consuming input"))
+        await asyncio.sleep(0)  # let the task send its input
+        task.cancel()
+        # The output for the cancelled input is discarded and not returned for the next input
+        return await jumanpp.apply_to_sentence_async("テスト")
+
+    sentence = asyncio.run(cancel())
+    assert sentence.comment == ""
+    assert sentence.text == "こんにちはさようなら"
+
+    document = asyncio.run(jumanpp.apply_to_document_async("テスト。テスト。"))
+    assert len(document.sentences) == 2
+
+    with pytest.raises(TimeoutError):
+        _ = asyncio.run(jumanpp.apply_to_sentence_async("time consuming input", timeout=1))
+    with pytest.raises(RuntimeError, match="exited unexpectedly"):
+        _ = asyncio.run(jumanpp.apply_to_sentence_async("error causing input"))
+    assert jumanpp.is_available() is True
+
+
+def test_pool() -> None:
+    jumanpp = Jumanpp("tests/bin/jumanpp-mock.sh", skip_sanity_check=True, pool_size=4)
+    assert repr(jumanpp) == "Jumanpp(executable='tests/bin/jumanpp-mock.sh', pool_size=4)"
+    texts = [f"テスト{i}" for i in range(40)]
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        sentences = list(executor.map(jumanpp.apply_to_sentence, texts))
+    assert all(sentence.text == "こんにちはさようなら" for sentence in sentences)
+
+    # A crashed worker does not affect the others and is restarted
+    with pytest.raises(RuntimeError, match="exited unexpectedly"):
+        _ = jumanpp.apply_to_sentence("error causing input")
+    assert jumanpp.is_available() is True
+    assert len(list(jumanpp.apply_to_sentences(texts))) == 40
+
+    with pytest.raises(ValueError, match="pool_size must be a positive integer"):
+        _ = Jumanpp("tests/bin/jumanpp-mock.sh", skip_sanity_check=True, pool_size=0)
+
+
 @pytest.mark.skipif(not is_jumanpp_available, reason="Juman++ is not available")
 def test_thread_safe() -> None:
     jumanpp = Jumanpp()
@@ -205,3 +286,54 @@ def test_runtime_error2() -> None:
 def test_repr() -> None:
     jumanpp = Jumanpp(options=["--juman"], senter=RegexSenter())
     assert repr(jumanpp) == "Jumanpp(executable='jumanpp', options=['--juman'], senter=RegexSenter())"
+
+
+def test_fake_runtime_error() -> None:
+    jumanpp = Jumanpp(sys.executable, options=fake_jumanpp_options)
+    with pytest.raises(RuntimeError, match="Juman\\+\\+ exited unexpectedly"):
+        _ = jumanpp.apply_to_sentence("exit")
+    # The exited process is replaced and the next input is processed
+    assert jumanpp.apply_to_sentence("テスト").text == "テスト"
+
+
+@pytest.mark.parametrize("pool_size", [1, 3])
+def test_fake_apply_to_sentences(pool_size: int) -> None:
+    jumanpp = Jumanpp(sys.executable, options=fake_jumanpp_options, pool_size=pool_size)
+    texts = [f"テスト{i}" for i in range(10)]
+    sentences = jumanpp.apply_to_sentences(iter(texts), max_in_flight=2)
+    assert [sentence.text for sentence in sentences] == texts
+    with pytest.raises(ValueError, match="max_in_flight"):
+        _ = jumanpp.apply_to_sentences(texts, max_in_flight=0)
+
+
+def test_fake_timeout_keeps_other_inputs() -> None:
+    jumanpp = Jumanpp(sys.executable, options=fake_jumanpp_options)
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        timed_out = executor.submit(jumanpp.apply_to_sentence, "sleep", timeout=1)
+        time.sleep(0.2)  # let the slow input reach the process first
+        other = executor.submit(jumanpp.apply_to_sentence, "テスト")
+        with pytest.raises(TimeoutError):
+            _ = timed_out.result()
+        # The input queued behind the timed-out one is resubmitted to the restarted process
+        assert other.result().text == "テスト"
+
+
+def test_fake_apply_async() -> None:
+    jumanpp = Jumanpp(sys.executable, options=fake_jumanpp_options)
+    texts = [f"テスト{i}" for i in range(5)]
+
+    async def main() -> list[Sentence | BaseException]:
+        return await asyncio.gather(
+            jumanpp.apply_to_sentence_async("sleep", timeout=1),
+            *(jumanpp.apply_to_sentence_async(text) for text in texts),
+            return_exceptions=True,
+        )
+
+    timed_out, *sentences = asyncio.run(main())
+    assert isinstance(timed_out, TimeoutError)
+    assert [sentence.text for sentence in sentences if isinstance(sentence, Sentence)] == texts
+
+    with pytest.raises(RuntimeError, match="exited unexpectedly"):
+        _ = asyncio.run(jumanpp.apply_to_sentence_async("exit"))
+    document = asyncio.run(jumanpp.apply_to_document_async("テスト。テスト。"))
+    assert [sentence.text for sentence in document.sentences] == ["テスト。", "テスト。"]
@@ -1,11 +1,18 @@
+import asyncio
 import concurrent.futures
+import sys
+import time
 
 import pytest
 
 from rhoknp import KNP, Document, Jumanpp, RegexSenter, Sentence
+from rhoknp.processors.processor import Processor
 
 is_knp_available = KNP().is_available()
 
+fake_jumanpp_options = ["tests/bin/fake-analyzer.py", "jumanpp"]
+fake_knp_options = ["tests/bin/fake-analyzer.py", "knp", "-tab"]
+
 
 @pytest.mark.skipif(not is_knp_available, reason="KNP is not available")
 def test_call() -> None:
@@ -76,6 +83,32 @@ def test_apply_to_sentence(text: str) -> None:
     assert sent.text == text.replace("\r", "").replace("\n", "")
 
 
+@pytest.mark.skipif(not is_knp_available, reason="KNP is not available")
+def test_apply_to_sentences() -> None:
+    jumanpp = Jumanpp()
+    knp = KNP()
+    texts = ["外国人参政権", "望遠鏡で泳いでいる少女を見た。", "エネルギーを素敵にENEOS"] * 10
+    inputs = [jumanpp.apply_to_sentence(text) if i % 2 == 0 else text for i, text in enumerate(texts)]
+    sentences = knp.apply_to_sentences(inputs, timeout=60, max_in_flight=4)
+    assert [sentence.text for sentence in sentences] == texts
+
+
+@pytest.mark.skipif(not is_knp_available, reason="KNP is not available")
+def test_apply_async() -> None:
+    knp = KNP()
+    texts = ["外国人参政権", "望遠鏡で泳いでいる少女を見た。", "エネルギーを素敵にENEOS"]
+
+    async def main() -> list[Sentence | Document]:
+        return await asyncio.gather(
+            *(knp.apply_async(Sentence(text)) for text in texts), knp.apply_async("".join(texts))
+        )
+
+    *sentences, document = asyncio.run(main())
+    assert [sentence.text for sentence in sentences] == texts
+    assert isinstance(document, Document)
+    assert document.text == "".join(texts)
+
+
 @pytest.mark.skipif(not is_knp_available, reason="KNP is not available")
 def test_thread_safe() -> None:
     knp = KNP()
@@ -188,6 +221,58 @@ def test_runtime_error() -> None:
         _ = knp.apply_to_sentence("knp error causing input", timeout=1)
 
 
+def test_default_jumanpp_pool_size() -> None:
+    knp = KNP("tests/bin/knp-mock.sh", skip_sanity_check=True, pool_size=2)
+    jumanpp = knp._get_jumanpp()
+    assert isinstance(jumanpp, Jumanpp)
+    assert jumanpp.pool_size == 2
+
+
+class _SlowJumanpp(Processor):
+    """1秒かけて KNP のモックが時間をかける入力を返す形態素解析器．"""
+
+    def apply_to_document(self, document: Document | str, timeout: int = 10) -> Document:
+        raise NotImplementedError
+
+    def apply_to_sentence(self, sentence: Sentence | str, timeout: int = 10) -> Sentence:
+        text = sentence if isinstance(sentence, str) else sentence.text
+        time.sleep(min(1, timeout))
+        return Sentence.from_jumanpp(f"# knp time consuming input\n{text} {text} {text} 感動詞 12 * 0 * 0 * 0\nEOS\n")
+
+
+def test_timeout_includes_jumanpp() -> None:
+    knp = KNP("tests/bin/knp-mock.sh", jumanpp=_SlowJumanpp(), skip_sanity_check=True)
+    # Juman++ and KNP share the time limit
+    start = time.time()
+    with pytest.raises(TimeoutError):
+        _ = knp.apply_to_sentence("こんにちは", timeout=2)
+    assert time.time() - start < 2.8
+
+    knp.start_process(skip_sanity_check=True)
+    start = time.time()
+    with pytest.raises(TimeoutError):
+        _ = asyncio.run(knp.apply_to_sentence_async("こんにちは", timeout=2))
+    assert time.time() - start < 2.8
+
+
+def test_forward_jumanpp_output(monkeypatch: pytest.MonkeyPatch) -> None:
+    jumanpp = Jumanpp("tests/bin/jumanpp-mock.sh", skip_sanity_check=True)
+    knp = KNP("tests/bin/knp-mock.sh", jumanpp=jumanpp, skip_sanity_check=True)
+
+    def from_jumanpp(*_, **__) -> Sentence:
+        raise AssertionError("the output of Juman++ must not be parsed")
+
+    # The output of Juman++ is forwarded to KNP as is.
+    monkeypatch.setattr(Sentence, "from_jumanpp", from_jumanpp)
+    sentence = knp.apply_to_sentence("こんにちは")
+    assert sentence.is_knp_required() is False
+    sentences = list(knp.apply_to_sentences(["こんにちは"] * 5, max_in_flight=2))
+    assert len(sentences) == 5
+    assert all(sentence.is_knp_required() is False for sentence in sentences)
+    sentence = asyncio.run(knp.apply_to_sentence_async("こんにちは"))
+    assert sentence.is_knp_required() is False
+
+
 @pytest.mark.skipif(not is_knp_available, reason="KNP is not available")
 def test_runtime_error2() -> None:
     knp = KNP()
@@ -210,3 +295,98 @@ def test_repr() -> None:
         repr(knp)
         == "KNP(executable='knp', options=['-tab'], senter=RegexSenter(), jumanpp=Jumanpp(executable='jumanpp'))"
     )
+
+
+def _fake_jumanpp_sentence(text: str) -> Sentence:
+    return Sentence.from_jumanpp(
+        "".join(f"{char} {char} {char} 名詞 6 普通名詞 1 * 0 * 0\n" for char in text) + "EOS\n"
+    )
+
+
+def _fake_knp(pool_size: int = 1) -> KNP:
+    jumanpp = Jumanpp(sys.executable, options=fake_jumanpp_options)
+    return KNP(sys.executable, options=fake_knp_options, jumanpp=jumanpp, pool_size=pool_size)
+
+
+def test_fake_runtime_error() -> None:
+    knp = _fake_knp()
+    with pytest.raises(RuntimeError, match="KNP exited unexpectedly"):
+        _ = knp.apply_to_sentence(_fake_jumanpp_sentence("exit"))
+    with pytest.raises(RuntimeError, match="Juman\\+\\+ exited unexpectedly"):
+        _ = knp.apply_to_sentence("exit")
+    # Both exited processes are replaced and the next input is processed
+    assert knp.apply_to_sentence("テスト").text == "テスト"
+
+
+@pytest.mark.parametrize("pool_size", [1, 3])
+def test_fake_apply_to_sentences(pool_size: int) -> None:
+    knp = _fake_knp(pool_size=pool_size)
+    texts = [f"テスト{i}" for i in range(10)]
+    inputs: list[Sentence | str] = [_fake_jumanpp_sentence(text) if i % 2 else text for i, text in enumerate(texts)]
+    sentences = knp.apply_to_sentences(iter(inputs), max_in_flight=2)
+    assert [sentence.text for sentence in sentences] == texts
+    with pytest.raises(ValueError, match="max_in_flight"):
+        _ = knp.apply_to_sentences(texts, max_in_flight=0)
+
+
+def test_fake_timeout_keeps_other_inputs() -> None:
+    knp = _fake_knp()
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        timed_out = executor.submit(knp.apply_to_sentence, _fake_jumanpp_sentence("sleep"), timeout=1)
+        time.sleep(0.2)  # let the slow input reach the process first
+        other = executor.submit(knp.apply_to_sentence, "テスト")
+        with pytest.raises(TimeoutError):
+            _ = timed_out.result()
+        # The input queued behind the timed-out one is resubmitted to the restarted process
+        assert other.result().text == "テスト"
+
+
+def test_fake_apply_async() -> None:
+    knp = _fake_knp()
+    texts = [f"テスト{i}" for i in range(5)]
+
+    async def main() -> list[Sentence | BaseException]:
+        return await asyncio.gather(
+            knp.apply_to_sentence_async(_fake_jumanpp_sentence("sleep"), timeout=1),
+            *(knp.apply_to_sentence_async(text) for text in texts),
+            return_exceptions=True,
+        )
+
+    timed_out, *sentences = asyncio.run(main())
+    assert isinstance(timed_out, TimeoutError)
+    assert [sentence.text for sentence in sentences if isinstance(sentence, Sentence)] == texts
+
+    with pytest.raises(RuntimeError, match="KNP exited unexpectedly"):
+        _ = asyncio.run(knp.apply_to_sentence_async(_fake_jumanpp_sentence("exit")))
+    document = asyncio.run(knp.apply_to_document_async("テスト。テスト。"))
+    assert [sentence.text for sentence in document.sentences] == ["テスト。", "テスト。"]
+
+
+def test_fake_forward() -> None:
+    knp = _fake_knp()
+    sentence = Sentence.from_raw_text("# S-ID:1\nテスト\n")
+
+    request = knp._submit_sentence(sentence, timeout=10)
+    assert request.jumanpp_pool is not None
+    knp._forward(request, timeout=10)
+    assert request.jumanpp_pool is None
+    result = knp._receive_sentence(request, timeout=10)
+    assert result.sid == "1"
+    assert [morpheme.text for morpheme in result.morphemes] == ["テ", "ス", "ト"]
+
+    async def forward_async() -> Sentence:
+        request = await knp._submit_sentence_async(sentence, timeout=10)
+        assert request.jumanpp_pool is not None
+        await knp._forward_async(request, timeout=10)
+        assert request.jumanpp_pool is None
+        return await knp._receive_sentence_async(request, timeout=10)
+
+    result = asyncio.run(forward_async())
+    assert result.sid == "1"
+    assert result.text == "テスト"
+
+    # A timeout while waiting for Juman++ is reported by _forward
+    request = knp._submit_sentence(Sentence("sleep"), timeout=1)
+    with pytest.raises(TimeoutError):
+        knp._forward(request, timeout=1)
+    assert knp.apply_to_sentence("テスト").text == "テスト"
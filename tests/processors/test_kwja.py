@@ -1,9 +1,16 @@
+import asyncio
+import concurrent.futures
+import sys
+import time
+
 import pytest
 
 from rhoknp import KNP, KWJA, Document, Jumanpp, Sentence
 
 is_kwja_available = KWJA(options=["--model-size", "tiny", "--tasks", "typo"]).is_available()
 
+fake_kwja_options = ["tests/bin/fake-analyzer.py", "kwja"]
+
 
 @pytest.mark.skipif(not is_kwja_available, reason="KWJA is not available")
 def test_get_version() -> None:
@@ -144,6 +151,25 @@ def test_keep_doc_id_document() -> None:
         assert sent.doc_id == "test"
 
 
+@pytest.mark.skipif(not is_kwja_available, reason="KWJA is not available")
+def test_apply_to_documents() -> None:
+    kwja = KWJA(options=["--model-size", "tiny", "--tasks", "typo"])
+    texts = ["人口知能", "こんにちは。さようなら。"]
+    documents = kwja.apply_to_documents(texts, max_in_flight=1)
+    assert [document.text for document in documents] == ["人工知能", "こんにちは。さようなら。"]
+
+
+def test_apply_async_mock() -> None:
+    kwja = KWJA("tests/bin/kwja-mock.sh", skip_sanity_check=True)
+    document = asyncio.run(kwja.apply_async("テスト"))
+    assert isinstance(document, Document)
+    assert document.text == "こんにちは"
+
+    kwja = KWJA("tests/bin/kwja-mock.sh", skip_sanity_check=True)
+    with pytest.raises(TimeoutError):
+        _ = asyncio.run(kwja.apply_to_document_async("time consuming input", timeout=1))
+
+
 def test_timeout_error() -> None:
     kwja = KWJA("tests/bin/kwja-mock.sh", skip_sanity_check=True)
     with pytest.raises(TimeoutError):
@@ -174,3 +200,53 @@ def test_apply_to_sentence() -> None:
 def test_repr() -> None:
     kwja = KWJA(options=["--model-size", "tiny", "--tasks", "char,word"])
     assert repr(kwja) == "KWJA(executable='kwja', options=['--model-size', 'tiny', '--tasks', 'char,word'])"
+
+
+def test_fake_runtime_error() -> None:
+    kwja = KWJA(sys.executable, options=fake_kwja_options)
+    with pytest.raises(RuntimeError, match="KWJA exited unexpectedly"):
+        _ = kwja.apply_to_document("exit")
+    # The exited process is replaced and the next input is processed
+    assert kwja.apply_to_document("テスト").text == "テスト"
+
+
+@pytest.mark.parametrize("pool_size", [1, 3])
+def test_fake_apply_to_documents(pool_size: int) -> None:
+    kwja = KWJA(sys.executable, options=fake_kwja_options, pool_size=pool_size)
+    texts = [f"テスト{i}" for i in range(10)]
+    documents = kwja.apply_to_documents(iter(texts), max_in_flight=2)
+    assert [document.text for document in documents] == texts
+    with pytest.raises(ValueError, match="max_in_flight"):
+        _ = kwja.apply_to_documents(texts, max_in_flight=0)
+
+
+def test_fake_timeout_keeps_other_inputs() -> None:
+    kwja = KWJA(sys.executable, options=fake_kwja_options)
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        timed_out = executor.submit(kwja.apply_to_document, "sleep", timeout=1)
+        time.sleep(0.2)  # let the slow input reach the process first
+        other = executor.submit(kwja.apply_to_document, "テスト")
+        with pytest.raises(TimeoutError):
+            _ = timed_out.result()
+        # The input queued behind the timed-out one is resubmitted to the restarted process
+        assert other.result().text == "テスト"
+
+
+def test_fake_apply_async() -> None:
+    kwja = KWJA(sys.executable, options=fake_kwja_options)
+    texts = [f"テスト{i}" for i in range(5)]
+
+    async def main() -> list[Document | BaseException]:
+        return await asyncio.gather(
+            kwja.apply_to_document_async("sleep", timeout=1),
+            *(kwja.apply_to_document_async(text) for text in texts),
+            return_exceptions=True,
+        )
+
+    timed_out, *documents = asyncio.run(main())
+    assert isinstance(timed_out, TimeoutError)
+    assert [document.text for document in documents if isinstance(document, Document)] == texts
+
+    with pytest.raises(RuntimeError, match="exited unexpectedly"):
+        _ = asyncio.run(kwja.apply_to_document_async("exit"))
+    assert asyncio.run(kwja.apply_to_document_async("テスト")).text == "テスト"
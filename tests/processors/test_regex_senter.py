@@ -1,3 +1,4 @@
+import asyncio
 import time
 from unittest.mock import MagicMock
 
@@ -105,6 +106,28 @@ def test_apply_to_sentence() -> None:
     assert sent.text == text
 
 
+def test_apply_to_sentences() -> None:
+    senter = RegexSenter()
+    texts = ["天気がいいので散歩した。", "途中で先生に会った。"]
+    sentences = senter.apply_to_sentences(texts)
+    assert [sentence.text for sentence in sentences] == texts
+
+
+def test_apply_to_documents() -> None:
+    senter = RegexSenter()
+    documents = list(senter.apply_to_documents(["天気がいいので散歩した。途中で先生に会った。", "こんにちは。"]))
+    assert [len(document.sentences) for document in documents] == [2, 1]
+
+
+def test_apply_async() -> None:
+    senter = RegexSenter()
+    document = asyncio.run(senter.apply_async("天気がいいので散歩した。途中で先生に会った。"))
+    assert isinstance(document, Document)
+    assert len(document.sentences) == 2
+    sentence = asyncio.run(senter.apply_async(Sentence("天気がいいので散歩した。")))
+    assert isinstance(sentence, Sentence)
+
+
 def test_keep_id_sentence() -> None:
     senter = RegexSenter()
     sent = Sentence.from_raw_text("天気がいいので散歩した。")
@@ -135,3 +158,11 @@ def test_timeout() -> None:
     senter._split_document = MagicMock(side_effect=lambda _: time.sleep(5))  # type: ignore
     with pytest.raises(TimeoutError):
         senter.apply_to_document("天気がいいので散歩した。", timeout=3)
+
+
+def test_invalid_max_in_flight() -> None:
+    senter = RegexSenter()
+    with pytest.raises(ValueError, match="max_in_flight"):
+        _ = senter.apply_to_sentences(["天気が良かった。"], max_in_flight=0)
+    with pytest.raises(ValueError, match="max_in_flight"):
+        _ = senter.apply_to_documents(["天気が良かった。"], max_in_flight=0)
@@ -0,0 +1,173 @@
+import asyncio
+import time
+from subprocess import PIPE, Popen
+
+import pytest
+
+from rhoknp.processors.transport import ProcessExitedError, ProcessPool, ProcessTransport
+
+
+def _start_transport() -> ProcessTransport:
+    proc = Popen(["tests/bin/jumanpp-mock.sh"], stdin=PIPE, stdout=PIPE, stderr=PIPE, encoding="utf-8")
+    return ProcessTransport(proc, delimiter="EOS")
+
+
+def test_submit() -> None:
+    transport = _start_transport()
+    output = transport.submit("テスト\n").result(timeout=10)
+    assert output.splitlines()[-1] == "EOS"
+    assert len(output.splitlines()) == 3
+    transport.close()
+
+
+def test_submit_pipelined() -> None:
+    transport = _start_transport()
+    futures = [transport.submit("knp time consuming input\n" if i % 2 == 0 else "テスト\n") for i in range(100)]
+    for i, future in enumerate(futures):
+        output = future.result(timeout=10)
+        # Outputs are matched to inputs in order
+        assert output.startswith("# knp time consuming input\n") is (i % 2 == 0)
+    assert transport.num_pending == 0
+    transport.close()
+
+
+def test_process_exited() -> None:
+    transport = _start_transport()
+    future = transport.submit("error causing input\n")
+    with pytest.raises(ProcessExitedError):
+        future.result(timeout=10)
+    assert transport.is_alive() is False
+    with pytest.raises(ProcessExitedError):
+        _ = transport.submit("テスト\n")
+
+
+def test_close() -> None:
+    transport = _start_transport()
+    future = transport.submit("time consuming input\n")
+    transport.close()
+    with pytest.raises(ProcessExitedError):
+        future.result(timeout=10)
+    assert transport.is_alive() is False
+
+
+def test_close_releases_process() -> None:
+    transport = _start_transport()
+    assert transport.submit("テスト\n").result(timeout=10).endswith("EOS\n")
+    transport.close()
+    # The process is reaped and the pipes are closed by the threads using them
+    assert transport.proc.returncode is not None
+    for thread in (transport._writer, transport._reader, transport._stderr_reader):
+        thread.join(timeout=10)
+    for pipe in (transport.proc.stdin, transport.proc.stdout, transport.proc.stderr):
+        assert pipe is not None
+        assert pipe.closed
+    transport.close()  # closing twice is a no-op
+
+
+def test_pool_submit() -> None:
+    pool = ProcessPool(["tests/bin/jumanpp-mock.sh"], size=3, delimiter="EOS")
+    assert len(pool) == 3
+    requests = [pool.submit("テスト\n") for _ in range(30)]
+    # Inputs are spread over all the processes
+    assert len({id(transport) for transport, _ in requests}) == 3
+    for _, future in requests:
+        assert future.result(timeout=10).endswith("EOS\n")
+    pool.close()
+    assert pool.is_alive() is False
+    with pytest.raises(ProcessExitedError):
+        _ = pool.submit("テスト\n")
+
+
+def test_pool_restart_exited_process() -> None:
+    pool = ProcessPool(["tests/bin/jumanpp-mock.sh"], size=2, delimiter="EOS")
+    transport, future = pool.submit("error causing input\n")
+    with pytest.raises(ProcessExitedError):
+        future.result(timeout=10)
+    # The exited process is replaced before the next input is assigned
+    _, future = pool.submit("テスト\n")
+    assert future.result(timeout=10).endswith("EOS\n")
+    assert transport not in pool.transports
+    assert all(transport.is_alive() for transport in pool.transports)
+    pool.close()
+
+
+def test_pool_restart() -> None:
+    pool = ProcessPool(["tests/bin/jumanpp-mock.sh"], size=2, delimiter="EOS")
+    transport, future = pool.submit("テスト\n")
+    pool.restart(transport)
+    # Pending inputs are sent again to the new process
+    assert future.result(timeout=10).endswith("EOS\n")
+    assert transport not in pool.transports
+    pool.restart(transport)  # already restarted
+    assert len(pool) == 2
+    pool.close()
+
+
+def test_pool_receive() -> None:
+    pool = ProcessPool(["tests/bin/jumanpp-mock.sh"], size=1, name="Juman++", delimiter="EOS")
+    assert pool.receive(*pool.submit("テスト\n"), timeout=10).endswith("EOS\n")
+    assert asyncio.run(pool.receive_async(*pool.submit("テスト\n"), timeout=10)).endswith("EOS\n")
+
+    # The process is restarted on timeout
+    transport, future = pool.submit("time consuming input\n")
+    with pytest.raises(TimeoutError):
+        _ = pool.receive(transport, future, timeout=1)
+    assert transport not in pool.transports
+
+    transport, future = pool.submit("error causing input\n")
+    with pytest.raises(ProcessExitedError, match="Juman\\+\\+ exited unexpectedly"):
+        _ = pool.receive(transport, future, timeout=10)
+    assert transport not in pool.transports
+    assert pool.receive(*pool.submit("テスト\n"), timeout=10).endswith("EOS\n")
+    pool.close()
+
+
+def test_pool_timeout_keeps_other_inputs() -> None:
+    pool = ProcessPool(["tests/bin/jumanpp-mock.sh"], size=1, delimiter="EOS")
+    slow_transport, slow_future = pool.submit("time consuming input\n")
+    requests = [pool.submit("テスト\n") for _ in range(3)]
+    with pytest.raises(TimeoutError):
+        _ = pool.receive(slow_transport, slow_future, timeout=1)
+    with pytest.raises(ProcessExitedError):
+        slow_future.result(timeout=10)
+    # Inputs of other callers on the restarted process are answered by the new process
+    start = time.time()
+    for transport, future in requests:
+        assert pool.receive(transport, future, timeout=10).endswith("EOS\n")
+    assert time.time() - start < 4
+    pool.close()
+
+
+def test_pool_receive_async_restarts_off_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    pool = ProcessPool(["tests/bin/jumanpp-mock.sh"], size=1, delimiter="EOS")
+    replace = pool._replace
+
+    def slow_replace(*args, **kwargs) -> None:
+        time.sleep(1)
+        replace(*args, **kwargs)
+
+    monkeypatch.setattr(pool, "_replace", slow_replace)
+
+    async def main() -> int:
+        ticks = 0
+
+        async def tick() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.05)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        with pytest.raises(TimeoutError):
+            _ = await pool.receive_async(*pool.submit("time consuming input\n"), timeout=0.5)
+        ticker.cancel()
+        return ticks
+
+    # The event loop keeps running while the process is restarted
+    assert asyncio.run(main()) >= 15
+    pool.close()
+
+
+def test_pool_invalid_size() -> None:
+    with pytest.raises(ValueError, match="size must be a positive integer"):
+        _ = ProcessPool(["tests/bin/jumanpp-mock.sh"], size=0)
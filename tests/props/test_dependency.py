@@ -0,0 +1,41 @@
+from rhoknp.props import DependencyArrays, DepType
+from rhoknp.props.dependency import DEP_TYPES
+
+
+def test_from_dependencies() -> None:
+    # 0 -> 2, 1 -> 2, 2 -> 4, 3 -> 4 (parallel), 4 is the root
+    arrays = DependencyArrays.from_dependencies(
+        [
+            (2, DepType.DEPENDENCY),
+            (2, DepType.DEPENDENCY),
+            (4, DepType.DEPENDENCY),
+            (4, DepType.PARALLEL),
+            (-1, DepType.DEPENDENCY),
+        ]
+    )
+    assert len(arrays) == 5
+    assert list(arrays.parent_indices) == [2, 2, 4, 4, -1]
+    assert [DEP_TYPES[code] for code in arrays.dep_type_codes] == [
+        DepType.DEPENDENCY,
+        DepType.DEPENDENCY,
+        DepType.DEPENDENCY,
+        DepType.PARALLEL,
+        DepType.DEPENDENCY,
+    ]
+    assert list(arrays.child_offsets) == [0, 0, 0, 2, 2, 4]
+    assert [list(arrays.children_of(index)) for index in range(5)] == [[], [], [0, 1], [], [2, 3]]
+    assert list(arrays.depths) == [2, 2, 1, 1, 0]
+    assert list(arrays.topological_order) == [4, 2, 3, 0, 1]
+
+
+def test_from_dependencies_cycle() -> None:
+    arrays = DependencyArrays.from_dependencies([(1, DepType.DEPENDENCY), (0, DepType.DEPENDENCY), (-1, None)])
+    assert list(arrays.dep_type_codes) == [0, 0, -1]
+    assert list(arrays.depths) == [-1, -1, 0]
+    assert list(arrays.topological_order) == [2]
+
+
+def test_from_dependencies_empty() -> None:
+    arrays = DependencyArrays.from_dependencies([])
+    assert len(arrays) == 0
+    assert list(arrays.child_offsets) == [0]
@@ -76,6 +76,29 @@ def test_from_fstring(fstring: str, features: dict[str, str | bool], length: int
     assert fs.get("dummy") is None
 
 
+@pytest.mark.parametrize(
+    ("fstring", "split"),
+    [
+        ("", True),
+        ("<体言><係:ガ格>", True),
+        ('<ALT-京都-きょうと-京都-6-4-0-0-"代表表記:京都/きょうと 地名:日本:府">', True),
+        ('<rel type="ノ" target="不特定:人"/><体言>', True),
+        (r"<NE:OPTIONAL:html\>タグ>", False),  # an escaped ">"
+        ("<a<b><c>", False),  # "<" inside a tag
+        ("<><体言>", False),  # an empty tag
+        ("<係:><体言>", False),  # an empty value
+        ('<"key><体言>', False),  # an unclosed quote
+        ("<体言", False),
+    ],
+)
+def test_split_fstring(fstring: str, split: bool) -> None:
+    assert (FeatureDict._split_fstring(fstring) is not None) is split
+    features = {}
+    for match in FeatureDict.FEATURE_PAT.finditer(fstring):
+        features[match["key"]] = match["value"].replace(r"\>", ">") if match["value"] is not None else True
+    assert dict(FeatureDict.from_fstring(fstring)) == features
+
+
 @pytest.mark.parametrize("fstring", [case.fstring for case in cases])
 def test_to_fstring(fstring: str) -> None:
     fs = FeatureDict.from_fstring(fstring)
@@ -107,3 +130,11 @@ def test_modification() -> None:
     # Delete
     del features["主節"]
     assert features.to_fstring() == """<用言:判><文末>"""
+
+
+def test_interned_keys() -> None:
+    features1 = FeatureDict.from_fstring("<正規化代表表記:天気/てんき><主辞代表表記:天気/てんき>")
+    features2 = FeatureDict.from_fstring("<主辞代表表記:良い/よい><正規化代表表記:良い/よい>")
+    for key1 in features1:
+        (key2,) = (key for key in features2 if key == key1)
+        assert key1 is key2
@@ -63,3 +63,11 @@ def test_modification() -> None:
     # Delete
     del features["カテゴリ"]
     assert features.to_sstring() == '"代表表記:転機/てんき 内容語"'
+
+
+def test_interned_keys() -> None:
+    semantics1 = SemanticsDict.from_sstring('"代表表記:天気/てんき カテゴリ:抽象物"')
+    semantics2 = SemanticsDict.from_sstring('"カテゴリ:人 代表表記:先生/せんせい"')
+    for key1 in semantics1:
+        (key2,) = (key for key in semantics2 if key == key1)
+        assert key1 is key2
@@ -2,7 +2,9 @@ import textwrap
 
 import pytest
 
-from rhoknp import BasePhrase, Document, Sentence
+from rhoknp import BasePhrase, Document, Phrase, Sentence
+from rhoknp.cohesion import RelTagList
+from rhoknp.props import FeatureDict, MemoTag
 
 CASES = [
     {
@@ -326,6 +328,23 @@ def test_from_knp_error() -> None:
         _ = BasePhrase.from_knp("MALFORMED LINE")
 
 
+@pytest.mark.parametrize(
+    "fstring",
+    [
+        '<rel type="ガ" target="彼" sid="1" id="0"/><memo text="メモ"/><体言><EID:1>',
+        '<体言><rel type="ヲ" mode="？" target="なし"/><rel type="ヲ" mode="？" target="不特定:人"/><EID:2>',
+        '<memo text=""/><memo text="メモ"/><体言>',
+        '<rel type="ガ" target="a><b" sid="1" id="0"/><体言>',  # a tag containing "><"
+        r'<NE:OPTIONAL:html\>タグ><rel type="ガ" target="彼"/>',  # an escaped ">"
+    ],
+)
+def test_parse_fstring(fstring: str) -> None:
+    features, rel_tags, memo_tag = BasePhrase._parse_fstring(fstring)
+    assert features == FeatureDict.from_fstring(fstring)
+    assert rel_tags == RelTagList.from_fstring(fstring)
+    assert memo_tag == MemoTag.from_fstring(fstring)
+
+
 @pytest.mark.parametrize("case", KNP_SNIPPETS)
 def test_to_knp(case: dict[str, str]) -> None:
     base_phrase = BasePhrase.from_knp(case["knp"])
@@ -451,3 +470,22 @@ def test_eq_knp(case: dict[str, str]) -> None:
     if len(sent1.base_phrases) > 1:
         assert sent1.base_phrases[0] != sent1.base_phrases[1]
         assert hash(sent1.base_phrases[0]) != hash(sent1.base_phrases[1])
+
+
+def test_eq_without_sentence() -> None:
+    phrase = Phrase.from_knp(
+        textwrap.dedent(
+            """\
+            * -1D
+            + 1D
+            天気 てんき 天気 名詞 6 普通名詞 1 * 0 * 0
+            + -1D
+            良い よい 良い 形容詞 3 * 0 イ形容詞アウオ段 18 基本形 2
+            """
+        )
+    )
+    base_phrase1, base_phrase2 = phrase.base_phrases
+    # Units that do not belong to a sentence are compared by identity.
+    assert base_phrase1 != base_phrase2
+    assert base_phrase1 != BasePhrase.from_knp(base_phrase1.to_knp())
+    assert len({base_phrase1, base_phrase2, base_phrase1}) == 2
@@ -395,6 +395,40 @@ def test_is_sentential_complement(case: dict[str, str]) -> None:
     assert clause.is_sentential_complement() == case["is_sentential_complement"]
 
 
+def test_clear_cache() -> None:
+    sentence = Sentence.from_knp(
+        textwrap.dedent(
+            """\
+            # S-ID:1
+            * -1D
+            + -1D
+            天気 てんき 天気 名詞 6 普通名詞 1 * 0 * 0
+            が が が 助詞 9 格助詞 1 * 0 * 0
+            * 2D
+            + 2D <節-区切><節-主辞>
+            いい いい いい 形容詞 3 * 0 イ形容詞イ段 19 基本形 2
+            ので ので のだ 助動詞 5 * 0 ナ形容詞 21 ダ列タ系連用テ形 12
+            * -1D
+            + -1D <節-区切><節-主辞>
+            散歩 さんぽ 散歩 名詞 6 サ変名詞 2 * 0 * 0
+            した した する 動詞 2 * 0 サ変動詞 16 タ形 10
+            。 。 。 特殊 1 句点 1 * 0 * 0
+            EOS
+            """
+        )
+    )
+    clause, parent_clause = sentence.clauses
+    assert clause.head.text == "いいので"
+    assert clause.parent == parent_clause
+    assert parent_clause.children == [clause]
+
+    # Editing a clause invalidates its head and the relations of all the clauses in the sentence.
+    clause.phrases = clause.phrases[:1]
+    assert clause.head.text == "天気が"
+    assert clause.parent is None
+    assert parent_clause.children == []
+
+
 def test_invalid_head_0() -> None:
     clause = Clause.from_knp(
         textwrap.dedent(
@@ -1,6 +1,7 @@
 import multiprocessing
 import pickle
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -328,6 +329,12 @@ def test_from_jumanpp_without_last_eos(case: dict[str, str]) -> None:
     assert doc.text == case["raw_text"]
 
 
+def test_index() -> None:
+    doc = Document.from_sentences(["天気が良かった。", "散歩した。"])
+    assert doc.index == 0
+    assert [sentence.index for sentence in doc.sentences] == [0, 1]
+
+
 def test_from_jumanpp_error() -> None:
     invalid_jumanpp_text = textwrap.dedent(
         """\
@@ -404,6 +411,19 @@ def test_from_knp_parallel(case: dict[str, str]) -> None:
         _ = pool.map(Document.from_knp, [case["knp"]])
 
 
+@pytest.mark.parametrize("case", CASES)
+def test_from_knp_multithread(case: dict[str, str]) -> None:
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        documents = list(executor.map(Document.from_knp, [case["knp"]] * 16))
+    for document in documents:
+        assert [sentence.index for sentence in document.sentences] == list(range(len(document.sentences)))
+        for sentence in document.sentences:
+            assert [phrase.index for phrase in sentence.phrases] == list(range(len(sentence.phrases)))
+            assert [bp.index for bp in sentence.base_phrases] == list(range(len(sentence.base_phrases)))
+            assert [morpheme.index for morpheme in sentence.morphemes] == list(range(len(sentence.morphemes)))
+        assert document.to_knp() == case["knp"]
+
+
 @pytest.mark.parametrize("case", CASES)
 def test_from_knp_without_last_eos(case: dict[str, str]) -> None:
     knp_lines = case["knp"].rstrip().split("\n")
@@ -936,3 +956,79 @@ def test_pickle_unpickle_annotated_corpora(path: Path) -> None:
     doc1 = Document.from_knp(path.read_text())
     doc2 = pickle.loads(pickle.dumps(doc1))  # nosec pickle
     assert doc1.to_knp() == doc2.to_knp()
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_to_bytes_from_bytes(case: dict[str, str]) -> None:
+    for doc1 in (
+        Document.from_raw_text(case["raw_text"]),
+        Document.from_line_by_line_text(case["line_by_line_text"]),
+        Document.from_jumanpp(case["jumanpp"]),
+        Document.from_knp(case["knp"]),
+    ):
+        doc2 = Document.from_bytes(doc1.to_bytes())
+        assert doc2.text == doc1.text
+        assert doc2.to_raw_text() == doc1.to_raw_text()
+        assert doc2.is_jumanpp_required() == doc1.is_jumanpp_required()
+        assert doc2.is_knp_required() == doc1.is_knp_required()
+        assert doc2.is_clause_tag_required() == doc1.is_clause_tag_required()
+    doc1 = Document.from_knp(case["knp"])
+    doc2 = Document.from_bytes(doc1.to_bytes())
+    assert doc2.to_knp() == doc1.to_knp()
+    assert doc2.to_jumanpp() == doc1.to_jumanpp()
+
+
+@pytest.mark.parametrize("path", sorted(Path("tests/data").glob("*.knp")))
+def test_to_bytes_from_bytes_annotated_corpora(path: Path) -> None:
+    doc1 = Document.from_knp(path.read_text())
+    doc2 = Document.from_bytes(doc1.to_bytes())
+    assert doc2.to_knp() == doc1.to_knp()
+    assert doc2.doc_id == doc1.doc_id
+    assert [repr(pas) for pas in doc2.pas_list] == [repr(pas) for pas in doc1.pas_list]
+    assert len(doc2.entity_manager.entities) == len(doc1.entity_manager.entities)
+    assert [str(ne) for ne in doc2.named_entities] == [str(ne) for ne in doc1.named_entities]
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_from_knp_lazy(case: dict[str, str]) -> None:
+    document = Document.from_knp(case["knp"], lazy=True)
+    assert document.text == case["raw_text"]
+    assert all(sentence._knp_lines is not None for sentence in document.sentences)
+    _ = document.sentences[-1].base_phrases
+    # All the sentences are parsed at once since rel tags may refer to other sentences.
+    assert all(sentence._knp_lines is None for sentence in document.sentences)
+    assert document.to_knp() == case["knp"]
+
+
+@pytest.mark.parametrize("path", sorted(Path("tests/data").glob("*.knp")))
+def test_from_knp_lazy_annotated_corpora(path: Path) -> None:
+    doc1 = Document.from_knp(path.read_text())
+    doc2 = Document.from_knp(path.read_text(), lazy=True)
+    assert doc2.doc_id == doc1.doc_id
+    assert [sentence.sid for sentence in doc2.sentences] == [sentence.sid for sentence in doc1.sentences]
+    assert doc2.text == doc1.text
+    assert doc2.to_knp() == doc1.to_knp()
+    assert [repr(pas) for pas in doc2.pas_list] == [repr(pas) for pas in doc1.pas_list]
+    assert len(doc2.entity_manager.entities) == len(doc1.entity_manager.entities)
+    assert [str(ne) for ne in doc2.named_entities] == [str(ne) for ne in doc1.named_entities]
+
+
+def test_global_index_after_update() -> None:
+    document = Document.from_knp(Path("tests/data/w201106-0000060050.knp").read_text())
+    assert document.sentences[1].base_phrases[0].global_index == len(document.sentences[0].base_phrases)
+    document.sentences = document.sentences[1:]
+    assert document.sentences[0].base_phrases[0].global_index == 0
+    assert document.sentences[0].morphemes[0].global_span == (0, len(document.sentences[0].morphemes[0].text))
+
+
+def test_find_sentence() -> None:
+    document = Document.from_knp(Path("tests/data/w201106-0000060050.knp").read_text())
+    for sentence in document.sentences:
+        assert document.find_sentence(sentence.sid) is sentence
+    assert document.find_sentence("unknown") is None
+    # The index follows edits of sentence IDs.
+    sentence = document.sentences[1]
+    old_sid = sentence.sid
+    sentence.sent_id = "new-sid"
+    assert document.find_sentence("new-sid") is sentence
+    assert document.find_sentence(old_sid) is None
@@ -1,3 +1,4 @@
+import pickle
 import textwrap
 
 import pytest
@@ -449,6 +450,47 @@ def test_from_jumanpp_error() -> None:
         _ = Morpheme.from_jumanpp(jumanpp)
 
 
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        (
+            '天気 てんき 天気 名詞 6 普通名詞 1 * 0 * 0 "代表表記:天気/てんき" <漢字><文頭>',
+            (
+                ["天気", "てんき", "天気", "名詞", "6", "普通名詞", "1", "*", "0", "*", "0"],
+                '"代表表記:天気/てんき"',
+                "<漢字><文頭>",
+            ),
+        ),
+        (
+            "であり であり だ 判定詞 4 * 0 判定詞 25 デアル列基本連用形 18 NIL <付属>",
+            (
+                ["であり", "であり", "だ", "判定詞", "4", "*", "0", "判定詞", "25", "デアル列基本連用形", "18"],
+                "NIL",
+                "<付属>",
+            ),
+        ),
+        (
+            "天気 てんき 天気 名詞 6 普通名詞 1 * 0 * 0 <漢字>",
+            (["天気", "てんき", "天気", "名詞", "6", "普通名詞", "1", "*", "0", "*", "0"], None, "<漢字>"),
+        ),
+        (
+            "\\␣ \\␣ \\␣ 特殊 1 空白 6 * 0 * 0",
+            (["\\␣", "\\␣", "\\␣", "特殊", "1", "空白", "6", "*", "0", "*", "0"], None, None),
+        ),
+        (
+            "A B A B A B 名詞 6 普通名詞 1 * 0 * 0",
+            (["A B", "A B", "A B", "名詞", "6", "普通名詞", "1", "*", "0", "*", "0"], None, None),
+        ),
+        ('天気 てんき 天気 名詞 6 普通名詞 1 * 0 * 0 "代表表記:天気/てんき"<漢字>', None),
+        ("天気 てんき 天気 名詞 6 普通名詞 1 * 0 * 0 MALFORMED", None),
+        ("# S-ID:1 KNP:5.0", None),
+    ],
+)
+def test_tokenize_jumanpp_line(line: str, expected: tuple[list[str], str | None, str | None] | None) -> None:
+    assert Morpheme._tokenize_jumanpp_line(line) == expected
+    assert Morpheme.is_morpheme_line(line) is (expected is not None)
+
+
 @pytest.mark.parametrize("case", JUMANPP_SNIPPETS)
 def test_to_jumanpp(case: dict[str, str]) -> None:
     morpheme = Morpheme.from_jumanpp(case["jumanpp"])
@@ -552,6 +594,13 @@ def test_homograph() -> None:
     assert homograph.fstring == ""
 
 
+def test_homograph_argument_deprecated() -> None:
+    args = ("母", "はは", "母", "名詞", 6, "普通名詞", 1, "*", 0, "*", 0)
+    with pytest.warns(DeprecationWarning, match="homograph"):
+        morpheme = Morpheme(*args, homograph=True)
+    assert morpheme.homographs == []
+
+
 def test_homograph_to_knp() -> None:
     knp = textwrap.dedent(
         """\
@@ -596,3 +645,55 @@ def test_eq_knp(case: dict[str, str]) -> None:
     if len(sent1.morphemes) > 1:
         assert sent1.morphemes[0] != sent1.morphemes[1]
         assert hash(sent1.morphemes[0]) != hash(sent1.morphemes[1])
+
+
+def test_slots() -> None:
+    morpheme = Morpheme.from_jumanpp("であり であり だ 判定詞 4 * 0 判定詞 25 デアル列基本連用形 18")
+    assert not hasattr(morpheme, "__dict__")
+    # Semantics, features and homographs are allocated on first access.
+    assert morpheme._semantics is None
+    assert morpheme._features is None
+    assert morpheme._homographs is None
+    assert morpheme.canon is None
+    assert morpheme.to_jumanpp() == "であり であり だ 判定詞 4 * 0 判定詞 25 デアル列基本連用形 18\n"
+    assert morpheme._semantics is None
+    assert morpheme._features is None
+    assert morpheme._homographs is None
+    morpheme.features["付属"] = True
+    assert morpheme.to_jumanpp() == "であり であり だ 判定詞 4 * 0 判定詞 25 デアル列基本連用形 18 <付属>\n"
+
+
+def test_pickle_unpickle() -> None:
+    sentence = Sentence.from_knp(CASES[0]["knp"])
+    sentence2 = pickle.loads(pickle.dumps(sentence))  # nosec pickle
+    for morpheme1, morpheme2 in zip(sentence.morphemes, sentence2.morphemes, strict=True):
+        assert morpheme2.to_jumanpp() == morpheme1.to_jumanpp()
+        assert morpheme2.span == morpheme1.span
+
+
+def test_interned_pos() -> None:
+    sentence = Sentence.from_jumanpp(
+        textwrap.dedent(
+            """\
+            天気 てんき 天気 名詞 6 普通名詞 1 * 0 * 0
+            先生 せんせい 先生 名詞 6 普通名詞 1 * 0 * 0
+            EOS
+            """
+        )
+    )
+    morpheme1, morpheme2 = sentence.morphemes
+    assert morpheme1.pos is morpheme2.pos
+    assert morpheme1.subpos is morpheme2.subpos
+    assert morpheme1.conjtype is morpheme2.conjtype
+    assert morpheme1.conjform is morpheme2.conjform
+
+
+def test_span_long_sentence() -> None:
+    # Spans used to be computed recursively over the preceding morphemes.
+    num_morphemes = 5000
+    jumanpp = "あ あ あ 名詞 6 普通名詞 1 * 0 * 0\n" * num_morphemes + "EOS\n"
+    document = Document.from_jumanpp(jumanpp * 2)
+    last_morpheme = document.morphemes[-1]
+    assert last_morpheme.span == (num_morphemes - 1, num_morphemes)
+    assert last_morpheme.global_span == (num_morphemes * 2 - 1, num_morphemes * 2)
+    assert last_morpheme.global_index == num_morphemes * 2 - 1
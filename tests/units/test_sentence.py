@@ -3,7 +3,7 @@ import textwrap
 
 import pytest
 
-from rhoknp import Sentence
+from rhoknp import Document, Morpheme, Sentence
 
 CASES = [
     {
@@ -408,6 +408,43 @@ def test_from_knp_empty_line() -> None:
     )
 
 
+def test_from_knp_control_character() -> None:
+    knp = textwrap.dedent(
+        """\
+        # S-ID:1
+        * -1D
+        + -1D
+        * あすたりすく * 特殊 1 記号 5 * 0 * 0
+        + ぷらす + 未定義語 15 その他 1 * 0 * 0
+        @ あっと @ 未定義語 15 その他 1 * 0 * 0
+        EOS いーおーえす EOS 未定義語 15 アルファベット 3 * 0 * 0
+        # # # 未定義語 15 その他 1 * 0 * 0
+        EOS
+        """
+    )
+    sentence = Sentence.from_knp(knp)
+    assert [morpheme.text for morpheme in sentence.morphemes] == ["*", "+", "@", "EOS", "#"]
+    assert len(sentence.phrases) == 1
+    assert len(sentence.base_phrases) == 1
+    assert sentence.to_knp() == knp
+
+
+def test_from_knp_homograph() -> None:
+    knp = textwrap.dedent(
+        """\
+        # S-ID:1
+        * -1D
+        + -1D
+        母 はは 母 名詞 6 普通名詞 1 * 0 * 0 "代表表記:母/はは"
+        @ 母 ぼ 母 名詞 6 普通名詞 1 * 0 * 0 "代表表記:母/ぼ"
+        EOS
+        """
+    )
+    sentence = Sentence.from_knp(knp)
+    assert len(sentence.morphemes) == 1
+    assert [homograph.reading for homograph in sentence.morphemes[0].homographs] == ["ぼ"]
+
+
 def test_from_knp_invalid_input() -> None:
     with pytest.raises(ValueError, match="malformed line: ;; Invalid input"):
         _ = Sentence.from_knp(
@@ -420,6 +457,62 @@ def test_from_knp_invalid_input() -> None:
         )
 
 
+@pytest.mark.parametrize("case", CASES)
+def test_from_knp_lazy(case: dict[str, str]) -> None:
+    sentence = Sentence.from_knp(case["knp"], lazy=True)
+    assert sentence.text == case["raw_text"]
+    assert sentence.is_jumanpp_required() is False
+    assert sentence.is_knp_required() is False
+    assert sentence.is_clause_tag_required() is False
+    assert sentence._knp_lines is not None
+    assert sentence.to_knp() == case["knp"]
+    assert sentence._knp_lines is None
+    assert [repr(pas) for pas in sentence.pas_list] == [repr(pas) for pas in Sentence.from_knp(case["knp"]).pas_list]
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_from_knp_lazy_with_no_clause_tag(case: dict[str, str]) -> None:
+    sentence = Sentence.from_knp(case["knp_with_no_clause_tag"], lazy=True)
+    assert sentence.is_clause_tag_required() is True
+    assert sentence.to_knp() == case["knp_with_no_clause_tag"]
+    assert sentence.is_clause_tag_required() is True
+
+
+def test_from_knp_lazy_control_character() -> None:
+    knp = textwrap.dedent(
+        """\
+        # S-ID:1
+        * -1D
+        + -1D
+        * あすたりすく * 特殊 1 記号 5 * 0 * 0
+        + ぷらす + 未定義語 15 その他 1 * 0 * 0
+        @ あっと @ 未定義語 15 その他 1 * 0 * 0
+        @ 母 ぼ 母 名詞 6 普通名詞 1 * 0 * 0 "代表表記:母/ぼ"
+        EOS いーおーえす EOS 未定義語 15 アルファベット 3 * 0 * 0
+        \\␣ \\␣ \\␣ 特殊 1 空白 6 * 0 * 0
+        EOS
+        """
+    )
+    sentence = Sentence.from_knp(knp, lazy=True)
+    assert sentence.sid == "1"
+    assert sentence.text == "*+@EOS "
+    assert sentence.to_knp() == Sentence.from_knp(knp).to_knp()
+
+
+def test_from_knp_lazy_invalid_input() -> None:
+    sentence = Sentence.from_knp(
+        textwrap.dedent(
+            """\
+            ;; Invalid input
+            EOS
+            """
+        ),
+        lazy=True,
+    )
+    with pytest.raises(ValueError, match="malformed line: ;; Invalid input"):
+        _ = sentence.morphemes
+
+
 @pytest.mark.parametrize("case", CASES)
 def test_need_jumanpp(case: dict[str, str]) -> None:
     sent = Sentence.from_raw_text(case["raw_text"])
@@ -596,6 +689,43 @@ def test_base_phrases(case: dict[str, str]) -> None:
     _ = sent.base_phrases
 
 
+@pytest.mark.parametrize("case", CASES)
+def test_base_phrases_cache(case: dict[str, str]) -> None:
+    sent = Sentence.from_knp(case["knp"])
+    base_phrases = sent.base_phrases
+    assert isinstance(base_phrases, tuple)
+    assert sent.base_phrases is base_phrases
+    assert sent.morphemes is sent.morphemes
+
+    # Updating a child unit invalidates the cached views of its ancestors.
+    phrase = sent.phrases[0]
+    phrase.base_phrases = phrase.base_phrases[1:] + phrase.base_phrases[:1]
+    assert sent.base_phrases is not base_phrases
+    assert [bp.text for bp in sent.base_phrases] == [bp.text for phrase in sent.phrases for bp in phrase.base_phrases]
+    assert [m.text for m in sent.morphemes] == [m.text for bp in sent.base_phrases for m in bp.morphemes]
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_morphemes_cache_jumanpp(case: dict[str, str]) -> None:
+    sent = Sentence.from_jumanpp(case["jumanpp"])
+    morphemes = sent.morphemes
+    assert isinstance(morphemes, tuple)
+    assert sent.morphemes is morphemes
+    sent.morphemes = list(reversed(morphemes))
+    assert sent.morphemes == tuple(reversed(morphemes))
+
+
+def test_morpheme_children_after_edit() -> None:
+    sent = Sentence.from_knp(CASES[0]["knp"])
+    _ = [morpheme.children for morpheme in sent.morphemes]
+    # Replace the morphemes of a base phrase with new objects.
+    base_phrase = next(bp for bp in sent.base_phrases if bp.parent is not None)
+    base_phrase.morphemes = [Morpheme.from_jumanpp(m.to_jumanpp()) for m in base_phrase.morphemes]
+    for morpheme in sent.morphemes:
+        # Compare by identity since equality only looks at the indices.
+        assert [id(child) for child in morpheme.children] == [id(m) for m in sent.morphemes if m.parent is morpheme]
+
+
 @pytest.mark.parametrize("case", CASES)
 def test_morphemes(case: dict[str, str]) -> None:
     sent = Sentence.from_raw_text(case["raw_text"])
@@ -634,6 +764,33 @@ def test_pas_list() -> None:
     assert len(sent.pas_list) == 1
 
 
+@pytest.mark.parametrize("case", CASES)
+def test_dependency_arrays(case: dict[str, str]) -> None:
+    sent = Sentence.from_knp(case["knp"])
+    for unit, units in (("base_phrase", sent.base_phrases), ("phrase", sent.phrases)):
+        arrays = sent.dependency_arrays(unit)  # type: ignore[arg-type]
+        assert arrays is sent.dependency_arrays(unit)  # type: ignore[arg-type]
+        assert list(arrays.parent_indices) == [u.parent_index for u in units]
+        for u in units:
+            assert list(arrays.children_of(u.index)) == [v.index for v in units if v.parent_index == u.index]
+        visited: set[int] = set()
+        for index in arrays.topological_order:
+            assert arrays.parent_indices[index] == -1 or arrays.parent_indices[index] in visited
+            visited.add(index)
+
+    arrays = sent.dependency_arrays("morpheme")
+    for morpheme in sent.morphemes:
+        parent = morpheme.parent
+        assert arrays.parent_indices[morpheme.index] == (parent.index if parent is not None else -1)
+        assert morpheme.children == [m for m in sent.morphemes if m.parent == morpheme]
+
+
+def test_dependency_arrays_invalid_unit() -> None:
+    sent = Sentence.from_knp(CASES[0]["knp"])
+    with pytest.raises(ValueError, match="invalid unit"):
+        _ = sent.dependency_arrays("clause")  # type: ignore[arg-type]
+
+
 @pytest.mark.parametrize("case", CASES)
 def test_sid(case: dict[str, str]) -> None:
     sent = Sentence.from_knp(case["knp"])
@@ -785,3 +942,46 @@ def test_pickle_unpickle(case: dict[str, str]) -> None:
     sent1 = Sentence.from_knp(case["knp"])
     sent2 = pickle.loads(pickle.dumps(sent1))  # nosec pickle
     assert sent1.to_knp() == sent2.to_knp()
+
+
+def test_indices_after_edit() -> None:
+    doc = Document.from_knp(
+        textwrap.dedent(
+            """\
+            # S-ID:1-1
+            * 1D
+            + 1D
+            天気 てんき 天気 名詞 6 普通名詞 1 * 0 * 0
+            が が が 助詞 9 格助詞 1 * 0 * 0
+            * 2D
+            + 2D <節-区切><節-主辞>
+            いい いい いい 形容詞 3 * 0 イ形容詞イ段 19 基本形 2
+            ので ので のだ 助動詞 5 * 0 ナ形容詞 21 ダ列タ系連用テ形 12
+            * -1D
+            + -1D <節-区切><節-主辞>
+            散歩 さんぽ 散歩 名詞 6 サ変名詞 2 * 0 * 0
+            した した する 動詞 2 * 0 サ変動詞 16 タ形 10
+            。 。 。 特殊 1 句点 1 * 0 * 0
+            EOS
+            # S-ID:1-2
+            * -1D
+            + -1D <節-区切><節-主辞>
+            楽しかった たのしかった 楽しい 形容詞 3 * 0 イ形容詞アウオ段 18 タ形 8
+            EOS
+            """
+        )
+    )
+    sentence, next_sentence = doc.sentences
+
+    # Drop the first phrase of the built sentence
+    clause = sentence.clauses[0]
+    clause.phrases = clause.phrases[1:]
+
+    assert [phrase.index for phrase in sentence.phrases] == [0, 1]
+    assert [base_phrase.index for base_phrase in sentence.base_phrases] == [0, 1]
+    assert [morpheme.index for morpheme in sentence.morphemes] == [0, 1, 2, 3, 4]
+    assert len(set(sentence.morphemes)) == len(sentence.morphemes)
+    assert [morpheme.span for morpheme in sentence.morphemes[:2]] == [(0, 2), (2, 4)]
+    assert next_sentence.base_phrases[0].global_index == 2
+    assert next_sentence.morphemes[0].global_index == 5
+    assert next_sentence.morphemes[0].global_span == (len("いいので散歩した。"), len("いいので散歩した。楽しかった"))
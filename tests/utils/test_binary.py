@@ -0,0 +1,110 @@
+import struct
+import textwrap
+
+import pytest
+
+from rhoknp import Document, Morpheme, Sentence
+from rhoknp.utils.binary import FORMAT_VERSION, MAGIC, decode_sentences, encode_sentences
+
+KNP = textwrap.dedent(
+    """\
+    # S-ID:1 KNP:5.0-25425d33 DATE:2022/08/27 SCORE:-13.08614
+    * 1D <BGH:天気/てんき><文頭><ガ><助詞><体言><係:ガ格>
+    + 1D <BGH:天気/てんき><文頭><ガ><助詞><体言><係:ガ格><NE:OPTIONAL:天気>
+    天気 てんき 天気 名詞 6 普通名詞 1 * 0 * 0 "代表表記:天気/てんき カテゴリ:抽象物" <代表表記:天気/てんき><ALT-天気-てんき-天気-6-1-0-0-"代表表記:天気/てんき">
+    が が が 助詞 9 格助詞 1 * 0 * 0 NIL <かな漢字><ひらがな><付属>
+    * -1D <文末><句点><用言:形><レベル:C><節-区切><節-主辞>
+    + -1D <rel type="ガ" target="天気" sid="1" id="0"/><rel type="=" mode="？" target="不特定:人"/><memo text="テスト"/><用言:形>
+    良い よい 良い 形容詞 3 * 0 イ形容詞アウオ段 18 基本形 2 "代表表記:良い/よい 反義:形容詞:悪い/わるい"
+    。 。 。 特殊 1 句点 1 * 0 * 0 NIL <英記号><記号><付属>
+    EOS
+    """
+)
+
+
+def test_encode_decode() -> None:
+    sentence = Sentence.from_knp(KNP)
+    sentences, text = decode_sentences(encode_sentences([sentence]))
+    assert text == ""
+    assert sentences is not None
+    assert len(sentences) == 1
+    sentences[0].__post_init__()
+    assert sentences[0].to_knp() == sentence.to_knp()
+    assert sentences[0].comment == sentence.comment
+
+
+def test_encode_decode_not_split() -> None:
+    sentences, text = decode_sentences(encode_sentences(None, "天気が良い。散歩した。"))
+    assert sentences is None
+    assert text == "天気が良い。散歩した。"
+
+
+def test_encode_decode_homograph() -> None:
+    jumanpp = textwrap.dedent(
+        """\
+        母 はは 母 名詞 6 普通名詞 1 * 0 * 0 "代表表記:母/はは 漢字読み:訓 カテゴリ:人 ドメイン:家庭・暮らし"
+        @ 母 ぼ 母 名詞 6 普通名詞 1 * 0 * 0 "代表表記:母/ぼ 漢字読み:音 カテゴリ:人"
+        EOS
+        """
+    )
+    sentence = Sentence.from_jumanpp(jumanpp)
+    sentences, _ = decode_sentences(encode_sentences([sentence]))
+    assert sentences is not None
+    assert sentences[0].to_jumanpp() == sentence.to_jumanpp()
+    assert isinstance(sentences[0].morphemes[0].homographs[0], Morpheme)
+
+
+def test_interned_strings() -> None:
+    document = Document.from_knp(KNP * 2)
+    data = document.to_bytes()
+    assert data.count("普通名詞".encode()) == 1
+
+
+def test_invalid_magic() -> None:
+    data = Document.from_knp(KNP).to_bytes()
+    with pytest.raises(ValueError, match="invalid magic number"):
+        _ = decode_sentences(b"XXXX" + data[4:])
+
+
+def test_unsupported_version() -> None:
+    data = Document.from_knp(KNP).to_bytes()
+    header = struct.pack("<4sH", MAGIC, FORMAT_VERSION + 1)
+    with pytest.raises(ValueError, match="unsupported format version"):
+        _ = decode_sentences(header + data[len(header) :])
+
+
+def test_truncated() -> None:
+    data = Document.from_knp(KNP).to_bytes()
+    with pytest.raises(ValueError, match="data is too short"):
+        _ = decode_sentences(data[:4])
+    with pytest.raises(ValueError, match="data is truncated"):
+        _ = decode_sentences(data[:20])
+
+
+def test_truncated_at_any_length() -> None:
+    data = Document.from_knp(KNP).to_bytes()
+    for length in range(len(data)):
+        with pytest.raises(ValueError, match=r"too short|truncated|corrupted"):
+            _ = decode_sentences(data[:length])
+
+
+def test_corrupted() -> None:
+    data = Document.from_knp(KNP).to_bytes()
+    magic, version, flags, num_ints, num_strings = struct.unpack_from("<4sHHII", data)
+    header_size = struct.calcsize("<4sHHII")
+    ints = data[header_size : header_size + num_ints * 4]
+    rest = data[header_size + num_ints * 4 :]
+
+    # The integer sequence ends before all units are decoded.
+    header = struct.pack("<4sHHII", magic, version, flags, num_ints - 1, num_strings)
+    with pytest.raises(ValueError, match="corrupted"):
+        _ = decode_sentences(header + ints[:-4] + rest)
+
+    # Whichever integer is corrupted, decoding either succeeds or raises ValueError.
+    header = struct.pack("<4sHHII", magic, version, flags, num_ints, num_strings)
+    for index in range(num_ints):
+        corrupted = ints[: index * 4] + struct.pack("<i", num_strings) + ints[(index + 1) * 4 :]
+        try:
+            _ = decode_sentences(header + corrupted + rest)
+        except ValueError:
+            pass
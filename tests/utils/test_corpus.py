@@ -0,0 +1,91 @@
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from rhoknp import Document
+from rhoknp.utils.corpus import KNPCorpus
+
+PATHS = sorted(Path("tests/data").glob("w2011*.knp"))
+
+
+@pytest.fixture
+def corpus_path(tmp_path: Path) -> Path:
+    path = tmp_path / "corpus.knp"
+    path.write_text("".join(path.read_text() for path in PATHS))
+    return path
+
+
+def test_get_document(corpus_path: Path) -> None:
+    with KNPCorpus(corpus_path, doc_id_format="kwdlc") as corpus:
+        assert len(corpus) == len(PATHS)
+        assert corpus.doc_ids == [path.stem for path in PATHS]
+        for path in PATHS:
+            assert path.stem in corpus
+            document = corpus.get_document(path.stem)
+            assert document.to_knp() == Document.from_knp(path.read_text()).to_knp()
+            assert corpus[path.stem].doc_id == path.stem
+        assert [document.doc_id for document in corpus] == [path.stem for path in PATHS]
+        assert corpus[-1].doc_id == PATHS[-1].stem
+        with pytest.raises(KeyError):
+            _ = corpus.get_document("unknown")
+
+
+def test_get_sentence(corpus_path: Path) -> None:
+    documents = [Document.from_knp(path.read_text()) for path in PATHS]
+    with KNPCorpus(corpus_path, doc_id_format="kwdlc") as corpus:
+        assert corpus.sids == [sentence.sid for document in documents for sentence in document.sentences]
+        for document in documents:
+            for sentence in document.sentences:
+                assert corpus.get_sentence_knp(sentence.sid) == sentence.to_knp()
+                assert corpus.get_sentence(sentence.sid).text == sentence.text
+        with pytest.raises(KeyError):
+            _ = corpus.get_sentence("unknown")
+
+
+def test_index_file(corpus_path: Path, tmp_path: Path) -> None:
+    index_path = tmp_path / "corpus.knp.index"
+    with KNPCorpus(corpus_path, doc_id_format="kwdlc", index_path=index_path) as corpus:
+        documents, sentences = corpus.documents, corpus.sentences
+    assert index_path.exists()
+    with KNPCorpus(corpus_path, doc_id_format="kwdlc", index_path=index_path) as corpus:
+        assert corpus.documents == documents
+        assert corpus.sentences == sentences
+
+    # The index is rebuilt when the corpus is updated.
+    corpus_path.write_text(PATHS[0].read_text())
+    with KNPCorpus(corpus_path, doc_id_format="kwdlc", index_path=index_path) as corpus:
+        assert corpus.doc_ids == [PATHS[0].stem]
+
+
+def test_blank_lines_and_no_sid(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.knp"
+    path.write_text(
+        textwrap.dedent(
+            """\
+            # S-ID:1-1
+            EOS
+
+            # S-ID:1-2
+            EOS
+            # test
+            EOS
+            # S-ID:2-1
+            """
+        )
+    )
+    with KNPCorpus(path) as corpus:
+        assert len(corpus) == 3
+        assert [doc_id for doc_id, _, _ in corpus.documents] == ["1", None, "2"]
+        assert corpus.sids == ["1-1", "1-2", "2-1"]
+        assert corpus.get_document_knp("1") == "# S-ID:1-1\nEOS\n\n# S-ID:1-2\nEOS\n"
+        assert corpus.get_sentence_knp("2-1") == "# S-ID:2-1\n"
+        assert corpus[1].sentences[0].misc_comment == "test"
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    path = tmp_path / "corpus.knp"
+    path.write_text("")
+    with KNPCorpus(path) as corpus:
+        assert len(corpus) == 0
+        assert corpus.sids == []
@@ -1,10 +1,14 @@
+import os
+import re
 import textwrap
 from io import StringIO
+from pathlib import Path
 from typing import Any
 
 import pytest
 
-from rhoknp.utils.reader import chunk_by_document, chunk_by_sentence
+from rhoknp import Document
+from rhoknp.utils.reader import chunk_by_document, chunk_by_sentence, load_documents
 
 CASES = [
     {
@@ -192,3 +196,47 @@ def test_chunk_by_document_value_error() -> None:
 def test_chunk_by_document_type_error() -> None:
     with pytest.raises(TypeError):
         _ = list(chunk_by_document(StringIO(""), doc_id_format=1))  # type: ignore
+
+
+@pytest.mark.parametrize("chunksize", [1, 2])
+def test_load_documents(chunksize: int) -> None:
+    with Path("tests/data/w201106-0000060050.knp").open() as f:
+        knp_texts = list(chunk_by_document(f))
+    paths = sorted(Path("tests/data").glob("w2011*.knp"))
+    sources: list[str | Path] = [*knp_texts, *paths]
+    documents = list(load_documents(sources, max_workers=2, chunksize=chunksize))
+    expected = [Document.from_knp(knp_text) for knp_text in knp_texts]
+    expected += [Document.from_knp(path.read_text()) for path in paths]
+    assert [document.to_knp() for document in documents] == [document.to_knp() for document in expected]
+
+
+def test_load_documents_unordered() -> None:
+    paths = sorted(Path("tests/data").glob("*.knp")) * 3
+    documents = list(load_documents(paths, max_workers=2, ordered=False))
+    assert sorted(document.to_knp() for document in documents) == sorted(path.read_text() for path in paths)
+
+
+class _PathLike(os.PathLike):
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __fspath__(self) -> str:
+        return self.path
+
+
+def test_load_documents_path_like() -> None:
+    path = "tests/data/w201106-0000060050.knp"
+    documents = list(load_documents([_PathLike(path)], max_workers=1))
+    assert [document.to_knp() for document in documents] == [Path(path).read_text()]
+
+
+def test_load_documents_str_path() -> None:
+    # A str is read as KNP text, not as the path of a file.
+    path = "tests/data/w201106-0000060050.knp"
+    with pytest.raises(ValueError, match=f"malformed line: {re.escape(path)}"):
+        _ = list(load_documents([path], max_workers=1))
+
+
+def test_load_documents_value_error() -> None:
+    with pytest.raises(ValueError, match="chunksize must be positive: 0"):
+        _ = list(load_documents([], chunksize=0))
@@ -0,0 +1,71 @@
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from rhoknp import Document, Sentence
+from rhoknp.utils.table import MorphemeTable
+
+JUMANPP = textwrap.dedent(
+    """\
+    # S-ID:1
+    天気 てんき 天気 名詞 6 普通名詞 1 * 0 * 0
+    が が が 助詞 9 格助詞 1 * 0 * 0
+    良い よい 良い 形容詞 3 * 0 イ形容詞アウオ段 18 基本形 2
+    EOS
+    # S-ID:2
+    散歩 さんぽ 散歩 名詞 6 サ変名詞 2 * 0 * 0
+    した した する 動詞 2 * 0 サ変動詞 16 タ形 10
+    EOS
+    """
+)
+
+
+@pytest.mark.parametrize("path", sorted(Path("tests/data").glob("*.knp")))
+def test_document_morpheme_table(path: Path) -> None:
+    document = Document.from_knp(path.read_text())
+    table = document.morpheme_table()
+    assert len(table) == len(document.morphemes)
+    for i, morpheme in enumerate(document.morphemes):
+        assert table.surfs[i] == morpheme.surf
+        assert table.readings[i] == morpheme.reading
+        assert table.lemmas[i] == morpheme.lemma
+        assert table.pos_ids[i] == morpheme.pos_id
+        assert table.subpos_ids[i] == morpheme.subpos_id
+        assert table.conjtype_ids[i] == morpheme.conjtype_id
+        assert table.conjform_ids[i] == morpheme.conjform_id
+        assert table.base_phrase_indices[i] == morpheme.base_phrase.global_index
+        assert table.sentence_indices[i] == morpheme.sentence.index
+        assert (table.starts[i], table.ends[i]) == morpheme.global_span
+
+
+def test_sentence_morpheme_table() -> None:
+    document = Document.from_knp(Path("tests/data/w201106-0000060050.knp").read_text())
+    sentence = document.sentences[1]
+    table = sentence.morpheme_table()
+    assert list(table.base_phrase_indices) == [morpheme.base_phrase.index for morpheme in sentence.morphemes]
+    assert list(zip(table.starts, table.ends, strict=True)) == [morpheme.span for morpheme in sentence.morphemes]
+    assert set(table.sentence_indices) == {1}
+
+
+def test_morpheme_table_jumanpp() -> None:
+    document = Document.from_jumanpp(JUMANPP)
+    table = document.morpheme_table()
+    assert table.surfs == ["天気", "が", "良い", "散歩", "した"]
+    assert list(table.pos_ids) == [6, 9, 3, 6, 2]
+    assert list(table.base_phrase_indices) == [-1] * 5
+    assert list(table.sentence_indices) == [0, 0, 0, 1, 1]
+    assert list(table.starts) == [0, 2, 3, 5, 7]
+    assert list(table.ends) == [2, 3, 5, 7, 9]
+
+
+def test_morpheme_table_raw_text() -> None:
+    sentence = Sentence.from_raw_text("天気が良い")
+    with pytest.raises(AttributeError):
+        _ = sentence.morpheme_table()
+
+
+def test_morpheme_table_buffer() -> None:
+    table = MorphemeTable.from_sentences(Document.from_jumanpp(JUMANPP).sentences)
+    # Integer columns expose the buffer protocol, so they can be viewed as NumPy arrays without copying.
+    assert memoryview(table.pos_ids).tolist() == [6, 9, 3, 6, 2]